@@ -1,8 +1,6 @@
 """
 Setup script for backward compatibility and post-install hooks
 """
-import os
-import sys
 from setuptools import setup
 from setuptools.command.install import install
 
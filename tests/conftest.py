@@ -4,15 +4,18 @@ Pytest Configuration
 
 import pytest
 import asyncio
-from unittest.mock import Mock
+from unittest.mock import Mock, AsyncMock
 
+from tgcaller.types import CallUpdate, CallStatus, MediaStream
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests"""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+# Run async tests on uvloop where available; pytest-asyncio builds its
+# session loop from the active policy
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 @pytest.fixture
@@ -20,6 +23,20 @@ def mock_pyrogram_client():
     """Mock Pyrogram client"""
     client = Mock()
     client.is_connected = False
-    client.start = Mock(return_value=asyncio.coroutine(lambda: None)())
-    client.stop = Mock(return_value=asyncio.coroutine(lambda: None)())
-    return client
\ No newline at end of file
+    client.start = AsyncMock(return_value=None)
+    client.stop = AsyncMock(return_value=None)
+    return client
+
+
+@pytest.fixture
+def make_update():
+    """Factory building a fresh CallUpdate per call"""
+    def _make_update(chat_id: int, status: CallStatus) -> CallUpdate:
+        return CallUpdate(chat_id=chat_id, status=status)
+    return _make_update
+
+
+@pytest.fixture(scope="module")
+def sample_stream():
+    """Shared audio MediaStream"""
+    return MediaStream("test.mp3")
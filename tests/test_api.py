@@ -3,99 +3,125 @@ Test Custom API System
 """
 
 import pytest
-import asyncio
-import json
-from unittest.mock import Mock, AsyncMock
-from aiohttp import web
-from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
+import pytest_asyncio
+from unittest.mock import Mock
+from aiohttp.test_utils import TestServer, TestClient
 
 from tgcaller.api import CustomAPIServer
 
 
-class TestCustomAPIServer(AioHTTPTestCase):
+@pytest.fixture(scope="module")
+def api_server():
+    """Create API server once per module"""
+    # Mock caller
+    mock_caller = Mock()
+    mock_caller.client = Mock()
+    mock_caller.is_running = True
+
+    return CustomAPIServer(mock_caller, "localhost", 8080)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client(api_server):
+    """Serve the API application once per module"""
+    client = TestClient(TestServer(api_server.app))
+    await client.start_server()
+    yield client
+    await client.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_handler(api_server):
+    """Reset per-test state without rebuilding the router"""
+    api_server.set_custom_handler(None)
+
+
+class TestCustomAPIServer:
     """Test Custom API Server"""
-    
-    async def get_application(self):
-        """Create test application"""
-        # Mock caller
-        self.mock_caller = Mock()
-        self.mock_caller.client = Mock()
-        self.mock_caller.is_running = True
-        
-        # Create API server
-        self.api_server = CustomAPIServer(self.mock_caller, "localhost", 8080)
-        return self.api_server.app
-    
-    @unittest_run_loop
-    async def test_health_check(self):
+
+    async def test_health_check(self, client):
         """Test health check endpoint"""
-        resp = await self.client.request("GET", "/health")
-        self.assertEqual(resp.status, 200)
-        
+        resp = await client.request("GET", "/health")
+        assert resp.status == 200
+
         data = await resp.json()
-        self.assertEqual(data["status"], "healthy")
-        self.assertEqual(data["service"], "TgCaller Custom API")
-        self.assertTrue(data["caller_running"])
-    
-    @unittest_run_loop
-    async def test_no_handler_error(self):
+        assert data["status"] == "healthy"
+        assert data["service"] == "TgCaller Custom API"
+        assert data["caller_running"] is True
+
+    async def test_no_handler_error(self, client):
         """Test error when no handler is registered"""
-        resp = await self.client.request("POST", "/", json={"test": "data"})
-        self.assertEqual(resp.status, 400)
-        
+        resp = await client.request("POST", "/", json={"test": "data"})
+        assert resp.status == 400
+
         data = await resp.json()
-        self.assertEqual(data["error"], "NO_CUSTOM_API_DECORATOR")
-    
-    @unittest_run_loop
-    async def test_invalid_json_error(self):
+        assert data["error"] == "NO_CUSTOM_API_DECORATOR"
+
+    async def test_invalid_json_error(self, client, api_server):
         """Test error for invalid JSON"""
-        resp = await self.client.request("POST", "/", data="invalid json")
-        self.assertEqual(resp.status, 400)
-        
+        async def test_handler(client, data):
+            return data
+
+        api_server.set_custom_handler(test_handler)
+
+        resp = await client.request("POST", "/", data="invalid json")
+        assert resp.status == 400
+
         data = await resp.json()
-        self.assertEqual(data["error"], "INVALID_JSON_FORMAT_REQUEST")
-    
-    @unittest_run_loop
-    async def test_custom_handler(self):
+        assert data["error"] == "INVALID_JSON_FORMAT_REQUEST"
+
+    async def test_custom_handler(self, client, api_server):
         """Test custom handler execution"""
         # Register handler
         async def test_handler(client, data):
             return {"message": "success", "received": data}
-        
-        self.api_server.set_custom_handler(test_handler)
-        
+
+        api_server.set_custom_handler(test_handler)
+
         # Test request
         test_data = {"action": "test", "value": 123}
-        resp = await self.client.request("POST", "/", json=test_data)
-        self.assertEqual(resp.status, 200)
-        
+        resp = await client.request("POST", "/", json=test_data)
+        assert resp.status == 200
+
         data = await resp.json()
-        self.assertEqual(data["message"], "success")
-        self.assertEqual(data["received"], test_data)
-    
-    @unittest_run_loop
-    async def test_handler_error(self):
+        assert data["message"] == "success"
+        assert data["received"] == test_data
+
+    async def test_custom_handler_wide_result(self, client, api_server):
+        """Test results orjson cannot encode fall back to stdlib json"""
+        async def wide_handler(client, data):
+            return {"big": 2 ** 70, 1: "int key"}
+
+        api_server.set_custom_handler(wide_handler)
+
+        resp = await client.request("POST", "/", json={})
+        assert resp.status == 200
+
+        data = await resp.json()
+        assert data["big"] == 2 ** 70
+        assert data["1"] == "int key"
+
+    async def test_handler_error(self, client, api_server):
         """Test handler error handling"""
         # Register handler that raises error
         async def error_handler(client, data):
             raise ValueError("Test error")
-        
-        self.api_server.set_custom_handler(error_handler)
-        
+
+        api_server.set_custom_handler(error_handler)
+
         # Test request
-        resp = await self.client.request("POST", "/", json={"test": "data"})
-        self.assertEqual(resp.status, 500)
-        
+        resp = await client.request("POST", "/", json={"test": "data"})
+        assert resp.status == 500
+
         data = await resp.json()
-        self.assertEqual(data["error"], "HANDLER_ERROR")
-        self.assertIn("Test error", data["message"])
-    
-    @unittest_run_loop
-    async def test_options_request(self):
+        assert data["error"] == "HANDLER_ERROR"
+        assert "Test error" in data["message"]
+
+    async def test_options_request(self, client):
         """Test CORS preflight request"""
-        resp = await self.client.request("OPTIONS", "/")
-        self.assertEqual(resp.status, 200)
-        
+        resp = await client.request("OPTIONS", "/")
+        assert resp.status == 200
+
         headers = resp.headers
-        self.assertEqual(headers["Access-Control-Allow-Origin"], "*")
-        self.assertIn("POST", headers["Access-Control-Allow-Methods"])
\ No newline at end of file
+        assert headers["Access-Control-Allow-Origin"] == "*"
+        assert "POST" in headers["Access-Control-Allow-Methods"]
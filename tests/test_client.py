@@ -4,48 +4,44 @@ Test TgCaller Client
 
 import pytest
 import asyncio
-import tempfile
-import os
-from unittest.mock import Mock, AsyncMock
-import pyrogram  # <-- Add this import
+import subprocess
+import sys
+from unittest.mock import AsyncMock
+import pyrogram
 
 from tgcaller import TgCaller
 from tgcaller.types import AudioConfig, VideoConfig, CallStatus
 
 
+class FakePyroClient(pyrogram.Client):
+    """Lightweight Pyrogram client stand-in (no spec introspection)"""
+    
+    def __init__(self):
+        self.is_connected = False
+        self.start = AsyncMock()
+        self.stop = AsyncMock()
+
+
 class TestTgCaller:
     """Test TgCaller main client"""
     
     @pytest.fixture
     def mock_client(self):
         """Create mock Pyrogram client"""
-        client = Mock(spec=pyrogram.Client)  # <-- Use spec
-        client.is_connected = False
-        client.start = AsyncMock()
-        client.stop = AsyncMock()
-        return client
+        return FakePyroClient()
     
     @pytest.fixture
     def caller(self, mock_client):
         """Create TgCaller instance"""
         return TgCaller(mock_client)
     
-    @pytest.fixture
-    def temp_audio_file(self):
+    @pytest.fixture(scope="session")
+    def temp_audio_file(self, tmp_path_factory):
         """Create temporary audio file for testing"""
-        # Create a temporary file with .mp3 extension
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-            # Write some dummy content to make it a valid file
-            temp_file.write(b'dummy audio content')
-            temp_file_path = temp_file.name
-        
-        yield temp_file_path
-        
-        # Cleanup after test
-        try:
-            os.unlink(temp_file_path)
-        except FileNotFoundError:
-            pass
+        # Write some dummy content to make it a valid file
+        path = tmp_path_factory.mktemp("audio") / "test.mp3"
+        path.write_bytes(b'dummy audio content')
+        return str(path)
     
     @pytest.mark.asyncio
     async def test_start_stop(self, caller, mock_client):
@@ -145,4 +141,20 @@ class TestTgCaller:
             pass
         
         assert len(caller._event_handlers['stream_end']) == 1
-        assert len(caller._event_handlers['error']) == 1
\ No newline at end of file
+        assert len(caller._event_handlers['error']) == 1
+    
+    def test_import_defers_optional_subsystems(self):
+        """Test importing tgcaller loads neither the API server nor devices"""
+        # A fresh interpreter, as this session has imported them already
+        code = (
+            "import sys, tgcaller; "
+            "print([m for m in ('tgcaller.api', 'tgcaller.devices') if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        
+        assert result.stdout.strip() == "[]"
@@ -16,6 +16,12 @@ from tgcaller.handlers.event_system import (
 from tgcaller.types import CallUpdate, CallStatus
 
 
+_CONNECTED = CallStatus.CONNECTED
+_PLAYING = CallStatus.PLAYING
+_CHAT_A = -1001234567890
+_CHAT_B = -1009876543210
+
+
 class TestEventHandlerSystem:
     """Test Event Handler System"""
     
@@ -28,8 +34,8 @@ class TestEventHandlerSystem:
     def mock_update(self):
         """Create mock update"""
         return CallUpdate(
-            chat_id=-1001234567890,
-            status=CallStatus.CONNECTED,
+            chat_id=_CHAT_A,
+            status=_CONNECTED,
             message="Test update"
         )
     
@@ -119,7 +125,28 @@ class TestEventHandlerSystem:
         assert called is True
     
     @pytest.mark.asyncio
-    async def test_filter_chat_id(self, event_system, mock_client):
+    async def test_propagate_handler_error_isolated(self, event_system, mock_update, mock_client):
+        """Test failing handler does not stop the others"""
+        called = []
+        
+        async def failing_handler(client, update):
+            raise ValueError("boom")
+        
+        async def async_handler(client, update):
+            called.append("async")
+        
+        def sync_handler(client, update):
+            called.append("sync")
+        
+        event_system.add_handler(failing_handler, priority=10)
+        event_system.add_handler(async_handler, priority=5)
+        event_system.add_handler(sync_handler, priority=1)
+        await event_system._propagate(mock_update, mock_client)
+        
+        assert sorted(called) == ["async", "sync"]
+    
+    @pytest.mark.asyncio
+    async def test_filter_chat_id(self, event_system, mock_client, make_update):
         """Test chat ID filter"""
         called = False
         
@@ -128,22 +155,22 @@ class TestEventHandlerSystem:
             called = True
         
         # Add handler with chat filter
-        chat_filter = Filters.chat_id(-1001234567890)
+        chat_filter = Filters.chat_id(_CHAT_A)
         event_system.add_handler(filtered_handler, filters=chat_filter)
         
         # Test with matching chat ID
-        update1 = CallUpdate(chat_id=-1001234567890, status=CallStatus.CONNECTED)
+        update1 = make_update(_CHAT_A, _CONNECTED)
         await event_system._propagate(update1, mock_client)
         assert called is True
         
         # Reset and test with non-matching chat ID
         called = False
-        update2 = CallUpdate(chat_id=-1009876543210, status=CallStatus.CONNECTED)
+        update2 = make_update(_CHAT_B, _CONNECTED)
         await event_system._propagate(update2, mock_client)
         assert called is False
     
     @pytest.mark.asyncio
-    async def test_filter_status(self, event_system, mock_client):
+    async def test_filter_status(self, event_system, mock_client, make_update):
         """Test status filter"""
         called = False
         
@@ -156,18 +183,18 @@ class TestEventHandlerSystem:
         event_system.add_handler(status_handler, filters=status_filter)
         
         # Test with matching status
-        update1 = CallUpdate(chat_id=-1001234567890, status=CallStatus.PLAYING)
+        update1 = make_update(_CHAT_A, _PLAYING)
         await event_system._propagate(update1, mock_client)
         assert called is True
         
         # Reset and test with non-matching status
         called = False
-        update2 = CallUpdate(chat_id=-1001234567890, status=CallStatus.CONNECTED)
+        update2 = make_update(_CHAT_A, _CONNECTED)
         await event_system._propagate(update2, mock_client)
         assert called is False
     
     @pytest.mark.asyncio
-    async def test_and_filter(self, event_system, mock_client):
+    async def test_and_filter(self, event_system, mock_client, make_update):
         """Test AND filter combination"""
         called = False
         
@@ -177,24 +204,24 @@ class TestEventHandlerSystem:
         
         # Add handler with AND filter
         combined_filter = and_filter(
-            Filters.chat_id(-1001234567890),
+            Filters.chat_id(_CHAT_A),
             Filters.status("connected")
         )
         event_system.add_handler(and_handler, filters=combined_filter)
         
         # Test with both conditions true
-        update1 = CallUpdate(chat_id=-1001234567890, status=CallStatus.CONNECTED)
+        update1 = make_update(_CHAT_A, _CONNECTED)
         await event_system._propagate(update1, mock_client)
         assert called is True
         
         # Reset and test with one condition false
         called = False
-        update2 = CallUpdate(chat_id=-1001234567890, status=CallStatus.PLAYING)
+        update2 = make_update(_CHAT_A, _PLAYING)
         await event_system._propagate(update2, mock_client)
         assert called is False
     
     @pytest.mark.asyncio
-    async def test_or_filter(self, event_system, mock_client):
+    async def test_or_filter(self, event_system, mock_client, make_update):
         """Test OR filter combination"""
         called_count = 0
         
@@ -204,23 +231,23 @@ class TestEventHandlerSystem:
         
         # Add handler with OR filter
         combined_filter = or_filter(
-            Filters.chat_id(-1001234567890),
-            Filters.chat_id(-1009876543210)
+            Filters.chat_id(_CHAT_A),
+            Filters.chat_id(_CHAT_B)
         )
         event_system.add_handler(or_handler, filters=combined_filter)
         
         # Test with first condition true
-        update1 = CallUpdate(chat_id=-1001234567890, status=CallStatus.CONNECTED)
+        update1 = make_update(_CHAT_A, _CONNECTED)
         await event_system._propagate(update1, mock_client)
         assert called_count == 1
         
         # Test with second condition true
-        update2 = CallUpdate(chat_id=-1009876543210, status=CallStatus.CONNECTED)
+        update2 = make_update(_CHAT_B, _CONNECTED)
         await event_system._propagate(update2, mock_client)
         assert called_count == 2
         
         # Test with neither condition true
-        update3 = CallUpdate(chat_id=-1005566778899, status=CallStatus.CONNECTED)
+        update3 = make_update(-1005566778899, _CONNECTED)
         await event_system._propagate(update3, mock_client)
         assert called_count == 2  # Should not increment
     
@@ -4,10 +4,21 @@ Test Internal Systems
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import AsyncMock
 
 from tgcaller.internal import ConnectionManager, CacheManager, StreamHandler, CallHandler, RetryManager
-from tgcaller.types import CallUpdate, CallStatus, MediaStream, AudioConfig
+from tgcaller.types import CallUpdate, CallStatus, AudioConfig
+
+
+@dataclass
+class _FakeCaller:
+    """Plain stand-in for the TgCaller attributes internal managers use"""
+    _active_calls: dict = field(default_factory=dict)
+    _emit_event: Any = field(default_factory=AsyncMock)
+    _logger: Any = field(default_factory=lambda: logging.getLogger("test"))
 
 
 class TestConnectionManager:
@@ -15,11 +26,7 @@ class TestConnectionManager:
     
     @pytest.fixture
     def mock_caller(self):
-        caller = Mock()
-        caller._active_calls = {}
-        caller._emit_event = AsyncMock()
-        caller._logger = Mock()
-        return caller
+        return _FakeCaller()
     
     @pytest.fixture
     def connection_manager(self, mock_caller):
@@ -103,33 +110,28 @@ class TestStreamHandler:
     
     @pytest.fixture
     def mock_caller(self):
-        caller = Mock()
-        caller._emit_event = AsyncMock()
-        caller._logger = Mock()
-        return caller
+        return _FakeCaller()
     
     @pytest.fixture
     def stream_handler(self, mock_caller):
         return StreamHandler(mock_caller)
     
     @pytest.mark.asyncio
-    async def test_start_stream(self, stream_handler):
+    async def test_start_stream(self, stream_handler, sample_stream):
         """Test starting stream"""
         chat_id = -1001234567890
-        stream = MediaStream("test.mp3")
         
-        success = await stream_handler.start_stream(chat_id, stream)
+        success = await stream_handler.start_stream(chat_id, sample_stream)
         assert success is True
         assert stream_handler.is_streaming(chat_id) is True
     
     @pytest.mark.asyncio
-    async def test_stop_stream(self, stream_handler):
+    async def test_stop_stream(self, stream_handler, sample_stream):
         """Test stopping stream"""
         chat_id = -1001234567890
-        stream = MediaStream("test.mp3")
         
         # Start stream first
-        await stream_handler.start_stream(chat_id, stream)
+        await stream_handler.start_stream(chat_id, sample_stream)
         assert stream_handler.is_streaming(chat_id) is True
         
         # Stop stream
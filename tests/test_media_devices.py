@@ -11,6 +11,13 @@ from tgcaller.devices import MediaDevices, InputDevice, SpeakerDevice, CameraDev
 class TestMediaDevices:
     """Test Media Devices"""
     
+    @pytest.fixture(autouse=True)
+    def clear_device_cache(self):
+        """Keep cached enumerations from leaking across tests"""
+        MediaDevices.invalidate_cache()
+        yield
+        MediaDevices.invalidate_cache()
+    
     @patch('tgcaller.devices.media_devices.pyaudio')
     def test_microphone_devices_success(self, mock_pyaudio):
         """Test successful microphone detection"""
@@ -59,17 +66,23 @@ class TestMediaDevices:
         devices = MediaDevices.microphone_devices()
         assert devices == []
     
+    @patch('tgcaller.devices.media_devices.probe_v4l2', return_value=None)
     @patch('tgcaller.devices.media_devices.cv2')
-    def test_camera_devices_success(self, mock_cv2):
+    def test_camera_devices_success(self, mock_cv2, mock_probe_v4l2):
         """Test successful camera detection"""
-        # Mock camera capture
-        mock_cap = Mock()
-        mock_cv2.VideoCapture.return_value = mock_cap
-        
-        # First camera exists, second doesn't
-        mock_cap.isOpened.side_effect = [True, False] + [False] * 8
-        mock_cap.get.side_effect = [1920, 1080, 30.0]  # width, height, fps
-        mock_cap.getBackendName.return_value = "DirectShow"
+        # Mock camera captures: first camera exists, the rest don't
+        properties = {
+            mock_cv2.CAP_PROP_FRAME_WIDTH: 1920,
+            mock_cv2.CAP_PROP_FRAME_HEIGHT: 1080,
+            mock_cv2.CAP_PROP_FPS: 30.0,
+            mock_cv2.CAP_PROP_FOURCC: 0,
+        }
+        captures = [Mock() for _ in range(MediaDevices.MAX_CAMERA_INDEX)]
+        for index, cap in enumerate(captures):
+            cap.isOpened.return_value = index == 0
+            cap.get.side_effect = lambda prop: properties.get(prop, 0.0)
+            cap.getBackendName.return_value = "DirectShow"
+        mock_cv2.VideoCapture.side_effect = lambda index: captures[index]
         
         # Test
         devices = MediaDevices.camera_devices()
@@ -81,6 +94,38 @@ class TestMediaDevices:
         assert devices[0].height == 1080
         assert devices[0].fps == 30.0
         assert devices[0].is_default is True
+        assert all(cap.release.called for cap in captures)
+    
+    @patch('tgcaller.devices.media_devices.probe_v4l2', return_value=None)
+    @patch('tgcaller.devices.media_devices.cv2')
+    def test_camera_devices_probe_error(self, mock_cv2, mock_probe_v4l2):
+        """Test a failing camera index does not drop the others"""
+        captures = [Mock() for _ in range(MediaDevices.MAX_CAMERA_INDEX)]
+        for index, cap in enumerate(captures):
+            cap.isOpened.return_value = index in (0, 2)
+            cap.get.return_value = 0.0
+        captures[1].isOpened.side_effect = RuntimeError("driver error")
+        mock_cv2.VideoCapture.side_effect = lambda index: captures[index]
+        
+        devices = MediaDevices.camera_devices()
+        
+        assert [device.index for device in devices] == [0, 2]
+    
+    @patch('tgcaller.devices.media_devices.probe_v4l2')
+    @patch('tgcaller.devices.media_devices.cv2')
+    def test_camera_devices_v4l2(self, mock_cv2, mock_probe_v4l2):
+        """Test V4L2 enumeration skips opening captures"""
+        mock_probe_v4l2.return_value = [
+            (2, 'USB Camera', {'backend': 'V4L2', 'path': '/dev/video2'})
+        ]
+        
+        devices = MediaDevices.camera_devices()
+        
+        assert len(devices) == 1
+        assert devices[0].index == 2
+        assert devices[0].name == 'USB Camera'
+        assert devices[0].is_default is True
+        mock_cv2.VideoCapture.assert_not_called()
     
     @patch('tgcaller.devices.media_devices.cv2', None)
     def test_camera_devices_no_opencv(self):
@@ -156,6 +201,42 @@ class TestMediaDevices:
         assert default_mic.name == 'Mic 2'
         assert default_mic.is_default is True
     
+    @patch('tgcaller.devices.media_devices.pyaudio')
+    def test_pyaudio_instance_shared(self, mock_pyaudio):
+        """Test audio enumerations share one PyAudio until invalidated"""
+        mock_pa = mock_pyaudio.PyAudio.return_value
+        mock_pa.get_device_count.return_value = 0
+        
+        MediaDevices.microphone_devices()
+        MediaDevices.speaker_devices()
+        assert mock_pyaudio.PyAudio.call_count == 1
+        mock_pa.terminate.assert_not_called()
+        
+        MediaDevices.invalidate_cache("microphone")
+        mock_pa.terminate.assert_called_once()
+        MediaDevices.microphone_devices()
+        assert mock_pyaudio.PyAudio.call_count == 2
+    
+    @patch('tgcaller.devices.media_devices.mss')
+    def test_screen_devices_cached(self, mock_mss_module):
+        """Test enumeration is reused until the cache is invalidated"""
+        mock_mss = Mock()
+        mock_mss_module.mss.return_value.__enter__.return_value = mock_mss
+        mock_mss.monitors = [
+            {'left': 0, 'top': 0, 'width': 0, 'height': 0},
+            {'left': 0, 'top': 0, 'width': 1920, 'height': 1080}
+        ]
+        
+        first = MediaDevices.screen_devices()
+        second = MediaDevices.screen_devices()
+        
+        assert first == second
+        assert mock_mss_module.mss.call_count == 1
+        
+        MediaDevices.invalidate_cache("screen")
+        MediaDevices.screen_devices()
+        assert mock_mss_module.mss.call_count == 2
+    
     def test_device_info_properties(self):
         """Test device info properties"""
         # Test InputDevice
@@ -189,4 +270,14 @@ class TestMediaDevices:
             y=0,
             metadata={}
         )
-        assert screen_device.is_video is True
\ No newline at end of file
+        assert screen_device.is_video is True
+    
+    def test_device_info_immutable(self):
+        """Test devices are frozen and hashable"""
+        camera_device = CameraDevice(index=0, name="Test Camera", metadata={'backend': 'V4L2'})
+        
+        with pytest.raises(AttributeError):
+            camera_device.name = "Renamed"
+        
+        duplicate = CameraDevice(index=0, name="Test Camera", metadata={'backend': 'V4L2'})
+        assert len({camera_device, duplicate}) == 1
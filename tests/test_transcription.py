@@ -0,0 +1,122 @@
+"""
+Test Whisper Transcription Windows
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tgcaller.advanced import transcription
+from tgcaller.advanced.transcription import WhisperTranscription
+
+
+def _segment(text: str, start: float, end: float) -> dict:
+    """Whisper-style segment with times in seconds from the window start"""
+    return {'text': f" {text}", 'start': start, 'end': end, 'avg_logprob': -0.2}
+
+
+class TestWhisperTranscription:
+    """Test the audio ring and LocalAgreement commits"""
+    
+    @pytest.fixture
+    def transcriber(self, monkeypatch):
+        """Transcriber on a stub model, without VAD"""
+        monkeypatch.setattr(transcription, 'FasterWhisperModel', object)
+        transcriber = WhisperTranscription(device="cpu", model=object(), vad_aggressiveness=None)
+        transcriber.is_transcribing = True
+        return transcriber
+    
+    @pytest.fixture
+    def results(self, transcriber):
+        """Results passed to callbacks"""
+        results = []
+        transcriber.add_callback(results.append)
+        return results
+    
+    @staticmethod
+    def add_seconds(transcriber, seconds: float):
+        """Feed seconds of 16 kHz audio"""
+        samples = int(seconds * transcriber.sample_rate)
+        transcriber.add_audio_data(np.full(samples, 0.5, dtype=np.float32))
+    
+    @staticmethod
+    def run_window(transcriber, segments):
+        """Transcribe the due window with the model returning segments"""
+        window = transcriber._next_window()
+        assert window is not None
+        audio, position = window
+        
+        def run_model(audio, initial_prompt=None):
+            return {
+                'text': ''.join(segment['text'] for segment in segments),
+                'language': 'en',
+                'segments': segments
+            }
+        
+        transcriber._run_model = run_model
+        transcriber._finish_window(transcriber._transcribe_chunk(audio), position)
+    
+    def test_agreeing_windows_commit(self, transcriber, results):
+        """Test the prefix two windows share is committed and its audio dropped"""
+        self.add_seconds(transcriber, 2.0)
+        self.run_window(transcriber, [_segment("hello", 0.0, 1.0), _segment("wor", 1.0, 2.0)])
+        assert results == []
+        
+        self.add_seconds(transcriber, 1.0)
+        self.run_window(transcriber, [_segment("hello", 0.0, 1.0), _segment("world", 1.0, 3.0)])
+        
+        assert [result['text'] for result in results] == [" hello"]
+        assert transcriber._committed_text == " hello"
+        assert transcriber._hypothesis == ["world"]
+        # The committed second is dropped; the next window starts after it
+        audio, position = transcriber._buffered_audio()
+        assert position == transcriber.sample_rate
+        assert len(audio) == 2 * transcriber.sample_rate
+    
+    def test_disagreeing_window_commits_nothing(self, transcriber, results):
+        """Test windows that differ from the first segment on commit nothing"""
+        self.add_seconds(transcriber, 2.0)
+        self.run_window(transcriber, [_segment("hello", 0.0, 2.0)])
+        
+        self.add_seconds(transcriber, 1.0)
+        self.run_window(transcriber, [_segment("yellow", 0.0, 3.0)])
+        
+        assert results == []
+        assert transcriber._committed_text == ""
+        assert transcriber._hypothesis == ["yellow"]
+        assert transcriber._filled == 3 * transcriber.sample_rate
+    
+    def test_near_full_ring_force_commits(self, transcriber, results):
+        """Test a window close to filling the ring is committed unconfirmed"""
+        self.add_seconds(transcriber, 4.0)
+        self.run_window(transcriber, [_segment("one", 0.0, 2.0), _segment("two", 2.0, 4.0)])
+        
+        assert [result['text'] for result in results] == [" one two"]
+        assert transcriber._hypothesis == []
+        assert transcriber._filled == 0
+    
+    def test_partial_ingest_flushed_for_window(self, transcriber):
+        """Test writes still batched are buffered when the next window is taken"""
+        for _ in range(15):
+            transcriber.add_audio_data(np.full(1100, 0.5, dtype=np.float32))
+        
+        assert transcriber._filled < 16500
+        assert transcriber._next_window() is not None
+        assert transcriber._filled == 16500
+    
+    def test_wrapped_ring_reads_in_order(self, transcriber):
+        """Test audio wrapped around the ring is read back oldest first"""
+        capacity = transcriber._ring.shape[0]
+        stream = np.arange(capacity + capacity // 2, dtype=np.float32)
+        
+        transcriber._append_samples(stream[:capacity * 3 // 4])
+        transcriber._append_samples(stream[capacity * 3 // 4:])
+        
+        audio, position = transcriber._buffered_audio()
+        assert position == capacity // 2
+        np.testing.assert_array_equal(audio, stream[capacity // 2:])
+        
+        transcriber._drop_until(capacity)
+        audio, position = transcriber._buffered_audio()
+        assert position == capacity
+        np.testing.assert_array_equal(audio, stream[capacity:])
@@ -0,0 +1,134 @@
+"""
+Test YouTube Downloader Pool and Caches
+"""
+
+import pytest
+from collections import OrderedDict
+from contextlib import ExitStack
+from types import SimpleNamespace
+
+from tgcaller.advanced import youtube_dl
+from tgcaller.advanced.youtube_dl import YouTubeDownloader
+
+
+class TestYouTubeDownloader:
+    """Test YoutubeDL pooling and metadata caches"""
+    
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        """Keep cached metadata from leaking across tests"""
+        YouTubeDownloader._info_cache.clear()
+        YouTubeDownloader._stream_url_cache.clear()
+        yield
+        YouTubeDownloader._info_cache.clear()
+        YouTubeDownloader._stream_url_cache.clear()
+    
+    @pytest.fixture
+    def created(self, monkeypatch):
+        """YoutubeDL instances built by the downloader"""
+        created = []
+        
+        class FakeYoutubeDL:
+            def __init__(self, params):
+                self.params = params
+                self.closed = False
+                created.append(self)
+            
+            def extract_info(self, url, download=False):
+                return {'title': url}
+            
+            def close(self):
+                self.closed = True
+        
+        monkeypatch.setattr(youtube_dl, 'yt_dlp', SimpleNamespace(YoutubeDL=FakeYoutubeDL))
+        return created
+    
+    @pytest.fixture
+    def downloader(self, created):
+        """Downloader building fake YoutubeDL instances"""
+        return YouTubeDownloader()
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Controllable monotonic clock for the caches"""
+        clock = SimpleNamespace(now=1000.0)
+        monkeypatch.setattr(youtube_dl, 'time', SimpleNamespace(monotonic=lambda: clock.now))
+        return clock
+    
+    def test_pool_reuses_instance_per_option_set(self, downloader, created):
+        """Test each option set reuses its idle instance"""
+        downloader._extract_info({'format': 'best'}, 'a')
+        downloader._extract_info({'format': 'best'}, 'b')
+        assert len(created) == 1
+        
+        downloader._extract_info({'format': 'bestaudio'}, 'a')
+        assert len(created) == 2
+        assert not any(ydl.closed for ydl in created)
+    
+    def test_pool_closes_surplus_idle(self, downloader, created):
+        """Test instances beyond POOL_IDLE per option set are closed on return"""
+        with ExitStack() as stack:
+            for _ in range(downloader.POOL_IDLE + 1):
+                stack.enter_context(downloader._borrow_ydl({'format': 'best'}))
+        
+        assert len(created) == downloader.POOL_IDLE + 1
+        assert sum(ydl.closed for ydl in created) == 1
+    
+    def test_pool_evicts_least_recent_option_set(self, downloader, created, monkeypatch):
+        """Test idle instances of the least recently used option set are closed"""
+        monkeypatch.setattr(YouTubeDownloader, 'POOL_OPTION_SETS', 2)
+        
+        for n in range(3):
+            downloader._extract_info({'n': n}, 'a')
+        
+        assert [ydl.closed for ydl in created] == [True, False, False]
+        
+        downloader._extract_info({'n': 1}, 'a')
+        assert len(created) == 3
+    
+    def test_close_closes_idle_instances(self, downloader, created):
+        """Test close() closes every pooled instance"""
+        downloader._extract_info({'n': 0}, 'a')
+        downloader._extract_info({'n': 1}, 'a')
+        
+        downloader.close()
+        
+        assert all(ydl.closed for ydl in created)
+        downloader._extract_info({'n': 0}, 'a')
+        assert len(created) == 3
+    
+    def test_cache_ttl_expiry(self, clock):
+        """Test entries expire after their TTL"""
+        cache = OrderedDict()
+        YouTubeDownloader._cache_set(cache, 'url', 'info', 10.0)
+        
+        clock.now += 9.0
+        assert YouTubeDownloader._cache_get(cache, 'url') == 'info'
+        
+        clock.now += 1.0
+        assert YouTubeDownloader._cache_get(cache, 'url') is None
+        assert 'url' not in cache
+    
+    def test_cache_lru_eviction(self, clock, monkeypatch):
+        """Test the least recently used entry is evicted past CACHE_SIZE"""
+        monkeypatch.setattr(YouTubeDownloader, 'CACHE_SIZE', 2)
+        cache = OrderedDict()
+        
+        YouTubeDownloader._cache_set(cache, 'a', 1, 60.0)
+        YouTubeDownloader._cache_set(cache, 'b', 2, 60.0)
+        assert YouTubeDownloader._cache_get(cache, 'a') == 1
+        YouTubeDownloader._cache_set(cache, 'c', 3, 60.0)
+        
+        assert list(cache) == ['a', 'c']
+    
+    def test_invalidate(self, clock):
+        """Test invalidate drops the info and every stream URL of one video"""
+        YouTubeDownloader._cache_set(YouTubeDownloader._info_cache, 'a', {}, 60.0)
+        YouTubeDownloader._cache_set(YouTubeDownloader._stream_url_cache, ('a', 'best'), 'x', 60.0)
+        YouTubeDownloader._cache_set(YouTubeDownloader._stream_url_cache, ('a', 'bestaudio'), 'y', 60.0)
+        YouTubeDownloader._cache_set(YouTubeDownloader._stream_url_cache, ('b', 'best'), 'z', 60.0)
+        
+        YouTubeDownloader.invalidate('a')
+        
+        assert 'a' not in YouTubeDownloader._info_cache
+        assert list(YouTubeDownloader._stream_url_cache) == [('b', 'best')]
@@ -48,30 +48,39 @@ from .exceptions import (
     StreamError,
     ConfigurationError,
 )
-from .api import CustomAPIServer, on_custom_update
-from .devices import MediaDevices, DeviceInfo, InputDevice, SpeakerDevice, CameraDevice, ScreenDevice
+
 from .handlers.event_system import Filters, BaseFilter, and_filter, or_filter
-from .utilities import CpuMonitor, PingMonitor, CallHolder, PeerResolver
-from .internal import ConnectionManager, CacheManager, StreamHandler, CallHandler, RetryManager
-from . import streaming
+from .internal import (
+    ConnectionManager,
+    CacheManager,
+    StreamHandler,
+    CallHandler,
+    RetryManager,
+)
 
-# Advanced features (optional imports)
-try:
-    from . import advanced
-    __all_advanced__ = [
-        "BridgedCallManager",
-        "MicrophoneCapture",
-        "CustomAPIHandler", 
-        "AudioFilters",
-        "VideoFilters",
-        "ScreenShare",
-        "WhisperTranscription",
-        "YouTubeDownloader",
-        "AdvancedYouTubeStreamer",
-    ]
-except ImportError:
-    advanced = None
-    __all_advanced__ = []
+from ._lazy import lazy_reexport
+
+# Subsystems below are imported on first attribute access (PEP 562) so that
+# ``import tgcaller`` does not pull in optional media/network dependencies
+__getattr__, __dir__ = lazy_reexport(
+    __name__,
+    {
+        # API System
+        ".api": ["CustomAPIServer", "on_custom_update"],
+        # Device System
+        ".devices": [
+            "MediaDevices",
+            "DeviceInfo",
+            "InputDevice",
+            "SpeakerDevice",
+            "CameraDevice",
+            "ScreenDevice",
+        ],
+        # Utilities
+        ".utilities": ["CpuMonitor", "PingMonitor", "CallHolder", "PeerResolver"],
+    },
+    submodules=("advanced", "streaming"),
+)
 
 __all__ = [
     # Main client
@@ -160,4 +169,4 @@ __all__ = [
     # Advanced features
     "advanced",
     "streaming",
-] + __all_advanced__
+]
@@ -0,0 +1,42 @@
+"""
+JSON Helpers for the HTTP API Servers
+"""
+
+import json
+from typing import Any
+
+from aiohttp import web
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data: Any) -> bytes:
+    """Serialise to JSON bytes, with orjson when it can encode data"""
+    if orjson is not None:
+        try:
+            # Non-string keys are accepted, as json.dumps does
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers wider than 64 bits; json.dumps handles them
+    
+    return json.dumps(data).encode()
+
+
+def json_response(data: Any, status: int = 200) -> web.Response:
+    """Build a JSON response"""
+    return web.Response(
+        body=dumps(data),
+        status=status,
+        content_type='application/json'
+    )
+
+
+async def read_json(request: web.Request) -> Any:
+    """Parse a JSON request body, with orjson when available"""
+    if orjson is None:
+        return await request.json()
+    
+    return orjson.loads(await request.read())
@@ -0,0 +1,49 @@
+"""
+Lazy Re-export Helper
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_reexport(
+    package: str,
+    exports: Dict[str, Iterable[str]],
+    submodules: Iterable[str] = ()
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build PEP 562 module hooks that import re-exported names on first access
+    
+    Args:
+        package: __name__ of the package doing the re-export
+        exports: Relative module name mapped to the names it provides
+        submodules: Submodule names exposed as package attributes
+    
+    Returns:
+        (__getattr__, __dir__) for the package namespace
+    """
+    origin = {
+        name: module
+        for module, names in exports.items()
+        for name in names
+    }
+    submodules = frozenset(submodules)
+    namespace = sys.modules[package].__dict__
+    
+    def __getattr__(name: str) -> object:
+        if name in origin:
+            value = getattr(importlib.import_module(origin[name], package), name)
+        elif name in submodules:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        
+        # Cache on the package so later lookups bypass __getattr__
+        namespace[name] = value
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(origin) | submodules)
+    
+    return __getattr__, __dir__
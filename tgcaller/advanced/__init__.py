@@ -2,20 +2,21 @@
 TgCaller Advanced Features
 """
 
-from .bridged_calls import BridgedCallManager
-from .capture_mic import MicrophoneCapture
-from .custom_api import CustomAPIHandler
-from .custom_filters import AudioFilters, VideoFilters
-from .external_capture import ExternalCapture
-from .fifo_conversion import FIFOConverter
-from .frame_sending import FrameSender
-from .multiple_clients import MultiClientManager
-from .p2p_calls import P2PCallManager
-from .raw_streaming import RawStreamer
-from .screen_sharing import ScreenShare
-from .transcription import WhisperTranscription
-from .youtube_dl import YouTubeDownloader
-from .youtube_streaming import AdvancedYouTubeStreamer, PerformanceMonitor
+from .._lazy import lazy_reexport
+
+# Each feature pulls in its own heavy optional dependencies (pyaudio, cv2,
+# mss, whisper, yt-dlp), so submodules are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_reexport(__name__, {
+    ".bridged_calls": ["BridgedCallManager"],
+    ".capture_mic": ["MicrophoneCapture"],
+    ".custom_api": ["CustomAPIHandler"],
+    ".custom_filters": ["AudioFilters", "VideoFilters"],
+    ".screen_sharing": ["ScreenShare"],
+    ".transcription": ["WhisperTranscription"],
+    ".youtube_dl": ["YouTubeDownloader"],
+    ".youtube_streaming": ["AdvancedYouTubeStreamer", "PerformanceMonitor"],
+})
+
 
 __all__ = [
     "BridgedCallManager",
@@ -23,12 +24,6 @@ __all__ = [
     "CustomAPIHandler",
     "AudioFilters",
     "VideoFilters",
-    "ExternalCapture",
-    "FIFOConverter",
-    "FrameSender",
-    "MultiClientManager",
-    "P2PCallManager",
-    "RawStreamer",
     "ScreenShare",
     "WhisperTranscription",
     "YouTubeDownloader",
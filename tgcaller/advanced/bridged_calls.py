@@ -4,19 +4,84 @@ Bridged Calls - Connect multiple chats
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Set
+import numpy as np
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
 from ..types import AudioConfig, VideoConfig, CallUpdate, CallStatus
 
 logger = logging.getLogger(__name__)
 
+# Optional imports
+try:
+    import soxr
+except ImportError:
+    soxr = None
+
+
+def _resample_linear(frame: np.ndarray, in_rate: int, out_rate: int) -> np.ndarray:
+    """Resample int16 PCM by linear interpolation (fallback without soxr)"""
+    samples = len(frame) * out_rate // in_rate
+    positions = np.arange(samples) * (in_rate / out_rate)
+    return np.interp(positions, np.arange(len(frame)), frame).astype(np.int16)
+
+
+class _FrameResampler:
+    """
+    Resample one chat's PCM stream into whole frames
+    
+    Streaming resamplers emit a varying number of samples per chunk; the
+    surplus is carried into the next frame rather than trimmed away.
+    """
+    
+    __slots__ = ('_resample', '_pending')
+    
+    def __init__(self, in_rate: int, out_rate: int):
+        # A streaming soxr resampler keeps filter state between ticks
+        if soxr is not None:
+            self._resample = soxr.ResampleStream(in_rate, out_rate, 1, dtype='int16').resample_chunk
+        else:
+            self._resample = partial(_resample_linear, in_rate=in_rate, out_rate=out_rate)
+        self._pending = np.empty(0, dtype=np.int16)
+    
+    def __call__(self, frame: np.ndarray, samples: int) -> np.ndarray:
+        out = self._resample(frame)
+        if len(self._pending):
+            out = np.concatenate((self._pending, out))
+        
+        if len(out) < samples:
+            # Priming filter; lead with silence rather than stretch audio
+            self._pending = out[:0]
+            return np.pad(out, (samples - len(out), 0))
+        
+        # Keep at most one frame of surplus so latency cannot build up
+        self._pending = out[samples:samples * 2]
+        return out[:samples]
+
 
 class BridgedCallManager:
     """Manage bridged calls between multiple chats"""
     
+    TICK_INTERVAL = 0.02
+    """Seconds per bridged audio frame (50 FPS)"""
+    
     def __init__(self, caller):
         self.caller = caller
         self.bridges: Dict[str, Set[int]] = {}
-        self.active_bridges: Dict[str, bool] = {}
+        # Set while the bridge is active
+        self.active_bridges: Dict[str, asyncio.Event] = {}
+        self._bridge_tasks: Dict[str, asyncio.Task] = {}
+        # Member snapshot per bridge, rebuilt only when membership changes
+        self._bridge_members: Dict[str, Tuple[int, ...]] = {}
+        self._bridge_info: Dict[str, Mapping[str, Any]] = {}
+        self._mix_buffers: Dict[str, tuple] = {}
+        # Mixing happens at one canonical rate per bridge; chats negotiated
+        # at another rate are resampled in and out through cached resamplers
+        self._bridge_rates: Dict[str, int] = {}
+        self._chat_rates: Dict[int, int] = {}
+        # Per (bridge, chat, in_rate, out_rate): each direction of each
+        # bridged stream keeps its own filter state
+        self._resamplers: Dict[Tuple[str, int, int, int], _FrameResampler] = {}
         self.logger = logger
     
     async def create_bridge(
@@ -50,16 +115,22 @@ class BridgedCallManager:
             
             # Create bridge
             self.bridges[bridge_name] = set(chat_ids)
-            self.active_bridges[bridge_name] = True
+            self._bridge_rates[bridge_name] = (audio_config or AudioConfig()).sample_rate
+            active = asyncio.Event()
+            active.set()
+            self.active_bridges[bridge_name] = active
+            self._members_changed(bridge_name)
             
             # Start audio bridging
-            asyncio.create_task(self._bridge_audio(bridge_name))
+            self._bridge_tasks[bridge_name] = asyncio.create_task(
+                self._bridge_audio(bridge_name, active)
+            )
             
-            self.logger.info(f"Created bridge {bridge_name} with {len(chat_ids)} chats")
+            self.logger.info("Created bridge %s with %s chats", bridge_name, len(chat_ids))
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to create bridge {bridge_name}: {e}")
+            self.logger.error("Failed to create bridge %s: %s", bridge_name, e)
             return False
     
     async def destroy_bridge(self, bridge_name: str) -> bool:
@@ -68,8 +139,11 @@ class BridgedCallManager:
             return False
         
         try:
-            # Stop bridging
-            self.active_bridges[bridge_name] = False
+            # Stop bridging; cancelling interrupts an in-flight tick
+            self.active_bridges[bridge_name].clear()
+            task = self._bridge_tasks.pop(bridge_name, None)
+            if task:
+                task.cancel()
             
             # Leave calls (optional)
             chat_ids = self.bridges[bridge_name]
@@ -79,12 +153,17 @@ class BridgedCallManager:
             # Remove bridge
             del self.bridges[bridge_name]
             del self.active_bridges[bridge_name]
+            self._bridge_members.pop(bridge_name, None)
+            self._bridge_info.pop(bridge_name, None)
+            self._mix_buffers.pop(bridge_name, None)
+            self._bridge_rates.pop(bridge_name, None)
+            self._drop_resamplers(lambda key: key[0] == bridge_name)
             
-            self.logger.info(f"Destroyed bridge {bridge_name}")
+            self.logger.info("Destroyed bridge %s", bridge_name)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to destroy bridge {bridge_name}: {e}")
+            self.logger.error("Failed to destroy bridge %s: %s", bridge_name, e)
             return False
     
     async def add_chat_to_bridge(self, bridge_name: str, chat_id: int) -> bool:
@@ -97,11 +176,12 @@ class BridgedCallManager:
                 await self.caller.join_call(chat_id)
             
             self.bridges[bridge_name].add(chat_id)
-            self.logger.info(f"Added chat {chat_id} to bridge {bridge_name}")
+            self._members_changed(bridge_name)
+            self.logger.info("Added chat %s to bridge %s", chat_id, bridge_name)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to add chat to bridge: {e}")
+            self.logger.error("Failed to add chat to bridge: %s", e)
             return False
     
     async def remove_chat_from_bridge(self, bridge_name: str, chat_id: int) -> bool:
@@ -111,52 +191,218 @@ class BridgedCallManager:
         
         try:
             self.bridges[bridge_name].discard(chat_id)
+            self._members_changed(bridge_name)
+            self._drop_resamplers(lambda key: key[:2] == (bridge_name, chat_id))
             await self.caller.leave_call(chat_id)
             
-            self.logger.info(f"Removed chat {chat_id} from bridge {bridge_name}")
+            self.logger.info("Removed chat %s from bridge %s", chat_id, bridge_name)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to remove chat from bridge: {e}")
+            self.logger.error("Failed to remove chat from bridge: %s", e)
             return False
     
-    async def _bridge_audio(self, bridge_name: str):
-        """Bridge audio between chats"""
-        while self.active_bridges.get(bridge_name, False):
+    def set_chat_sample_rate(self, chat_id: int, sample_rate: int):
+        """
+        Set the PCM sample rate a chat captures and expects frames at
+        
+        Args:
+            chat_id: Chat ID
+            sample_rate: Sample rate in Hz; defaults to the bridge rate
+        """
+        self._chat_rates[chat_id] = sample_rate
+        
+        # Drop resamplers built for the previous rate
+        self._drop_resamplers(lambda key: key[1] == chat_id)
+    
+    def _drop_resamplers(self, matches: Callable[[Tuple[str, int, int, int]], bool]):
+        """Drop the cached resamplers whose key matches"""
+        for key in [key for key in self._resamplers if matches(key)]:
+            del self._resamplers[key]
+    
+    def _members_changed(self, bridge_name: str):
+        """Refresh member snapshot and drop cached info after a membership change"""
+        self._bridge_members[bridge_name] = tuple(self.bridges[bridge_name])
+        self._bridge_info.pop(bridge_name, None)
+    
+    async def _bridge_audio(self, bridge_name: str, active: asyncio.Event):
+        """Bridge audio between chats while active is set"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        
+        while active.is_set():
             try:
-                chat_ids = list(self.bridges[bridge_name])
+                chat_ids = self._bridge_members[bridge_name]
                 
-                # Simulate audio bridging
-                for i, source_chat in enumerate(chat_ids):
-                    for j, target_chat in enumerate(chat_ids):
-                        if i != j:
-                            # Forward audio from source to target
-                            await self._forward_audio(source_chat, target_chat)
+                # Capture one frame per chat, then send each chat the mix
+                # of everyone else (mix-minus) instead of forwarding every
+                # source to every target pairwise
+                frames = await asyncio.gather(
+                    *(self._capture_audio(chat_id) for chat_id in chat_ids)
+                )
+                await self._mix_and_send(bridge_name, chat_ids, frames)
                 
-                await asyncio.sleep(0.02)  # 50 FPS
+                # Sleep until the next tick deadline rather than a fixed
+                # interval, so processing time does not stretch the period
+                deadline += self.TICK_INTERVAL
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # Fell behind; resynchronise instead of bursting ticks
+                    deadline = loop.time()
+                    await asyncio.sleep(0)
                 
             except Exception as e:
-                self.logger.error(f"Error in audio bridging: {e}")
+                self.logger.error("Error in audio bridging: %s", e)
                 await asyncio.sleep(1)
+                deadline = loop.time()
+    
+    async def _mix_and_send(
+        self,
+        bridge_name: str,
+        chat_ids: Tuple[int, ...],
+        frames: List[Optional[np.ndarray]]
+    ):
+        """
+        Send every chat the sum of all other chats' frames
+        
+        Args:
+            bridge_name: Bridge the frames belong to
+            chat_ids: Bridged chat IDs
+            frames: Captured int16 PCM frame per chat (None if silent)
+        """
+        if all(frame is None for frame in frames):
+            return
+        
+        rate = self._bridge_rates[bridge_name]
+        samples = int(rate * self.TICK_INTERVAL)
+        count = len(chat_ids)
+        frame_buf, total, scratch, out_buf = self._get_mix_buffers(
+            bridge_name, count, samples
+        )
+        
+        # Bring every source to the bridge rate once per tick; the mix is
+        # then shared by all targets instead of resampling per pair
+        chat_rates = self._chat_rates
+        frames = [
+            None if frame is None else
+            self._resample(bridge_name, chat_id, frame, chat_rates.get(chat_id, rate), rate, samples)
+            for chat_id, frame in zip(chat_ids, frames)
+        ]
+        
+        for i, frame in enumerate(frames):
+            if frame is None:
+                frame_buf[i].fill(0)
+            else:
+                frame_buf[i] = frame
+        
+        # Sum once in int32 so the per-target subtraction cannot overflow
+        np.sum(frame_buf[:count], axis=0, dtype=np.int32, out=total)
+        
+        for i in range(count):
+            np.subtract(total, frame_buf[i], out=scratch)
+            np.maximum(scratch, -32768, out=scratch)
+            np.minimum(scratch, 32767, out=scratch)
+            out_buf[i] = scratch
+        
+        # Each target gets its own output row, so the concurrent sends never
+        # observe a buffer that is being rewritten. A failing peer is logged
+        # without cancelling the other sends or the tick.
+        sends = []
+        for i, chat_id in enumerate(chat_ids):
+            chat_rate = chat_rates.get(chat_id, rate)
+            pcm = out_buf[i]
+            if chat_rate != rate:
+                pcm = self._resample(
+                    bridge_name, chat_id, pcm, rate, chat_rate, int(chat_rate * self.TICK_INTERVAL)
+                )
+            sends.append(self._send_audio(chat_id, pcm))
+        
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        
+        # Runs every tick; skip the scan entirely when warnings are filtered
+        if self.logger.isEnabledFor(logging.WARNING):
+            for chat_id, result in zip(chat_ids, results):
+                if isinstance(result, Exception):
+                    self.logger.warning("Failed to send bridged audio to %s: %s", chat_id, result)
     
-    async def _forward_audio(self, source_chat: int, target_chat: int):
-        """Forward audio from source to target chat"""
-        # This would capture audio from source_chat and send to target_chat
+    def _resample(
+        self,
+        bridge_name: str,
+        chat_id: int,
+        frame: np.ndarray,
+        in_rate: int,
+        out_rate: int,
+        samples: int
+    ) -> np.ndarray:
+        """Resample frame for chat in bridge and fit it to samples"""
+        if in_rate != out_rate:
+            key = (bridge_name, chat_id, in_rate, out_rate)
+            resampler = self._resamplers.get(key)
+            if resampler is None:
+                resampler = self._resamplers[key] = _FrameResampler(in_rate, out_rate)
+            return resampler(frame, samples)
+        
+        if len(frame) == samples:
+            return frame
+        
+        # Pad or trim captures of the wrong length so mixing always sees
+        # whole frames
+        if len(frame) < samples:
+            return np.pad(frame, (0, samples - len(frame)))
+        return frame[:samples]
+    
+    def _get_mix_buffers(self, bridge_name: str, count: int, samples: int):
+        """Get (frames, total, scratch, output) mix buffers for bridge, reused across ticks"""
+        buffers = self._mix_buffers.get(bridge_name)
+        
+        if buffers is None or buffers[0].shape[0] < count or buffers[0].shape[1] != samples:
+            buffers = (
+                np.zeros((count, samples), dtype=np.int16),
+                np.empty(samples, dtype=np.int32),
+                np.empty(samples, dtype=np.int32),
+                np.empty((count, samples), dtype=np.int16),
+            )
+            self._mix_buffers[bridge_name] = buffers
+        
+        return buffers
+    
+    async def _capture_audio(self, chat_id: int) -> Optional[np.ndarray]:
+        """Capture one int16 PCM frame from chat"""
+        # This would capture audio from chat_id
         # Implementation depends on actual audio processing
-        pass
+        return None
+    
+    async def _send_audio(self, chat_id: int, pcm: np.ndarray):
+        """Send an int16 PCM frame to chat"""
+        await self.caller.send_frame(chat_id, pcm.tobytes(), "audio")
     
-    def get_bridge_info(self, bridge_name: str) -> Optional[Dict]:
-        """Get bridge information"""
+    def get_bridge_info(self, bridge_name: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get bridge information
+        
+        Returns:
+            Read-only mapping (chat_ids is a tuple), cached until the
+            bridge changes, or None if the bridge does not exist
+        """
+        info = self._bridge_info.get(bridge_name)
+        if info is not None:
+            return info
+        
         if bridge_name not in self.bridges:
             return None
         
-        return {
+        chat_ids = self._bridge_members[bridge_name]
+        info = MappingProxyType({
             'name': bridge_name,
-            'chat_ids': list(self.bridges[bridge_name]),
-            'active': self.active_bridges[bridge_name],
-            'chat_count': len(self.bridges[bridge_name])
-        }
+            'chat_ids': chat_ids,
+            'active': self.active_bridges[bridge_name].is_set(),
+            'chat_count': len(chat_ids)
+        })
+        self._bridge_info[bridge_name] = info
+        return info
     
-    def list_bridges(self) -> List[str]:
+    def list_bridges(self) -> Tuple[str, ...]:
         """List all bridge names"""
-        return list(self.bridges.keys())
\ No newline at end of file
+        return tuple(self.bridges)
\ No newline at end of file
@@ -4,8 +4,10 @@ Microphone Capture - Real-time microphone input
 
 import asyncio
 import logging
+import threading
 import numpy as np
-from typing import Optional, Callable
+from collections import deque
+from typing import Optional, Callable, Tuple
 try:
     import pyaudio
 except ImportError:
@@ -16,9 +18,68 @@ from ..types import AudioConfig
 logger = logging.getLogger(__name__)
 
 
+class AudioRingBuffer:
+    """Preallocated int16 sample ring that hands out views of written chunks"""
+    
+    def __init__(self, frames: int, channels: int = 1):
+        """
+        Args:
+            frames: Capacity in frames (samples per channel)
+            channels: Interleaved channel count
+        """
+        self.channels = channels
+        self._buffer = np.zeros(frames * channels, dtype=np.int16)
+        self._view = self._buffer.view()
+        self._view.flags.writeable = False
+        self._write_pos = 0
+        # Samples written in total, counting tail space skipped on wrapping
+        self.position = 0
+    
+    def write(self, data: bytes) -> np.ndarray:
+        """
+        Copy interleaved PCM bytes into the ring
+        
+        Returns:
+            Read-only view of the written samples, shaped (frames, channels)
+            for multi-channel data; valid until the ring wraps onto it
+        """
+        samples = np.frombuffer(data, dtype=np.int16)
+        count = samples.shape[0]
+        
+        if count > self._buffer.shape[0]:
+            raise ValueError("Chunk larger than ring buffer")
+        
+        # Wrap early rather than split a chunk, so every view is contiguous
+        start = self._write_pos
+        if start + count > self._buffer.shape[0]:
+            self.position += self._buffer.shape[0] - start
+            start = 0
+        end = start + count
+        
+        self._buffer[start:end] = samples
+        self._write_pos = end
+        self.position += count
+        
+        view = self._view[start:end]
+        return view.reshape(-1, self.channels) if self.channels > 1 else view
+    
+    def holds(self, position: int) -> bool:
+        """Whether samples written from stream position on are not yet overwritten"""
+        return self.position - position <= self._buffer.shape[0]
+
+
 class MicrophoneCapture:
     """Capture microphone input for streaming"""
     
+    CHUNK_SIZE = 1024
+    """Frames per PyAudio buffer"""
+    
+    RING_CHUNKS = 32
+    """Buffers kept in the ring before a chunk's view is overwritten"""
+    
+    QUEUE_CHUNKS = 8
+    """Buffers awaiting callbacks before the oldest is dropped"""
+    
     def __init__(self, audio_config: Optional[AudioConfig] = None):
         if pyaudio is None:
             raise ImportError("pyaudio is required for microphone capture")
@@ -28,16 +89,37 @@ class MicrophoneCapture:
         self.stream = None
         self.is_recording = False
         self.callbacks = []
+        # Hot-path copy read by the audio thread on every buffer
+        self._callbacks: Tuple[Callable[[np.ndarray], None], ...] = ()
+        self._ring: Optional[AudioRingBuffer] = None
+        # Single-producer (audio thread) / single-consumer hand-off
+        self._pending: deque = deque()
+        self._ready = threading.Event()
+        self._consumer: Optional[threading.Thread] = None
+        # Buffers the ring overwrote before or while callbacks read them
+        self.overruns = 0
         self.logger = logger
     
     def add_callback(self, callback: Callable[[np.ndarray], None]):
-        """Add callback for audio data"""
+        """
+        Add callback for audio data
+        
+        Callbacks run on a consumer thread, not the audio thread. Each
+        receives a read-only int16 view into the capture ring, shaped
+        (frames, channels) for multi-channel input. It stays valid for
+        RING_CHUNKS - QUEUE_CHUNKS further buffers; copy it to keep the
+        samples longer. If callbacks fall QUEUE_CHUNKS buffers behind,
+        the oldest pending buffers are dropped. Buffers the ring overwrote
+        before or during delivery are counted in overruns and logged.
+        """
         self.callbacks.append(callback)
+        self._callbacks = tuple(self.callbacks)
     
     def remove_callback(self, callback: Callable[[np.ndarray], None]):
         """Remove callback"""
         if callback in self.callbacks:
             self.callbacks.remove(callback)
+            self._callbacks = tuple(self.callbacks)
     
     async def start_capture(self, device_index: Optional[int] = None) -> bool:
         """
@@ -55,13 +137,22 @@ class MicrophoneCapture:
         
         try:
             # Audio parameters
-            chunk_size = 1024
+            chunk_size = self.CHUNK_SIZE
             format_map = {
                 1: pyaudio.paInt16,
                 2: pyaudio.paInt16,
                 4: pyaudio.paInt32
             }
             
+            # Allocated once per capture; frames are copied in, never allocated
+            self._ring = AudioRingBuffer(
+                chunk_size * self.RING_CHUNKS,
+                self.audio_config.channels
+            )
+            self._pending = deque(maxlen=self.QUEUE_CHUNKS)
+            self._ready = threading.Event()
+            self.overruns = 0
+            
             # Create stream
             self.stream = self.pyaudio.open(
                 format=format_map.get(2, pyaudio.paInt16),
@@ -76,6 +167,15 @@ class MicrophoneCapture:
             self.stream.start_stream()
             self.is_recording = True
             
+            # Buffers arriving before the consumer starts wait in _pending
+            self._consumer = threading.Thread(
+                target=self._consume,
+                args=(self._ring, self._pending, self._ready),
+                name="MicrophoneCapture-callbacks",
+                daemon=True
+            )
+            self._consumer.start()
+            
             self.logger.info("Microphone capture started")
             return True
             
@@ -96,6 +196,13 @@ class MicrophoneCapture:
                 self.stream.close()
                 self.stream = None
             
+            # Wake the consumer so it sees is_recording and exits
+            self._ready.set()
+            if self._consumer:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._consumer.join)
+                self._consumer = None
+            
             self.logger.info("Microphone capture stopped")
             
         except Exception as e:
@@ -104,19 +211,12 @@ class MicrophoneCapture:
     def _audio_callback(self, in_data, frame_count, time_info, status):
         """Audio stream callback"""
         try:
-            # Convert to numpy array
-            audio_data = np.frombuffer(in_data, dtype=np.int16)
-            
-            # Reshape for channels
-            if self.audio_config.channels == 2:
-                audio_data = audio_data.reshape(-1, 2)
-            
-            # Call all callbacks
-            for callback in self.callbacks:
-                try:
-                    callback(audio_data)
-                except Exception as e:
-                    self.logger.error(f"Error in audio callback: {e}")
+            # Copy into the preallocated ring and hand the view to the
+            # consumer thread; callbacks never run on the audio thread
+            ring = self._ring
+            view = ring.write(in_data)
+            self._pending.append((view, ring.position - view.size))
+            self._ready.set()
             
             return (in_data, pyaudio.paContinue)
             
@@ -124,6 +224,37 @@ class MicrophoneCapture:
             self.logger.error(f"Error in audio callback: {e}")
             return (in_data, pyaudio.paAbort)
     
+    def _consume(self, ring: AudioRingBuffer, pending: deque, ready: threading.Event):
+        """Deliver captured buffers to callbacks until capture stops"""
+        while True:
+            ready.wait()
+            ready.clear()
+            
+            if not self.is_recording:
+                return
+            
+            while pending:
+                audio_data, position = pending.popleft()
+                
+                intact = ring.holds(position)
+                if intact:
+                    for callback in self._callbacks:
+                        try:
+                            callback(audio_data)
+                        except Exception as e:
+                            self.logger.error(f"Error in audio callback: {e}")
+                    
+                    # Slow callbacks let the ring wrap onto the view in use
+                    intact = ring.holds(position)
+                
+                if not intact:
+                    self.overruns += 1
+                    if self.overruns == 1:
+                        self.logger.warning(
+                            "Microphone callbacks fell behind the capture ring; "
+                            "audio was overwritten before they read it"
+                        )
+    
     def list_devices(self) -> list:
         """List available audio devices"""
         devices = []
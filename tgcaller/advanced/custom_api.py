@@ -5,8 +5,13 @@ Custom API Handler - Extend TgCaller with custom endpoints
 import asyncio
 import json
 import logging
-from typing import Dict, Any, Callable, Optional
+import time
+from typing import Dict, Any, Callable, Optional, Tuple
 from aiohttp import web, ClientSession
+from aiohttp.log import access_logger
+from multidict import CIMultiDict
+
+from .._json import dumps as _dumps, json_response as _json_response, read_json as _read_json
 
 logger = logging.getLogger(__name__)
 
@@ -14,37 +19,65 @@ logger = logging.getLogger(__name__)
 class CustomAPIHandler:
     """Custom API endpoints for TgCaller"""
     
-    def __init__(self, caller, port: int = 8080):
+    RESPONSE_CACHE_TTL = 1.0
+    """Seconds a serialised /status or /stats body is reused"""
+    
+    KEEPALIVE_TIMEOUT = 75.0
+    """Seconds an idle keep-alive connection stays open"""
+    
+    def __init__(self, caller, port: int = 8080, access_log: bool = True):
+        """
+        Args:
+            caller: TgCaller instance
+            port: Server port
+            access_log: Log a line per request to aiohttp.access
+        """
         self.caller = caller
         self.port = port
+        self.access_log = access_log
         self.app = web.Application()
         self.routes = {}
         self.middleware = []
         self.logger = logger
+        # Endpoint path -> (expiry, serialised body)
+        self._response_cache: Dict[str, Tuple[float, bytes]] = {}
         self._setup_default_routes()
     
     def _setup_default_routes(self):
         """Setup default API routes"""
-        # Status endpoints
-        self.app.router.add_get('/status', self._status_handler)
-        self.app.router.add_get('/calls', self._calls_handler)
-        
-        # Control endpoints
-        self.app.router.add_post('/join', self._join_handler)
-        self.app.router.add_post('/leave', self._leave_handler)
-        self.app.router.add_post('/play', self._play_handler)
-        self.app.router.add_post('/pause', self._pause_handler)
-        self.app.router.add_post('/resume', self._resume_handler)
-        self.app.router.add_post('/stop', self._stop_handler)
-        self.app.router.add_post('/volume', self._volume_handler)
+        self.app.add_routes([
+            # Status endpoints
+            web.get('/status', self._status_handler),
+            web.get('/calls', self._calls_handler),
+            
+            # Control endpoints
+            web.post('/join', self._join_handler),
+            web.post('/leave', self._leave_handler),
+            web.post('/play', self._play_handler),
+            web.post('/pause', self._pause_handler),
+            web.post('/resume', self._resume_handler),
+            web.post('/stop', self._stop_handler),
+            web.post('/volume', self._volume_handler),
+            
+            # Advanced endpoints
+            web.get('/stats', self._stats_handler),
+            web.post('/webhook', self._webhook_handler),
+        ])
+    
+    def _cached_json(self, key: str, build: Callable[[], Any]) -> web.Response:
+        """JSON response whose body is rebuilt at most once per RESPONSE_CACHE_TTL"""
+        now = time.monotonic()
+        cached = self._response_cache.get(key)
+        if cached is None or now >= cached[0]:
+            cached = (now + self.RESPONSE_CACHE_TTL, _dumps(build()))
+            self._response_cache[key] = cached
         
-        # Advanced endpoints
-        self.app.router.add_get('/stats', self._stats_handler)
-        self.app.router.add_post('/webhook', self._webhook_handler)
+        return web.Response(body=cached[1], content_type='application/json')
     
     async def _status_handler(self, request):
         """Get TgCaller status"""
-        return web.json_response({
+        # Polled by monitors, so served from a short-lived cache
+        return self._cached_json('/status', lambda: {
             'status': 'running' if self.caller.is_running else 'stopped',
             'active_calls': len(self.caller.get_active_calls()),
             'version': '1.0.0'
@@ -59,25 +92,25 @@ class CustomAPIHandler:
                 'connected': self.caller.is_connected(chat_id)
             })
         
-        return web.json_response({'calls': active_calls})
+        return _json_response({'calls': active_calls})
     
     async def _join_handler(self, request):
         """Join call endpoint"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             chat_id = data.get('chat_id')
             
             if not chat_id:
-                return web.json_response(
+                return _json_response(
                     {'error': 'chat_id required'}, 
                     status=400
                 )
             
             success = await self.caller.join_call(chat_id)
-            return web.json_response({'success': success})
-            
+            return _json_response({'success': success})
+        
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {'error': str(e)}, 
                 status=500
             )
@@ -85,20 +118,20 @@ class CustomAPIHandler:
     async def _leave_handler(self, request):
         """Leave call endpoint"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             chat_id = data.get('chat_id')
             
             if not chat_id:
-                return web.json_response(
+                return _json_response(
                     {'error': 'chat_id required'}, 
                     status=400
                 )
             
             success = await self.caller.leave_call(chat_id)
-            return web.json_response({'success': success})
-            
+            return _json_response({'success': success})
+        
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {'error': str(e)}, 
                 status=500
             )
@@ -106,21 +139,21 @@ class CustomAPIHandler:
     async def _play_handler(self, request):
         """Play media endpoint"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             chat_id = data.get('chat_id')
             source = data.get('source')
             
             if not chat_id or not source:
-                return web.json_response(
+                return _json_response(
                     {'error': 'chat_id and source required'}, 
                     status=400
                 )
             
             success = await self.caller.play(chat_id, source)
-            return web.json_response({'success': success})
-            
+            return _json_response({'success': success})
+        
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {'error': str(e)}, 
                 status=500
             )
@@ -128,14 +161,14 @@ class CustomAPIHandler:
     async def _pause_handler(self, request):
         """Pause endpoint"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             chat_id = data.get('chat_id')
             
             success = await self.caller.pause(chat_id)
-            return web.json_response({'success': success})
-            
+            return _json_response({'success': success})
+        
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {'error': str(e)}, 
                 status=500
             )
@@ -143,14 +176,14 @@ class CustomAPIHandler:
     async def _resume_handler(self, request):
         """Resume endpoint"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             chat_id = data.get('chat_id')
             
             success = await self.caller.resume(chat_id)
-            return web.json_response({'success': success})
-            
+            return _json_response({'success': success})
+        
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {'error': str(e)}, 
                 status=500
             )
@@ -158,14 +191,14 @@ class CustomAPIHandler:
     async def _stop_handler(self, request):
         """Stop endpoint"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             chat_id = data.get('chat_id')
             
             success = await self.caller.stop(chat_id)
-            return web.json_response({'success': success})
-            
+            return _json_response({'success': success})
+        
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {'error': str(e)}, 
                 status=500
             )
@@ -173,28 +206,28 @@ class CustomAPIHandler:
     async def _volume_handler(self, request):
         """Volume control endpoint"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             chat_id = data.get('chat_id')
             volume = data.get('volume')
             
             if volume is None:
-                return web.json_response(
+                return _json_response(
                     {'error': 'volume required'}, 
                     status=400
                 )
             
             success = await self.caller.set_volume(chat_id, volume)
-            return web.json_response({'success': success})
-            
+            return _json_response({'success': success})
+        
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {'error': str(e)}, 
                 status=500
             )
     
     async def _stats_handler(self, request):
         """Statistics endpoint"""
-        return web.json_response({
+        return self._cached_json('/stats', lambda: {
             'total_calls': len(self.caller.get_active_calls()),
             'uptime': '1h 30m',  # Placeholder
             'memory_usage': '45MB',  # Placeholder
@@ -204,7 +237,7 @@ class CustomAPIHandler:
     async def _webhook_handler(self, request):
         """Webhook endpoint for external integrations"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             event_type = data.get('type')
             
             # Handle different webhook events
@@ -213,10 +246,10 @@ class CustomAPIHandler:
                 source = data.get('source')
                 await self.caller.play(chat_id, source)
             
-            return web.json_response({'received': True})
-            
+            return _json_response({'received': True})
+        
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {'error': str(e)}, 
                 status=500
             )
@@ -244,14 +277,19 @@ class CustomAPIHandler:
     async def start_server(self):
         """Start API server"""
         try:
-            runner = web.AppRunner(self.app)
+            # Keep-alive lets webhook clients reuse connections
+            runner = web.AppRunner(
+                self.app,
+                access_log=access_logger if self.access_log else None,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT
+            )
             await runner.setup()
             
             site = web.TCPSite(runner, 'localhost', self.port)
             await site.start()
             
             self.logger.info(f"Custom API server started on port {self.port}")
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to start API server: {e}")
     
@@ -261,22 +299,37 @@ class CustomAPIHandler:
         self.logger.info("API server stopped")
 
 
+# Built once; copied onto responses in a single update
+_CORS_HEADERS = CIMultiDict({
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE',
+    'Access-Control-Allow-Headers': 'Content-Type',
+})
+
+
 # Example middleware
+@web.middleware
 async def cors_middleware(request, handler):
-    """CORS middleware"""
+    """CORS middleware; answers preflight requests for registered routes"""
+    # Routing has already run: a registered path without an OPTIONS
+    # handler resolves to 405, unknown paths to 404 and are left to it
+    if request.method == 'OPTIONS' and isinstance(
+        request.match_info.http_exception, web.HTTPMethodNotAllowed
+    ):
+        return web.Response(status=204, headers=_CORS_HEADERS)
+    
     response = await handler(request)
-    response.headers['Access-Control-Allow-Origin'] = '*'
-    response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    response.headers.update(_CORS_HEADERS)
     return response
 
 
+@web.middleware
 async def auth_middleware(request, handler):
     """Authentication middleware"""
     auth_header = request.headers.get('Authorization')
     
     if not auth_header or not auth_header.startswith('Bearer '):
-        return web.json_response(
+        return _json_response(
             {'error': 'Authentication required'}, 
             status=401
         )
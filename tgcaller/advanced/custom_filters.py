@@ -2,16 +2,139 @@
 Custom Audio and Video Filters
 """
 
+import inspect
 import numpy as np
 import logging
-from typing import Optional, Dict, Any
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import groupby
+from multiprocessing import shared_memory
+from typing import Optional, Dict, Any, List, Tuple
 try:
     import cv2
 except ImportError:
     cv2 = None
 
+try:
+    from . import _filter_kernels as kernels
+except ImportError:
+    kernels = None
+
 logger = logging.getLogger(__name__)
 
+# BGR colour matrix: output channel c = sum over k of _SEPIA_KERNEL[c, k] * input[k]
+_SEPIA_KERNEL = np.array([
+    [0.272, 0.534, 0.131],
+    [0.349, 0.686, 0.168],
+    [0.393, 0.769, 0.189]
+], dtype=np.float32)
+
+
+# Reverb tap delays in seconds; tap i is scaled by 0.8 ** i
+_REVERB_DELAYS = (0.03, 0.05, 0.07, 0.09, 0.11)
+
+
+@lru_cache(maxsize=8)
+def _reverb_params(
+    room_size: float,
+    damping: float,
+    sample_rate: int,
+    channels: int,
+    dtype: np.dtype
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get read-only reverb kernel parameters
+    
+    Returns:
+        (tap delays in interleaved samples, tap amplitudes in dtype)
+    """
+    delays = np.array(
+        [int(delay * sample_rate) * channels for delay in _REVERB_DELAYS],
+        dtype=np.int64
+    )
+    amplitudes = np.array(
+        [(1.0 - damping) * (0.8 ** i) * room_size for i in range(len(_REVERB_DELAYS))],
+        dtype=dtype
+    )
+    delays.flags.writeable = False
+    amplitudes.flags.writeable = False
+    return delays, amplitudes
+
+
+def _colour_matrix(matrix: np.ndarray, frame: np.ndarray) -> np.ndarray:
+    """Pad a 3x3 BGR colour matrix to 4x4 passing alpha through for BGRA frames"""
+    if frame.ndim < 3 or frame.shape[2] != 4:
+        return matrix
+    
+    padded = np.eye(4, dtype=np.float32)
+    padded[:3, :3] = matrix
+    return padded
+
+
+@lru_cache(maxsize=4)
+def _vignette_mask(rows: int, cols: int) -> np.ndarray:
+    """Get a read-only 3-channel uint8 vignette mask in 1/255 units"""
+    kernel_x = cv2.getGaussianKernel(cols, cols / 2)
+    kernel_y = cv2.getGaussianKernel(rows, rows / 2)
+    kernel = kernel_y * kernel_x.T
+    mask = 255 * kernel / np.linalg.norm(kernel)
+    
+    mask = np.clip(np.round(mask * 255), 0, 255).astype(np.uint8)
+    mask = cv2.merge([mask] * 3)
+    mask.flags.writeable = False
+    return mask
+
+
+# Per-thread grayscale of the latest frame seen by a running FilterChain
+_gray_memo = threading.local()
+
+
+@contextmanager
+def _gray_memo_scope():
+    """Let video filters share grayscale conversions for one chain pass"""
+    _gray_memo.frame = _gray_memo.gray = None
+    _gray_memo.active = True
+    try:
+        yield
+    finally:
+        _gray_memo.active = False
+        _gray_memo.frame = _gray_memo.gray = None
+
+
+def _remember_gray(frame: np.ndarray, gray: np.ndarray):
+    """Record the grayscale form of frame for later filters in the chain"""
+    if getattr(_gray_memo, 'active', False):
+        _gray_memo.frame = frame
+        _gray_memo.gray = gray
+
+
+def _to_gray(frame: np.ndarray) -> np.ndarray:
+    """Convert BGR to gray, reusing the chain's conversion of the same frame"""
+    if getattr(_gray_memo, 'active', False) and _gray_memo.frame is frame:
+        return _gray_memo.gray
+    
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    _remember_gray(frame, gray)
+    return gray
+
+
+def _kernel_buffers(audio_data: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+    """
+    Prepare buffers for a compiled kernel
+    
+    Returns:
+        (flat input, flat output, channels), or None to use the NumPy path
+        (numba missing, non-float samples or empty input)
+    """
+    if kernels is None or audio_data.dtype.kind != 'f' or audio_data.size == 0:
+        return None
+    
+    # Frames run along axis 0; interleaved channels become a sample stride
+    flat = np.ascontiguousarray(audio_data).reshape(-1)
+    return flat, np.empty_like(flat), audio_data.size // len(audio_data)
+
 
 class AudioFilters:
     """Advanced audio processing filters"""
@@ -34,13 +157,24 @@ class AudioFilters:
             if len(audio_data) <= delay_samples:
                 return audio_data
             
-            # Create echo
-            echo_data = np.zeros_like(audio_data)
-            echo_data[delay_samples:] = audio_data[:-delay_samples] * decay
+            buffers = _kernel_buffers(audio_data)
+            if buffers is not None:
+                flat, out, channels = buffers
+                # Match the sample dtype so float32 audio is not promoted
+                kernels.echo(flat, out, delay_samples * channels, flat.dtype.type(decay))
+                return out.reshape(audio_data.shape)
             
-            # Mix original with echo
-            return audio_data + echo_data
+            # Build the mix in one output buffer; the unsafe cast truncates
+            # integer samples like assigning the scaled echo would
+            echo_data = np.empty_like(audio_data)
+            echo_data[:delay_samples] = audio_data[:delay_samples]
+            delayed = echo_data[delay_samples:]
+            np.multiply(audio_data[:-delay_samples], decay, out=delayed, casting='unsafe')
             
+            # Mix original with echo
+            np.add(delayed, audio_data[delay_samples:], out=delayed)
+            return echo_data
+        
         except Exception as e:
             self.logger.error(f"Error applying echo: {e}")
             return audio_data
@@ -53,21 +187,34 @@ class AudioFilters:
     ) -> np.ndarray:
         """Apply reverb effect"""
         try:
+            # Apply multiple delayed echoes with decreasing amplitude
+            sample_rate = 48000
+            
+            buffers = _kernel_buffers(audio_data)
+            if buffers is not None:
+                flat, out, channels = buffers
+                delays, amplitudes = _reverb_params(
+                    room_size, damping, sample_rate, channels, flat.dtype
+                )
+                kernels.reverb(flat, out, delays, amplitudes)
+                return out.reshape(audio_data.shape)
+            
             # Simple reverb implementation
             reverb_data = np.copy(audio_data)
             
-            # Apply multiple delayed echoes with decreasing amplitude
-            delays = [0.03, 0.05, 0.07, 0.09, 0.11]  # seconds
-            sample_rate = 48000
+            # One scratch buffer serves every tap's scaled slice
+            scratch = np.empty_like(audio_data, dtype=np.result_type(audio_data, 1.0))
             
-            for i, delay in enumerate(delays):
+            for i, delay in enumerate(_REVERB_DELAYS):
                 delay_samples = int(delay * sample_rate)
                 if len(audio_data) > delay_samples:
                     amplitude = (1.0 - damping) * (0.8 ** i) * room_size
-                    reverb_data[delay_samples:] += audio_data[:-delay_samples] * amplitude
+                    tap = scratch[:len(audio_data) - delay_samples]
+                    np.multiply(audio_data[:-delay_samples], amplitude, out=tap)
+                    reverb_data[delay_samples:] += tap
             
             return reverb_data
-            
+        
         except Exception as e:
             self.logger.error(f"Error applying reverb: {e}")
             return audio_data
@@ -84,6 +231,14 @@ class AudioFilters:
             
             # Resample audio
             new_length = int(len(audio_data) / shift_factor)
+            
+            # The sample grid is uniform, so the kernel computes each position
+            # directly instead of np.interp's search over index arrays
+            buffers = _kernel_buffers(audio_data) if audio_data.ndim == 1 else None
+            if buffers is not None:
+                flat, out, _ = buffers
+                kernels.pitch_shift(flat, out, new_length)
+                return out
             indices = np.linspace(0, len(audio_data) - 1, new_length)
             
             # Interpolate
@@ -96,7 +251,7 @@ class AudioFilters:
                 return padded
             else:
                 return shifted_audio[:len(audio_data)]
-                
+        
         except Exception as e:
             self.logger.error(f"Error applying pitch shift: {e}")
             return audio_data
@@ -109,18 +264,27 @@ class AudioFilters:
     ) -> np.ndarray:
         """Apply distortion effect"""
         try:
-            # Apply gain
-            distorted = audio_data * gain
-            
-            # Clip at threshold
-            distorted = np.clip(distorted, -threshold, threshold)
+            buffers = _kernel_buffers(audio_data)
+            if buffers is not None:
+                # Gain, clip and peak tracking in one pass
+                flat, distorted, _ = buffers
+                scalar = flat.dtype.type
+                peak = kernels.distortion(flat, distorted, scalar(gain), scalar(threshold))
+                distorted = distorted.reshape(audio_data.shape)
+            else:
+                # Apply gain
+                distorted = audio_data * gain
+                
+                # Clip at threshold
+                np.clip(distorted, -threshold, threshold, out=distorted)
+                peak = np.max(np.abs(distorted)) if distorted.size else 0
             
-            # Normalize
-            if np.max(np.abs(distorted)) > 0:
-                distorted = distorted / np.max(np.abs(distorted))
+            # Normalize in place
+            if peak > 0:
+                distorted *= 1.0 / peak
             
             return distorted
-            
+        
         except Exception as e:
             self.logger.error(f"Error applying distortion: {e}")
             return audio_data
@@ -133,6 +297,13 @@ class AudioFilters:
     ) -> np.ndarray:
         """Apply noise gate"""
         try:
+            buffers = _kernel_buffers(audio_data)
+            if buffers is not None:
+                flat, out, _ = buffers
+                scalar = flat.dtype.type
+                kernels.noise_gate(flat, out, scalar(threshold), scalar(ratio))
+                return out.reshape(audio_data.shape)
+            
             # Calculate amplitude
             amplitude = np.abs(audio_data)
             
@@ -145,7 +316,7 @@ class AudioFilters:
             )
             
             return gated_audio
-            
+        
         except Exception as e:
             self.logger.error(f"Error applying noise gate: {e}")
             return audio_data
@@ -158,6 +329,13 @@ class AudioFilters:
     ) -> np.ndarray:
         """Apply audio compressor"""
         try:
+            buffers = _kernel_buffers(audio_data)
+            if buffers is not None:
+                flat, out, _ = buffers
+                scalar = flat.dtype.type
+                kernels.compressor(flat, out, scalar(threshold), scalar(ratio))
+                return out.reshape(audio_data.shape)
+            
             # Calculate amplitude
             amplitude = np.abs(audio_data)
             
@@ -169,17 +347,23 @@ class AudioFilters:
             )
             
             # Maintain original sign
-            compressed_audio = np.sign(audio_data) * compressed_amplitude
+            compressed_audio = np.copysign(compressed_amplitude, audio_data)
             
             return compressed_audio
-            
+        
         except Exception as e:
             self.logger.error(f"Error applying compressor: {e}")
             return audio_data
 
 
 class VideoFilters:
-    """Advanced video processing filters"""
+    """
+    Advanced video processing filters
+    
+    Filters are blocking, CPU-bound calls. OpenCV releases the GIL inside
+    its kernels, so run them in worker threads (see
+    FilterChain.process_video_batch) rather than directly in coroutines.
+    """
     
     def __init__(self):
         self.logger = logger
@@ -221,13 +405,11 @@ class VideoFilters:
             return frame
         
         try:
-            sepia_filter = np.array([
-                [0.272, 0.534, 0.131],
-                [0.349, 0.686, 0.168],
-                [0.393, 0.769, 0.189]
-            ])
+            if frame.dtype == np.uint8:
+                # Saturating uint8 colour transform; no float64 copy of the frame
+                return cv2.transform(frame, _colour_matrix(_SEPIA_KERNEL, frame))
             
-            sepia_frame = frame.dot(sepia_filter.T)
+            sepia_frame = frame.dot(_colour_matrix(_SEPIA_KERNEL, frame).T)
             sepia_frame = np.clip(sepia_frame, 0, 255)
             return sepia_frame.astype(np.uint8)
         except Exception as e:
@@ -240,8 +422,10 @@ class VideoFilters:
             return frame
         
         try:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+            gray = _to_gray(frame)
+            result = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+            _remember_gray(result, gray)
+            return result
         except Exception as e:
             self.logger.error(f"Error applying grayscale: {e}")
             return frame
@@ -252,9 +436,10 @@ class VideoFilters:
             return frame
         
         try:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            edges = cv2.Canny(gray, 100, 200)
-            return cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
+            edges = cv2.Canny(_to_gray(frame), 100, 200)
+            result = cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
+            _remember_gray(result, edges)
+            return result
         except Exception as e:
             self.logger.error(f"Error applying edge detection: {e}")
             return frame
@@ -273,7 +458,7 @@ class VideoFilters:
             cartoon = centers[labels.flatten()].reshape(frame.shape)
             
             # Add edges
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            gray = _to_gray(frame)
             edges = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 9, 9)
             edges = cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
             
@@ -300,17 +485,9 @@ class VideoFilters:
             hsv[:, :, 1] = hsv[:, :, 1] * 0.6  # Reduce saturation
             vintage = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
             
-            # Add vignette
+            # Add vignette: saturating uint8 multiply by the cached mask
             rows, cols = frame.shape[:2]
-            kernel_x = cv2.getGaussianKernel(cols, cols/2)
-            kernel_y = cv2.getGaussianKernel(rows, rows/2)
-            kernel = kernel_y * kernel_x.T
-            mask = 255 * kernel / np.linalg.norm(kernel)
-            
-            for i in range(3):
-                vintage[:, :, i] = vintage[:, :, i] * mask
-            
-            return vintage.astype(np.uint8)
+            return cv2.multiply(vintage, _vignette_mask(rows, cols), scale=1 / 255)
         except Exception as e:
             self.logger.error(f"Error applying vintage effect: {e}")
             return frame
@@ -324,6 +501,11 @@ class VideoFilters:
     ) -> np.ndarray:
         """Apply color balance"""
         try:
+            if cv2 is not None and frame.dtype == np.uint8:
+                # Per-channel gains as a diagonal colour transform, saturated to uint8
+                gains = np.float32([blue_gain, green_gain, red_gain])
+                return cv2.transform(frame, _colour_matrix(np.diag(gains), frame))
+            
             balanced = frame.astype(np.float32)
             balanced[:, :, 0] *= blue_gain   # Blue channel
             balanced[:, :, 1] *= green_gain  # Green channel
@@ -335,12 +517,77 @@ class VideoFilters:
             return frame
 
 
+# AudioFilters methods whose per-sample kernels FilterChain can fuse
+_FUSABLE_AUDIO_FILTERS = {
+    AudioFilters.apply_noise_gate: 'noise_gate',
+    AudioFilters.apply_compressor: 'compressor',
+}
+
+
+# VideoFilters instance of a process_video_parallel worker
+_worker_filters: Optional["VideoFilters"] = None
+
+
+def _init_filter_worker():
+    """Create the worker's filters once per process"""
+    global _worker_filters
+    _worker_filters = VideoFilters()
+    
+    # Parallelism comes from the pool; OpenCV's own threads would oversubscribe
+    if cv2 is not None:
+        cv2.setNumThreads(1)
+
+
+def _filter_shared_frame(
+    spec: List[Tuple[str, Dict[str, Any]]],
+    shm_name: str,
+    offset: int,
+    shape: Tuple[int, ...],
+    dtype: str
+) -> Optional[np.ndarray]:
+    """
+    Run a chain spec on one frame in shared memory
+    
+    Returns:
+        None if the result was written back over the frame, otherwise the
+        result itself (its shape or dtype differs from the input)
+    """
+    # Pool workers share the parent's resource tracker; the parent unlinks
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frame = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+        result = frame
+        
+        with _gray_memo_scope():
+            for name, kwargs in spec:
+                try:
+                    result = getattr(_worker_filters, name)(result, **kwargs)
+                except Exception as e:
+                    logger.error(f"Error in video filter chain: {e}")
+        
+        if result.shape == frame.shape and result.dtype == frame.dtype:
+            if result is not frame:
+                frame[...] = result
+            return None
+        
+        return result
+    finally:
+        # Drop the view before closing so the buffer can be released
+        frame = result = None
+        shm.close()
+
+
 class FilterChain:
     """Chain multiple filters together"""
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.audio_filters = []
         self.video_filters = []
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._audio_plan: Optional[list] = None
+        self._audio_plan_source: list = []
         self.logger = logger
     
     def add_audio_filter(self, filter_func, **kwargs):
@@ -355,26 +602,195 @@ class FilterChain:
         """Process audio through filter chain"""
         result = audio_data
         
-        for filter_func, kwargs in self.audio_filters:
-            try:
-                result = filter_func(result, **kwargs)
-            except Exception as e:
-                self.logger.error(f"Error in audio filter chain: {e}")
+        for kernel, params, calls in self._get_audio_plan():
+            # Consecutive pointwise filters run as one pass over the samples
+            if kernel is not None:
+                buffers = _kernel_buffers(result)
+                if buffers is not None:
+                    flat, out, _ = buffers
+                    try:
+                        kernel(flat, out, params)
+                        result = out.reshape(result.shape)
+                        continue
+                    except Exception as e:
+                        self.logger.error(f"Error in fused audio filters: {e}")
+            
+            for filter_func, kwargs in calls:
+                try:
+                    result = filter_func(result, **kwargs)
+                except Exception as e:
+                    self.logger.error(f"Error in audio filter chain: {e}")
         
         return result
     
+    def _get_audio_plan(self) -> list:
+        """
+        Get (kernel, params, calls) steps for the audio chain
+        
+        Runs of two or more fusable filters share a fused kernel; every
+        other step has kernel None and a single call. Rebuilt whenever
+        audio_filters changes.
+        """
+        if self._audio_plan is not None and self._audio_plan_source == self.audio_filters:
+            return self._audio_plan
+        
+        specs = [
+            (self._fusable(filter_func, kwargs), (filter_func, kwargs))
+            for filter_func, kwargs in self.audio_filters
+        ]
+        
+        plan = []
+        for fusable, group in groupby(specs, key=lambda item: item[0] is not None):
+            group = list(group)
+            if fusable and len(group) > 1:
+                ops, params = zip(*(spec for spec, _ in group))
+                plan.append((kernels.fused_pointwise(ops), params, [call for _, call in group]))
+            else:
+                plan.extend((None, None, [call]) for _, call in group)
+        
+        self._audio_plan = plan
+        self._audio_plan_source = list(self.audio_filters)
+        return plan
+    
+    @staticmethod
+    def _fusable(filter_func, kwargs) -> Optional[Tuple[str, Tuple[float, ...]]]:
+        """Get (kernel op, parameters) if filter can join a fused pass"""
+        if kernels is None:
+            return None
+        
+        op = _FUSABLE_AUDIO_FILTERS.get(getattr(filter_func, '__func__', None))
+        if op is None:
+            return None
+        
+        try:
+            bound = inspect.signature(filter_func).bind_partial(**kwargs)
+            bound.apply_defaults()
+            return op, tuple(float(bound.arguments[name]) for name in kernels.POINTWISE_PARAMS[op])
+        except (TypeError, ValueError):
+            return None
+    
     def process_video(self, frame: np.ndarray) -> np.ndarray:
-        """Process video through filter chain"""
+        """
+        Process video through filter chain
+        
+        Grayscale conversions are shared between filters during the pass,
+        so filters must return a new frame rather than modify one in place
+        after a grayscale, edge detection or cartoon filter has seen it.
+        """
         result = frame
         
-        for filter_func, kwargs in self.video_filters:
-            try:
-                result = filter_func(result, **kwargs)
-            except Exception as e:
-                self.logger.error(f"Error in video filter chain: {e}")
+        with _gray_memo_scope():
+            for filter_func, kwargs in self.video_filters:
+                try:
+                    result = filter_func(result, **kwargs)
+                except Exception as e:
+                    self.logger.error(f"Error in video filter chain: {e}")
         
         return result
     
+    def process_video_batch(self, frames: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        Process independent frames through the video chain in parallel
+        
+        Args:
+            frames: Frames to filter; order is preserved
+        
+        Returns:
+            Filtered frames
+        """
+        if len(frames) < 2:
+            return [self.process_video(frame) for frame in frames]
+        
+        # Worker threads are reused across batches
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="tgcaller-filters"
+            )
+        
+        # Make frames contiguous once here rather than in every cv2 call
+        frames = [np.ascontiguousarray(frame) for frame in frames]
+        return list(self._executor.map(self.process_video, frames))
+    
+    def process_video_parallel(self, frames: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        Process independent frames through the video chain in worker processes
+        
+        Frames travel through one shared memory block instead of being
+        pickled. Only VideoFilters methods can cross the process boundary;
+        other chains fall back to process_video_batch.
+        
+        Args:
+            frames: Frames to filter; order is preserved
+        
+        Returns:
+            Filtered frames
+        """
+        spec = self._video_spec()
+        if spec is None:
+            self.logger.warning("Video chain has non-VideoFilters filters, using threads")
+            return self.process_video_batch(frames)
+        
+        if len(frames) < 2:
+            return [self.process_video(frame) for frame in frames]
+        
+        # Worker processes are reused across batches
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_filter_worker
+            )
+        
+        frames = [np.ascontiguousarray(frame) for frame in frames]
+        offsets = np.cumsum([0] + [frame.nbytes for frame in frames]).tolist()
+        
+        shm = shared_memory.SharedMemory(create=True, size=max(offsets[-1], 1))
+        try:
+            views = []
+            for frame, offset in zip(frames, offsets):
+                view = np.ndarray(frame.shape, dtype=frame.dtype, buffer=shm.buf, offset=offset)
+                view[...] = frame
+                views.append(view)
+            
+            futures = [
+                self._process_pool.submit(
+                    _filter_shared_frame, spec, shm.name, offset, frame.shape, frame.dtype.str
+                )
+                for frame, offset in zip(frames, offsets)
+            ]
+            
+            results = []
+            for view, future in zip(views, futures):
+                result = future.result()
+                results.append(view.copy() if result is None else result)
+            
+            return results
+        finally:
+            views = None
+            shm.close()
+            shm.unlink()
+    
+    def _video_spec(self) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+        """Get the video chain as picklable (method name, kwargs) pairs"""
+        spec = []
+        for filter_func, kwargs in self.video_filters:
+            func = getattr(filter_func, '__func__', None)
+            name = getattr(func, '__name__', None)
+            if name is None or getattr(VideoFilters, name, None) is not func:
+                return None
+            spec.append((name, kwargs))
+        return spec
+    
+    def close(self):
+        """Shut down batch worker threads and processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+    
     def clear_filters(self):
         """Clear all filters"""
         self.audio_filters.clear()
@@ -3,9 +3,18 @@ Screen Sharing - Capture and stream screen
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import queue
+import sys
+import threading
+import time
+import zlib
 import numpy as np
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from functools import partial
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple, Union
 try:
     import cv2
     import mss
@@ -13,33 +22,304 @@ except ImportError:
     cv2 = None
     mss = None
 
+# Optional encoders
+try:
+    import turbojpeg
+except ImportError:
+    turbojpeg = None
+
+try:
+    import av
+except ImportError:
+    av = None
+
+try:
+    import dxcam
+except ImportError:
+    dxcam = None
+
+try:
+    import xxhash
+    _frame_digest = xxhash.xxh3_64_intdigest
+except ImportError:
+    _frame_digest = zlib.crc32
+
 from ..types import VideoConfig
 
 logger = logging.getLogger(__name__)
 
 
+def _cuda_resize_available() -> bool:
+    """Check for an OpenCV CUDA build with a usable device"""
+    try:
+        return hasattr(cv2.cuda, 'resize') and cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+class _MssCapture:
+    """Portable capture through MSS"""
+    
+    def __init__(self):
+        self._sct = mss.mss()
+    
+    def grab(self, monitor: dict) -> np.ndarray:
+        """BGRA (H, W, 4) view of the screenshot's buffer, without copying it"""
+        screenshot = self._sct.grab(monitor)
+        return np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+            screenshot.height, screenshot.width, 4
+        )
+    
+    def close(self):
+        self._sct.close()
+
+
+class _DxcamOutput:
+    """
+    dxcam camera of one output, shared by every capture of it
+    
+    dxcam.create hands out a single instance per output, and its grab()
+    reports "unchanged since the last grab" by anyone. Captures therefore
+    grab the whole output here and each tracks which frame it last saw.
+    """
+    
+    _outputs: Dict[int, '_DxcamOutput'] = {}
+    _outputs_lock = threading.Lock()
+    
+    def __init__(self, output_index: int):
+        self.output_index = output_index
+        self.camera = dxcam.create(output_idx=output_index, output_color="BGRA")
+        self.lock = threading.Lock()
+        self.users = 0
+        self.frame: Optional[np.ndarray] = None
+        self.generation = 0
+    
+    @classmethod
+    def acquire(cls, output_index: int) -> '_DxcamOutput':
+        with cls._outputs_lock:
+            output = cls._outputs.get(output_index)
+            if output is None:
+                output = cls._outputs[output_index] = cls(output_index)
+            output.users += 1
+            return output
+    
+    def release(self):
+        with self._outputs_lock:
+            self.users -= 1
+            if self.users:
+                return
+            del self._outputs[self.output_index]
+        self.camera.release()
+    
+    def grab(self) -> Tuple[Optional[np.ndarray], int]:
+        """Latest whole-output frame and its generation"""
+        with self.lock:
+            frame = self.camera.grab()
+            if frame is not None:
+                self.frame = frame
+                self.generation += 1
+            return self.frame, self.generation
+
+
+class _DxcamCapture:
+    """Windows capture through DXGI Desktop Duplication (dxcam)"""
+    
+    def __init__(self, output_index: int, origin: Tuple[int, int]):
+        self._output = _DxcamOutput.acquire(output_index)
+        # Regions are given in desktop coordinates, dxcam wants output ones
+        self._origin = origin
+        self._generation = 0
+    
+    def grab(self, monitor: dict) -> Optional[np.ndarray]:
+        """BGRA (H, W, 4) frame, or None when the screen has not changed"""
+        frame, generation = self._output.grab()
+        if frame is None or generation == self._generation:
+            return None
+        self._generation = generation
+        
+        left = monitor['left'] - self._origin[0]
+        top = monitor['top'] - self._origin[1]
+        if (left, top) == (0, 0) and frame.shape[:2] == (monitor['height'], monitor['width']):
+            return frame
+        return np.ascontiguousarray(
+            frame[top:top + monitor['height'], left:left + monitor['width']]
+        )
+    
+    def close(self):
+        self._output.release()
+
+
 class ScreenShare:
     """Screen sharing functionality"""
     
-    def __init__(self, video_config: Optional[VideoConfig] = None):
+    PIXEL_FORMATS = ('bgr', 'bgra')
+    """Frame layouts callbacks can receive"""
+    
+    ENCODINGS = ('raw', 'jpeg', 'h264')
+    """Frame encodings callbacks can receive"""
+    
+    H264_CODECS = ('h264_nvenc', 'libx264')
+    """H.264 encoders tried in order; NVENC when the GPU has one"""
+    
+    BACKENDS = ('auto', 'mss', 'dxcam')
+    """Capture backends; 'auto' picks dxcam on Windows when installed"""
+    
+    FRAME_QUEUE_SIZE = 2
+    """
+    Captured frames awaiting callbacks before the oldest is dropped
+    
+    H.264 capture waits for room instead, as every packet is referenced
+    by the frames after it.
+    """
+    
+    def __init__(
+        self,
+        video_config: Optional[VideoConfig] = None,
+        pixel_format: str = 'bgr',
+        use_cuda: bool = False,
+        encoding: str = 'raw',
+        jpeg_quality: int = 75,
+        skip_unchanged: bool = False,
+        backend: str = 'auto'
+    ):
+        """
+        Args:
+            video_config: Output size and frame rate
+            pixel_format: 'bgr' hands callbacks a strided (H, W, 3) view;
+                'bgra' hands them the contiguous (H, W, 4) capture as is
+            use_cuda: Resize on the GPU when OpenCV has a CUDA device
+            encoding: 'raw' hands callbacks frames in pixel_format; 'jpeg'
+                and 'h264' encode on the capture thread and hand them bytes
+            jpeg_quality: JPEG quality for 'jpeg' encoding
+            skip_unchanged: Skip frames identical to the previous capture,
+                so a static screen costs a hash per frame instead of a
+                resize, encode and dispatch; consumers then get fewer
+                frames than video_config.fps
+            backend: 'mss', or 'dxcam' for DXGI Desktop Duplication on
+                Windows, which reports unchanged screens without a copy;
+                'auto' uses dxcam when available
+        """
         if mss is None or cv2 is None:
             raise ImportError("mss and opencv-python required for screen sharing")
         
+        if pixel_format not in self.PIXEL_FORMATS:
+            raise ValueError(f"Unsupported pixel format: {pixel_format}")
+        
+        if encoding not in self.ENCODINGS:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+        
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported capture backend: {backend}")
+        
+        if backend == 'dxcam' and dxcam is None:
+            raise ImportError("dxcam required for the dxcam capture backend")
+        
+        if encoding == 'h264' and av is None:
+            raise ImportError("av (PyAV) required for H.264 screen encoding")
+        
         self.video_config = video_config or VideoConfig()
+        self.pixel_format = pixel_format
+        self.encoding = encoding
+        self.jpeg_quality = jpeg_quality
+        self.skip_unchanged = skip_unchanged
+        if backend == 'auto':
+            backend = 'dxcam' if dxcam is not None and sys.platform == 'win32' else 'mss'
+        self.backend = backend
+        self.use_cuda = use_cuda and _cuda_resize_available()
+        if self.use_cuda:
+            # Device buffers are reused while the capture size is unchanged
+            self._gpu_src = cv2.cuda_GpuMat()
+            self._gpu_dst = cv2.cuda_GpuMat()
         self.sct = mss.mss()
         self.is_sharing = False
         self.callbacks = []
+        # Hot-path copy read once per dispatched frame
+        self._callbacks: Tuple[Callable[[np.ndarray], None], ...] = ()
+        # One-frame channels of frames() subscribers
+        self._subscribers: Tuple[asyncio.Queue, ...] = ()
+        # Free resize buffers, and how many holders each dispatched one has
+        self._free_buffers = queue.SimpleQueue()
+        self._buffer_refs: Dict[int, int] = {}
+        self.frames_dropped = 0
+        # Whether the dispatcher still drains the capture queue
+        self._dispatching = False
         self.logger = logger
         self.monitor = None
+        self.monitor_index = 1
     
     def add_callback(self, callback):
-        """Add callback for screen frames"""
+        """
+        Add callback for screen frames
+        
+        Resized frames live in buffers that are reused once all callbacks
+        have returned; copy a frame to keep it beyond the call. With an
+        encoding set, callbacks receive bytes instead: a JPEG image, or
+        the H.264 (Annex B) packets of one frame.
+        """
         self.callbacks.append(callback)
+        self._callbacks = tuple(self.callbacks)
     
     def remove_callback(self, callback):
         """Remove callback"""
         if callback in self.callbacks:
             self.callbacks.remove(callback)
+            self._callbacks = tuple(self.callbacks)
+    
+    async def frames(self) -> AsyncIterator[Union[np.ndarray, bytes]]:
+        """
+        Subscribe to captured frames until sharing stops
+        
+        Each subscriber holds at most one pending frame; if it falls
+        behind, the older frame is dropped and counted in frames_dropped.
+        H.264 packets are never dropped: a subscriber that falls behind
+        holds up capture instead. A yielded frame stays valid until the
+        next iteration.
+        """
+        channel = asyncio.Queue(maxsize=1)
+        self._subscribers += (channel,)
+        buffer = None
+        
+        try:
+            while True:
+                item = await channel.get()
+                self._release_buffer(buffer)
+                buffer = None
+                
+                if item is None:
+                    return
+                
+                frame, buffer = item
+                yield frame
+        
+        finally:
+            self._subscribers = tuple(other for other in self._subscribers if other is not channel)
+            self._release_buffer(buffer)
+            while not channel.empty():
+                item = channel.get_nowait()
+                if item is not None:
+                    self._release_buffer(item[1])
+    
+    def _offer(self, channel: asyncio.Queue, item):
+        """Put item on a subscriber channel, dropping its pending frame"""
+        if channel.full():
+            dropped = channel.get_nowait()
+            if dropped is not None:
+                self._release_buffer(dropped[1])
+                self.frames_dropped += 1
+        channel.put_nowait(item)
+    
+    def _release_buffer(self, buffer: Optional[np.ndarray]):
+        """Drop one holder of a resize buffer, recycling it after the last"""
+        if buffer is None:
+            return
+        
+        key = id(buffer)
+        holders = self._buffer_refs.get(key, 1) - 1
+        if holders:
+            self._buffer_refs[key] = holders
+        else:
+            self._buffer_refs.pop(key, None)
+            self._free_buffers.put(buffer)
     
     def list_monitors(self) -> list:
         """List available monitors"""
@@ -63,15 +343,20 @@ class ScreenShare:
     async def start_sharing(
         self, 
         monitor_index: int = 1,
-        region: Optional[Tuple[int, int, int, int]] = None
+        region: Optional[Tuple[int, int, int, int]] = None,
+        capture_size: Optional[Tuple[int, int]] = None
     ) -> bool:
         """
         Start screen sharing
         
         Args:
             monitor_index: Monitor to capture (1 for primary)
-            region: Custom region (left, top, width, height)
-            
+            region: Custom region (left, top, width, height); with the
+                dxcam backend it must lie on monitor_index
+            capture_size: Without region, capture only (width, height)
+                from the monitor's top-left corner; matching the video
+                config size skips per-frame resizing
+        
         Returns:
             True if sharing started successfully
         """
@@ -92,7 +377,16 @@ class ScreenShare:
                 if monitor_index >= len(self.sct.monitors):
                     raise ValueError(f"Monitor {monitor_index} not found")
                 self.monitor = self.sct.monitors[monitor_index]
+                
+                if capture_size:
+                    self.monitor = {
+                        'left': self.monitor['left'],
+                        'top': self.monitor['top'],
+                        'width': min(capture_size[0], self.monitor['width']),
+                        'height': min(capture_size[1], self.monitor['height'])
+                    }
             
+            self.monitor_index = monitor_index
             self.is_sharing = True
             
             # Start capture loop
@@ -100,7 +394,7 @@ class ScreenShare:
             
             self.logger.info(f"Screen sharing started on monitor {monitor_index}")
             return True
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to start screen sharing: {e}")
             return False
@@ -111,38 +405,319 @@ class ScreenShare:
         self.logger.info("Screen sharing stopped")
     
     async def _capture_loop(self):
-        """Main capture loop"""
-        fps = self.video_config.fps
-        frame_delay = 1.0 / fps
+        """Run the capture thread and dispatch its frames to subscribers and callbacks"""
+        loop = asyncio.get_event_loop()
+        frames = asyncio.Queue(maxsize=self.FRAME_QUEUE_SIZE)
+        # Free resize buffers; at most queued + held + capturing exist
+        buffers = self._free_buffers
+        log_error = self.logger.error
         
-        while self.is_sharing:
-            try:
-                # Capture screen
-                screenshot = self.sct.grab(self.monitor)
-                
-                # Convert to numpy array
-                frame = np.array(screenshot)
+        # Grabbing blocks in the OS, so it runs on its own thread and the
+        # event loop only sees finished frames
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tgcaller-screen")
+        self._dispatching = True
+        producer = loop.run_in_executor(
+            executor, self._produce_frames, loop, frames, buffers
+        )
+        
+        # Encoded streams cannot lose packets, so subscribers are waited on
+        lossless = self.encoding == 'h264'
+        ended = False
+        
+        try:
+            while True:
+                item = await frames.get()
+                if item is None:
+                    break
                 
-                # Convert BGRA to BGR
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+                frame, buffer = item
                 
-                # Resize if needed
-                target_size = (self.video_config.width, self.video_config.height)
-                if frame.shape[:2][::-1] != target_size:
-                    frame = cv2.resize(frame, target_size)
+                # Subscribers consume in their own tasks; each one holds the
+                # buffer until it moves on to its next frame
+                subscribers = self._subscribers
+                if buffer is not None:
+                    self._buffer_refs[id(buffer)] = len(subscribers) + 1
+                for channel in subscribers:
+                    if lossless:
+                        await channel.put(item)
+                    else:
+                        self._offer(channel, item)
                 
                 # Call callbacks
-                for callback in self.callbacks:
+                for callback in self._callbacks:
                     try:
                         callback(frame)
                     except Exception as e:
-                        self.logger.error(f"Error in screen share callback: {e}")
+                        log_error(f"Error in screen share callback: {e}")
+                
+                self._release_buffer(buffer)
+            
+            await producer
+            
+            # End every subscription after its pending packets
+            if lossless:
+                for channel in self._subscribers:
+                    await channel.put(None)
+                ended = True
+        
+        except Exception as e:
+            self.logger.error(f"Error in screen capture: {e}")
+        
+        finally:
+            self._dispatching = False
+            executor.shutdown(wait=False)
+            
+            # End every subscription
+            if not ended:
+                for channel in self._subscribers:
+                    self._offer(channel, None)
+    
+    @staticmethod
+    def _push_frame(
+        frames: asyncio.Queue,
+        buffers: queue.SimpleQueue,
+        item: Optional[Tuple[Union[np.ndarray, bytes], Optional[np.ndarray]]]
+    ):
+        """Queue (frame, buffer) on the loop thread, dropping the oldest when full"""
+        if frames.full():
+            _, dropped = frames.get_nowait()
+            if dropped is not None:
+                buffers.put(dropped)
+        frames.put_nowait(item)
+    
+    def _queue_frame(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        frames: asyncio.Queue,
+        buffers: queue.SimpleQueue,
+        item: Optional[Tuple[Union[np.ndarray, bytes], Optional[np.ndarray]]]
+    ):
+        """
+        Hand item to the dispatcher; called on the capture thread
+        
+        Raw and JPEG frames drop the oldest queued frame when the queue is
+        full; H.264 packets block until there is room.
+        
+        Args:
+            loop: Event loop running the dispatcher
+            frames: Queue the dispatcher reads
+            buffers: Free resize buffers, which dropped frames return to
+            item: Frame or packet with its buffer, or None to end the stream
+        """
+        if self.encoding != 'h264':
+            loop.call_soon_threadsafe(self._push_frame, frames, buffers, item)
+            return
+        
+        future = asyncio.run_coroutine_threadsafe(frames.put(item), loop)
+        while self._dispatching:
+            try:
+                future.result(timeout=0.1)
+                return
+            except concurrent.futures.TimeoutError:
+                continue
+        future.cancel()
+    
+    def _create_encoder(self, width: int, height: int, fps: int) -> Optional[Callable[[Optional[np.ndarray], int], bytes]]:
+        """
+        Build the encoder for the configured encoding
+        
+        Encoders take a frame and its capture tick, which H.264 uses as
+        the presentation timestamp. The H.264 encoder returns its buffered
+        packets when called with None.
+        
+        Args:
+            width: Frame width
+            height: Frame height
+            fps: Capture frame rate
+        
+        Returns:
+            Encoder turning (H, W, 4) BGRA frames into bytes, or None for
+            raw frames
+        """
+        if self.encoding == 'jpeg':
+            quality = self.jpeg_quality
+            
+            # libjpeg-turbo takes BGRA directly
+            if turbojpeg is not None:
+                jpeg = turbojpeg.TurboJPEG()
+                encode_jpeg = partial(jpeg.encode, quality=quality, pixel_format=turbojpeg.TJPF_BGRA)
+                return lambda frame, tick: encode_jpeg(frame)
+            
+            params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+            return lambda frame, tick: cv2.imencode(
+                '.jpg', cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR), params
+            )[1].tobytes()
+        
+        if self.encoding == 'h264':
+            for name in self.H264_CODECS:
+                try:
+                    context = av.CodecContext.create(name, 'w')
+                    context.width = width
+                    context.height = height
+                    context.pix_fmt = 'yuv420p'
+                    context.framerate = Fraction(fps)
+                    context.time_base = Fraction(1, fps)
+                    context.open()
+                    break
+                except Exception as e:
+                    self.logger.debug("H.264 encoder %s unavailable: %s", name, e)
+            else:
+                raise RuntimeError("No usable H.264 encoder")
+            
+            def encode(frame: Optional[np.ndarray], tick: int) -> bytes:
+                if frame is None:
+                    # Flush the frames held back for reordering
+                    return b''.join(bytes(packet) for packet in context.encode(None))
                 
-                await asyncio.sleep(frame_delay)
+                video_frame = av.VideoFrame.from_ndarray(frame, format='bgra')
+                video_frame = video_frame.reformat(format='yuv420p')
+                # time_base is one capture tick, so skipped frames keep
+                # their place on the timeline
+                video_frame.pts = tick
+                return b''.join(bytes(packet) for packet in context.encode(video_frame))
+            
+            return encode
+        
+        return None
+    
+    def _open_capture(self):
+        """Open the capture backend; called on the capture thread"""
+        if self.backend == 'dxcam':
+            output = self.sct.monitors[self.monitor_index]
+            return _DxcamCapture(self.monitor_index - 1, (output['left'], output['top']))
+        
+        # MSS handles belong to the thread that opened them
+        return _MssCapture()
+    
+    def _process_frame(
+        self,
+        frame: np.ndarray,
+        tick: int,
+        encoder: Optional[Callable[[Optional[np.ndarray], int], bytes]],
+        target_size: Tuple[int, int],
+        loop: asyncio.AbstractEventLoop,
+        frames: asyncio.Queue,
+        buffers: queue.SimpleQueue
+    ):
+        """Capture thread: resize and encode one BGRA frame and queue it for callbacks"""
+        width, height = target_size
+        
+        # Resize if needed, into a recycled buffer
+        buffer = None
+        if frame.shape[1] != width or frame.shape[0] != height:
+            try:
+                buffer = buffers.get_nowait()
+            except queue.Empty:
+                buffer = np.empty((height, width, 4), dtype=np.uint8)
+            
+            if self.use_cuda:
+                self._gpu_src.upload(frame)
+                cv2.cuda.resize(self._gpu_src, target_size, self._gpu_dst)
+                self._gpu_dst.download(buffer)
+            else:
+                cv2.resize(frame, target_size, dst=buffer)
+            frame = buffer
+        
+        if encoder is not None:
+            # Encoded bytes own their data; recycle the buffer now
+            frame = encoder(frame, tick)
+            if buffer is not None:
+                buffers.put(buffer)
+                buffer = None
+        elif self.pixel_format == 'bgr':
+            # Drop alpha by slicing; callbacks get a strided BGR view
+            frame = frame[:, :, :3]
+        
+        # Encoders may buffer a frame without emitting packets
+        if encoder is None or frame:
+            self._queue_frame(loop, frames, buffers, (frame, buffer))
+    
+    def _produce_frames(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        frames: asyncio.Queue,
+        buffers: queue.SimpleQueue
+    ):
+        """Capture thread: grab frames until sharing stops"""
+        fps = self.video_config.fps
+        frame_delay = 1.0 / fps
+        
+        # Fixed for the whole capture
+        width, height = self.video_config.width, self.video_config.height
+        target_size = (width, height)
+        
+        deadline = start = time.monotonic()
+        last_tick = -1
+        last_digest = None
+        last_frame = None
+        encoder = None
+        
+        try:
+            encoder = self._create_encoder(width, height, fps)
+            
+            capture = self._open_capture()
+            try:
+                while self.is_sharing:
+                    try:
+                        # Capture screen; None when the backend saw no change
+                        frame = capture.grab(self.monitor)
+                        
+                        # Identical pixels need no resize, encode or dispatch
+                        changed = frame is not None
+                        if changed:
+                            last_frame = frame
+                            if self.skip_unchanged:
+                                digest = _frame_digest(np.ascontiguousarray(frame))
+                                changed = digest != last_digest
+                                last_digest = digest
+                        elif not self.skip_unchanged:
+                            # Keep the frame rate steady on a static screen
+                            frame = last_frame
+                            changed = frame is not None
+                        
+                        if changed:
+                            # Ticks count frame periods since the start, so
+                            # skipped and late frames leave gaps, not drift
+                            tick = max(round((time.monotonic() - start) * fps), last_tick + 1)
+                            last_tick = tick
+                            self._process_frame(
+                                frame, tick, encoder, target_size, loop, frames, buffers
+                            )
+                        
+                        # Sleep until the next frame deadline rather than a fixed
+                        # interval, so capture time does not stretch the period
+                        deadline += frame_delay
+                        delay = deadline - time.monotonic()
+                        if delay > 0:
+                            time.sleep(delay)
+                        elif delay < -frame_delay:
+                            # More than a frame behind; drop the backlog
+                            deadline = time.monotonic()
+                    
+                    except Exception as e:
+                        self.logger.error(f"Error in screen capture: {e}")
+                        time.sleep(1)
+                        deadline = time.monotonic()
+            
+            finally:
+                capture.close()
+        
+        finally:
+            try:
+                # Deliver what the H.264 encoder still holds
+                if encoder is not None and self.encoding == 'h264':
+                    try:
+                        packets = encoder(None, 0)
+                    except Exception as e:
+                        self.logger.error(f"Error flushing screen encoder: {e}")
+                        packets = b''
+                    if packets:
+                        self._queue_frame(loop, frames, buffers, (packets, None))
                 
-            except Exception as e:
-                self.logger.error(f"Error in screen capture: {e}")
-                await asyncio.sleep(1)
+                # Wake the dispatcher so it can finish
+                self._queue_frame(loop, frames, buffers, None)
+            except RuntimeError:
+                pass  # Event loop already closed
 
 
 class ScreenShareStreamer:
@@ -153,6 +728,7 @@ class ScreenShareStreamer:
         self.chat_id = chat_id
         self.screen_share = None
         self.is_streaming = False
+        self._stream_task: Optional[asyncio.Task] = None
     
     async def start_streaming(
         self,
@@ -168,16 +744,16 @@ class ScreenShareStreamer:
             
             # Setup screen sharing
             self.screen_share = ScreenShare(video_config)
-            self.screen_share.add_callback(self._stream_frame)
             
             # Start sharing
             success = await self.screen_share.start_sharing(monitor_index, region)
             if success:
                 self.is_streaming = True
+                self._stream_task = asyncio.create_task(self._stream_loop(self.screen_share))
                 logger.info(f"Started screen sharing to chat {self.chat_id}")
             
             return success
-            
+        
         except Exception as e:
             logger.error(f"Failed to start screen streaming: {e}")
             return False
@@ -187,15 +763,24 @@ class ScreenShareStreamer:
         try:
             self.is_streaming = False
             
+            if self._stream_task:
+                self._stream_task.cancel()
+                self._stream_task = None
+            
             if self.screen_share:
                 await self.screen_share.stop_sharing()
                 self.screen_share = None
             
             logger.info(f"Stopped screen streaming to chat {self.chat_id}")
-            
+        
         except Exception as e:
             logger.error(f"Error stopping screen streaming: {e}")
     
+    async def _stream_loop(self, screen_share: ScreenShare):
+        """Stream frames from the subscription, at the pace the call takes them"""
+        async for frame in screen_share.frames():
+            self._stream_frame(frame)
+    
     def _stream_frame(self, frame: np.ndarray):
         """Stream frame to call"""
         if self.is_streaming:
@@ -204,53 +789,100 @@ class ScreenShareStreamer:
             pass
 
 
+def _enum_windows_win32() -> list:
+    """Visible, titled top-level windows via EnumWindows, one rect call each"""
+    import ctypes
+    from ctypes import wintypes
+    
+    user32 = ctypes.windll.user32
+    title = ctypes.create_unicode_buffer(512)
+    rect = wintypes.RECT()
+    windows = []
+    
+    def visit(hwnd, _):
+        if user32.IsWindowVisible(hwnd) and user32.GetWindowTextW(hwnd, title, len(title)):
+            if user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+                windows.append({
+                    'title': title.value,
+                    'left': rect.left,
+                    'top': rect.top,
+                    'width': rect.right - rect.left,
+                    'height': rect.bottom - rect.top
+                })
+        return True
+    
+    user32.EnumWindows(ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)(visit), 0)
+    return windows
+
+
 class WindowCapture:
     """Capture specific application window"""
     
+    LIST_TTL = 0.5
+    """Seconds a window listing is reused before enumerating again"""
+    
     def __init__(self):
         self.logger = logger
+        self._windows_cache: Optional[Tuple[float, list]] = None
     
     def list_windows(self) -> list:
         """List available windows"""
+        now = time.monotonic()
+        if self._windows_cache is not None and now - self._windows_cache[0] < self.LIST_TTL:
+            return list(self._windows_cache[1])
+        
         try:
-            import pygetwindow as gw
-            windows = []
-            
-            for window in gw.getAllWindows():
-                if window.title and window.visible:
-                    windows.append({
-                        'title': window.title,
-                        'left': window.left,
-                        'top': window.top,
-                        'width': window.width,
-                        'height': window.height
-                    })
-            
-            return windows
+            windows = self._enumerate_windows()
         except ImportError:
             self.logger.error("pygetwindow required for window capture")
             return []
         except Exception as e:
             self.logger.error(f"Error listing windows: {e}")
             return []
+        
+        self._windows_cache = (now, windows)
+        return list(windows)
+    
+    @staticmethod
+    def _enumerate_windows() -> list:
+        """Enumerate visible, titled windows"""
+        # Win32 directly, rather than pygetwindow's per-property calls
+        if sys.platform == 'win32':
+            return _enum_windows_win32()
+        
+        import pygetwindow as gw
+        windows = []
+        
+        for window in gw.getAllWindows():
+            if window.title and window.visible:
+                windows.append({
+                    'title': window.title,
+                    'left': window.left,
+                    'top': window.top,
+                    'width': window.width,
+                    'height': window.height
+                })
+        
+        return windows
     
     async def capture_window(self, window_title: str) -> Optional[np.ndarray]:
         """Capture specific window"""
         try:
-            import pygetwindow as gw
-            
-            windows = gw.getWindowsWithTitle(window_title)
-            if not windows:
+            # Match like pygetwindow.getWindowsWithTitle, over the cached listing
+            wanted = window_title.upper()
+            window = next(
+                (window for window in self.list_windows() if wanted in window['title'].upper()),
+                None
+            )
+            if window is None:
                 return None
             
-            window = windows[0]
-            
             # Get window region
             region = {
-                'left': window.left,
-                'top': window.top,
-                'width': window.width,
-                'height': window.height
+                'left': window['left'],
+                'top': window['top'],
+                'width': window['width'],
+                'height': window['height']
             }
             
             # Capture using mss
@@ -258,7 +890,7 @@ class WindowCapture:
                 screenshot = sct.grab(region)
                 frame = np.array(screenshot)
                 return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
-                
+        
         except Exception as e:
             self.logger.error(f"Error capturing window: {e}")
             return None
\ No newline at end of file
@@ -4,10 +4,10 @@ Whisper Transcription - Real-time speech to text
 
 import asyncio
 import logging
+import threading
 import numpy as np
-from typing import Optional, Callable, List, Dict, Any
-import tempfile
-import os
+from functools import partial
+from typing import Optional, Callable, List, Dict, Any, Tuple
 
 try:
     import whisper
@@ -16,32 +16,191 @@ except ImportError:
     whisper = None
     torch = None
 
+try:
+    from faster_whisper import WhisperModel as FasterWhisperModel
+    import ctranslate2
+except ImportError:
+    FasterWhisperModel = None
+    ctranslate2 = None
+
+try:
+    import soxr
+except ImportError:
+    soxr = None
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
 logger = logging.getLogger(__name__)
 
 
+def _default_device() -> str:
+    """Device Whisper models run on when none is given"""
+    # faster-whisper is preferred when installed and runs on CTranslate2,
+    # which finds CUDA devices without torch
+    if FasterWhisperModel is not None:
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    return "cuda" if torch and torch.cuda.is_available() else "cpu"
+
+
+def _resample_linear(audio: np.ndarray, in_rate: int, out_rate: int) -> np.ndarray:
+    """Resample float32 audio by linear interpolation (fallback without soxr)"""
+    samples = len(audio) * out_rate // in_rate
+    positions = np.arange(samples) * (in_rate / out_rate)
+    return np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+
+
 class WhisperTranscription:
-    """Real-time speech transcription using OpenAI Whisper"""
+    """
+    Real-time speech transcription using OpenAI Whisper
+    
+    Runs on faster-whisper (CTranslate2) when it is installed, with
+    quantized weights per compute_type, and on openai-whisper otherwise.
+    """
+    
+    PROMPT_CHARS = 200
+    """Characters of committed text passed as prompt to the next window"""
+    
+    INGEST_SECONDS = 0.2
+    """Audio accumulated from small writes before it is downmixed, resampled and buffered"""
+    
+    VAD_FRAME_MS = 30
+    """Frame length the voice activity detector classifies"""
+    
+    VAD_SPEECH_RATIO = 0.1
+    """Fraction of new frames that must hold speech to run Whisper"""
+    
+    FORCE_COMMIT_MARGIN = 1.5
+    """Seconds of free ring space below which a window is committed unconfirmed"""
     
     def __init__(
         self, 
         model_name: str = "base",
         language: Optional[str] = None,
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        model: Any = None,
+        model_lock: Optional[threading.Lock] = None,
+        vad_aggressiveness: Optional[int] = 2
     ):
-        if whisper is None:
-            raise ImportError("openai-whisper is required for transcription")
+        if whisper is None and FasterWhisperModel is None:
+            raise ImportError("openai-whisper or faster-whisper is required for transcription")
         
         self.model_name = model_name
         self.language = language
-        self.device = device or ("cuda" if torch and torch.cuda.is_available() else "cpu")
+        self.device = device or _default_device()
+        # faster-whisper weight type: "float16", "int8_float16" or "int8"
+        self.compute_type = compute_type or ("float16" if self.device == "cuda" else "int8")
+        self.use_faster_whisper = FasterWhisperModel is not None
+        # WebRTC VAD (0-3, None disables) gating Whisper on silent audio
+        self._vad = (
+            webrtcvad.Vad(vad_aggressiveness)
+            if webrtcvad is not None and vad_aggressiveness is not None
+            else None
+        )
         
-        self.model = None
+        # An already loaded model may be shared between transcribers, together
+        # with the lock serialising inference on it
+        self.model = model
+        self.model_lock = model_lock or threading.Lock()
         self.is_transcribing = False
-        self.audio_buffer = []
         self.buffer_duration = 5.0  # seconds
         self.sample_rate = 16000  # Whisper expects 16kHz
         self.callbacks = []
+        # Hot-path copy read once per committed result
+        self._callbacks: Tuple[Callable[[Dict[str, Any]], None], ...] = ()
         self.logger = logger
+        
+        # Ring of up to buffer_duration seconds of uncommitted mono float32
+        # audio, written from the audio thread and read by the transcription
+        # loop; committed audio is dropped from the oldest end
+        self._buffer_lock = threading.Lock()
+        # Guards the ingest batch, filled by the audio thread and flushed by
+        # the transcription loop; taken before _buffer_lock
+        self._ingest_lock = threading.Lock()
+        # Resamplers to sample_rate keyed by input rate, reset with the ring
+        self._resamplers: Dict[int, Callable[[np.ndarray], np.ndarray]] = {}
+        self._reset_buffer()
+    
+    def _reset_buffer(self):
+        """(Re)allocate an empty audio ring for buffer_duration seconds"""
+        with self._ingest_lock, self._buffer_lock:
+            self._ring = np.zeros(int(self.buffer_duration * self.sample_rate), dtype=np.float32)
+            self._write_pos = 0
+            self._filled = 0
+            # Samples appended since the reset, locating the ring in the stream
+            self._written = 0
+            self._resamplers.clear()
+            
+            # Scratch batching incoming writes at their own rate and layout
+            self._ingest: Optional[np.ndarray] = None
+            self._ingest_rate = self.sample_rate
+            self._ingest_samples = 0
+        
+        # Text committed once two consecutive windows agreed on it, and the
+        # uncommitted segment texts of the latest window
+        self._committed_text = ""
+        self._hypothesis: List[str] = []
+        # Stream position of the last transcribed window's end
+        self._transcribed_until = 0
+    
+    def _resample(self, audio: np.ndarray, in_rate: int) -> np.ndarray:
+        """Resample mono float32 audio from in_rate to sample_rate"""
+        resampler = self._resamplers.get(in_rate)
+        if resampler is None:
+            # A streaming soxr resampler keeps filter state between chunks
+            if soxr is not None:
+                resampler = soxr.ResampleStream(in_rate, self.sample_rate, 1, dtype='float32').resample_chunk
+            else:
+                resampler = partial(_resample_linear, in_rate=in_rate, out_rate=self.sample_rate)
+            self._resamplers[in_rate] = resampler
+        return resampler(audio)
+    
+    def _append_samples(self, samples: np.ndarray):
+        """Copy samples into the ring, overwriting the oldest"""
+        count = samples.shape[0]
+        
+        with self._buffer_lock:
+            ring = self._ring
+            capacity = ring.shape[0]
+            
+            self._written += count
+            
+            if count >= capacity:
+                ring[:] = samples[-capacity:]
+                self._write_pos = 0
+                self._filled = capacity
+                return
+            
+            # Wrap in at most two slice copies
+            start = self._write_pos
+            first = min(count, capacity - start)
+            ring[start:start + first] = samples[:first]
+            ring[:count - first] = samples[first:]
+            
+            self._write_pos = (start + count) % capacity
+            self._filled = min(self._filled + count, capacity)
+    
+    def _buffered_audio(self) -> Tuple[np.ndarray, int]:
+        """Copy of the buffered audio, oldest sample first, and its stream position"""
+        with self._buffer_lock:
+            capacity = self._ring.shape[0]
+            start = (self._write_pos - self._filled) % capacity
+            end = start + self._filled
+            
+            if end <= capacity:
+                audio = self._ring[start:end].copy()
+            else:
+                audio = np.concatenate((self._ring[start:], self._ring[:end - capacity]))
+            
+            return audio, self._written - self._filled
+    
+    def _drop_until(self, position: int):
+        """Drop buffered audio before stream position"""
+        with self._buffer_lock:
+            self._filled = max(0, min(self._filled, self._written - position))
     
     async def load_model(self) -> bool:
         """Load Whisper model"""
@@ -50,14 +209,21 @@ class WhisperTranscription:
             
             # Load model in thread to avoid blocking
             loop = asyncio.get_event_loop()
-            self.model = await loop.run_in_executor(
-                None,
-                lambda: whisper.load_model(self.model_name, device=self.device)
-            )
+            if self.use_faster_whisper:
+                load = partial(
+                    FasterWhisperModel,
+                    self.model_name,
+                    device=self.device,
+                    compute_type=self.compute_type
+                )
+            else:
+                load = partial(whisper.load_model, self.model_name, device=self.device)
+            
+            self.model = await loop.run_in_executor(None, load)
             
             self.logger.info("Whisper model loaded successfully")
             return True
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to load Whisper model: {e}")
             return False
@@ -65,14 +231,26 @@ class WhisperTranscription:
     def add_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """Add transcription callback"""
         self.callbacks.append(callback)
+        self._callbacks = tuple(self.callbacks)
     
     def remove_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """Remove transcription callback"""
         if callback in self.callbacks:
             self.callbacks.remove(callback)
+            self._callbacks = tuple(self.callbacks)
     
-    async def start_transcription(self) -> bool:
-        """Start real-time transcription"""
+    async def start_transcription(self, run_loop: bool = True) -> bool:
+        """
+        Start real-time transcription
+        
+        Args:
+            run_loop: Start the transcription loop; when False the caller
+                drives _next_window and _finish_window instead, as
+                TranscriptionManager does to schedule all calls together
+        
+        Returns:
+            True if transcription is running
+        """
         if self.is_transcribing:
             self.logger.warning("Transcription already running")
             return True
@@ -84,14 +262,15 @@ class WhisperTranscription:
         
         try:
             self.is_transcribing = True
-            self.audio_buffer = []
+            self._reset_buffer()
             
             # Start transcription loop
-            asyncio.create_task(self._transcription_loop())
+            if run_loop:
+                asyncio.create_task(self._transcription_loop())
             
             self.logger.info("Started real-time transcription")
             return True
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to start transcription: {e}")
             return False
@@ -99,46 +278,89 @@ class WhisperTranscription:
     async def stop_transcription(self):
         """Stop transcription"""
         self.is_transcribing = False
-        self.audio_buffer = []
+        self._reset_buffer()
         self.logger.info("Stopped transcription")
     
-    def add_audio_data(self, audio_data: np.ndarray):
-        """Add audio data for transcription"""
+    def add_audio_data(self, audio_data: np.ndarray, sample_rate: Optional[int] = None):
+        """
+        Add audio data captured at sample_rate (defaults to 16kHz) for transcription
+        
+        Small writes are copied into a batch and reach the transcription
+        window once INGEST_SECONDS of audio have accumulated, or when the
+        next window is taken.
+        """
         if not self.is_transcribing:
             return
         
         try:
-            # Convert to 16kHz mono if needed
-            if len(audio_data.shape) > 1:
-                audio_data = np.mean(audio_data, axis=1)  # Convert to mono
-            
-            # Resample to 16kHz if needed (simplified)
-            # In production, use proper resampling
-            
-            self.audio_buffer.extend(audio_data.tolist())
-            
-            # Keep buffer size manageable
-            max_buffer_size = int(self.buffer_duration * self.sample_rate)
-            if len(self.audio_buffer) > max_buffer_size:
-                self.audio_buffer = self.audio_buffer[-max_buffer_size:]
-                
+            with self._ingest_lock:
+                self._ingest_audio(audio_data, sample_rate)
+        
         except Exception as e:
             self.logger.error(f"Error adding audio data: {e}")
     
+    def _ingest_audio(self, audio_data: np.ndarray, sample_rate: Optional[int]):
+        """add_audio_data body, called with _ingest_lock held"""
+        rate = sample_rate or self.sample_rate
+        scratch = self._ingest
+        
+        # A new rate or channel layout starts a new batch
+        if scratch is None or rate != self._ingest_rate or scratch.shape[1:] != audio_data.shape[1:]:
+            self._flush_ingest()
+            scratch = self._ingest = np.empty(
+                (int(rate * self.INGEST_SECONDS),) + audio_data.shape[1:],
+                dtype=np.float32
+            )
+            self._ingest_rate = rate
+        
+        count = len(audio_data)
+        if self._ingest_samples + count > len(scratch):
+            self._flush_ingest()
+            
+            # Large writes are already worth buffering on their own
+            if count >= len(scratch):
+                self._buffer_audio(audio_data, rate)
+                return
+        
+        # Copy, as callers may reuse their buffers
+        scratch[self._ingest_samples:self._ingest_samples + count] = audio_data
+        self._ingest_samples += count
+        
+        if self._ingest_samples == len(scratch):
+            self._flush_ingest()
+    
+    def _flush_ingest(self):
+        """Buffer the batched writes, called with _ingest_lock held"""
+        count = self._ingest_samples
+        self._ingest_samples = 0
+        
+        if count and self._ingest is not None:
+            self._buffer_audio(self._ingest[:count], self._ingest_rate)
+    
+    def _buffer_audio(self, audio_data: np.ndarray, sample_rate: int):
+        """Downmix and resample audio_data once, then copy it into the ring"""
+        # Convert to mono float32
+        if len(audio_data.shape) > 1:
+            audio_data = np.mean(audio_data, axis=1, dtype=np.float32)
+        else:
+            audio_data = np.asarray(audio_data, dtype=np.float32)
+        
+        # Resample to 16kHz
+        if sample_rate != self.sample_rate:
+            audio_data = self._resample(audio_data, sample_rate)
+        
+        self._append_samples(audio_data)
+    
     async def _transcription_loop(self):
         """Main transcription loop"""
         while self.is_transcribing:
             try:
-                if len(self.audio_buffer) < self.sample_rate:  # At least 1 second
+                window = self._next_window()
+                if window is None:
                     await asyncio.sleep(0.5)
                     continue
                 
-                # Get audio chunk
-                audio_chunk = np.array(self.audio_buffer[-int(self.buffer_duration * self.sample_rate):])
-                
-                # Normalize audio
-                if np.max(np.abs(audio_chunk)) > 0:
-                    audio_chunk = audio_chunk / np.max(np.abs(audio_chunk))
+                audio_chunk, position = window
                 
                 # Transcribe in thread
                 loop = asyncio.get_event_loop()
@@ -148,70 +370,212 @@ class WhisperTranscription:
                     audio_chunk
                 )
                 
-                if result and result['text'].strip():
-                    # Call callbacks
-                    for callback in self.callbacks:
-                        try:
-                            callback(result)
-                        except Exception as e:
-                            self.logger.error(f"Error in transcription callback: {e}")
+                self._finish_window(result, position)
                 
                 await asyncio.sleep(1.0)  # Transcribe every second
-                
+            
             except Exception as e:
                 self.logger.error(f"Error in transcription loop: {e}")
                 await asyncio.sleep(1.0)
     
+    def _next_window(self) -> Optional[Tuple[np.ndarray, int]]:
+        """Normalized uncommitted audio and its stream position, or None if not due"""
+        # A partial batch would otherwise wait for more audio, e.g. the last
+        # words before the speaker falls silent
+        with self._ingest_lock:
+            self._flush_ingest()
+        
+        if self._filled < self.sample_rate:  # At least 1 second
+            return None
+        
+        # Without new audio the window, and so its transcription, is
+        # unchanged; e.g. while the source is muted or stalled
+        if self._written == self._transcribed_until:
+            return None
+        
+        # Get uncommitted audio
+        audio_chunk, position = self._buffered_audio()
+        end = position + len(audio_chunk)
+        fresh = end - max(self._transcribed_until, position)
+        self._transcribed_until = end
+        
+        peak = np.max(np.abs(audio_chunk))
+        
+        # Skip silence, unless a pending hypothesis still needs a second
+        # pass to be confirmed
+        if not self._hypothesis and not self._has_speech(audio_chunk[-fresh:], peak):
+            return None
+        
+        # Normalize audio
+        if peak > 0:
+            audio_chunk /= peak
+        
+        return audio_chunk, position
+    
+    def _has_speech(self, audio: np.ndarray, peak: float) -> bool:
+        """Whether enough VAD frames of audio hold speech (True without a VAD)"""
+        if self._vad is None:
+            return True
+        
+        frame_samples = self.sample_rate * self.VAD_FRAME_MS // 1000
+        count = len(audio) // frame_samples
+        if not count:
+            return False
+        
+        # The VAD takes 16-bit PCM; audio is either full-scale float or
+        # int16-range samples widened to float
+        scale = 32767.0 if peak <= 1.0 else 1.0
+        pcm = np.clip(audio[:count * frame_samples] * scale, -32768, 32767).astype(np.int16)
+        
+        frame_bytes = frame_samples * 2
+        data = pcm.tobytes()
+        speech = sum(
+            self._vad.is_speech(data[i:i + frame_bytes], self.sample_rate)
+            for i in range(0, len(data), frame_bytes)
+        )
+        return speech >= count * self.VAD_SPEECH_RATIO
+    
+    def _finish_window(self, result: Optional[Dict[str, Any]], position: int):
+        """Commit a window's transcription and pass new text to callbacks"""
+        if not result or not self.is_transcribing:
+            return
+        
+        result = self._commit_stable(result, position)
+        
+        if result:
+            # Call callbacks
+            for callback in self._callbacks:
+                try:
+                    callback(result)
+                except Exception as e:
+                    self.logger.error(f"Error in transcription callback: {e}")
+    
+    def _commit_stable(self, result: Dict[str, Any], position: int) -> Optional[Dict[str, Any]]:
+        """
+        Commit the leading segments this window shares with the previous one
+        
+        Committed audio is dropped from the ring, so the next window starts
+        right after it. A window close to filling the ring is committed whole.
+        
+        Args:
+            result: Transcription of the window
+            position: Stream position of the window's first sample
+        
+        Returns:
+            Result holding only the newly committed segments, or None when
+            nothing became stable
+        """
+        segments = result['segments']
+        texts = [segment['text'].strip() for segment in segments]
+        
+        # LocalAgreement: the longest prefix both windows transcribed alike
+        stable = 0
+        for previous, current in zip(self._hypothesis, texts):
+            if previous != current:
+                break
+            stable += 1
+        
+        # Once the window nearly fills the ring, the audio written before the
+        # next window would overwrite samples the hypothesis still covers;
+        # commit all of it rather than lose that text unconfirmed
+        capacity = self._ring.shape[0]
+        window = self._transcribed_until - position
+        if window >= capacity - int(self.FORCE_COMMIT_MARGIN * self.sample_rate):
+            stable = len(texts)
+            if not stable:
+                self._drop_until(self._transcribed_until)
+        
+        self._hypothesis = texts[stable:]
+        if not stable:
+            return None
+        
+        committed = segments[:stable]
+        text = ''.join(segment['text'] for segment in committed)
+        self._committed_text += text
+        self._drop_until(position + int(committed[-1]['end'] * self.sample_rate))
+        
+        # Stripped texts are at hand; blank commits reach no callback
+        if not any(texts[:stable]):
+            return None
+        
+        return {
+            'text': text,
+            'language': result['language'],
+            'segments': committed,
+            'confidence': self._calculate_confidence({'segments': committed})
+        }
+    
     def _transcribe_chunk(self, audio_chunk: np.ndarray) -> Optional[Dict[str, Any]]:
         """Transcribe audio chunk"""
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                temp_path = temp_file.name
-            
-            # Save audio to temporary file
-            import soundfile as sf
-            sf.write(temp_path, audio_chunk, self.sample_rate)
+            # Whisper takes 16kHz float32 samples directly, skipping the
+            # WAV write and ffmpeg decode of a file round-trip; the committed
+            # tail stands in for the audio already dropped as context
+            result = self._run_model(
+                audio_chunk.astype(np.float32, copy=False),
+                initial_prompt=self._committed_text[-self.PROMPT_CHARS:] or None
+            )
             
-            try:
-                # Transcribe
-                result = self.model.transcribe(
-                    temp_path,
-                    language=self.language,
-                    fp16=False
-                )
-                
-                return {
-                    'text': result['text'],
-                    'language': result['language'],
-                    'segments': result.get('segments', []),
-                    'confidence': self._calculate_confidence(result)
-                }
-                
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-                    
+            # Confidence is scored on the committed segments only
+            return {
+                'text': result['text'],
+                'language': result['language'],
+                'segments': result.get('segments', [])
+            }
+        
         except Exception as e:
             self.logger.error(f"Error transcribing chunk: {e}")
             return None
     
+    def _run_model(self, audio, initial_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Transcribe audio (array or file path) into an openai-whisper style result"""
+        with self.model_lock:
+            return self._run_model_locked(audio, initial_prompt)
+    
+    def _run_model_locked(self, audio, initial_prompt: Optional[str]) -> Dict[str, Any]:
+        """_run_model body, called with model_lock held"""
+        if not self.use_faster_whisper:
+            return self.model.transcribe(
+                audio,
+                language=self.language,
+                initial_prompt=initial_prompt,
+                fp16=self.device == "cuda"
+            )
+        
+        # faster-whisper yields segments lazily; decoding happens while iterating
+        segments, info = self.model.transcribe(
+            audio,
+            language=self.language,
+            initial_prompt=initial_prompt
+        )
+        segments = [
+            {
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text,
+                'avg_logprob': segment.avg_logprob,
+            }
+            for segment in segments
+        ]
+        
+        return {
+            'text': ''.join(segment['text'] for segment in segments),
+            'language': info.language,
+            'segments': segments
+        }
+    
     def _calculate_confidence(self, result: Dict[str, Any]) -> float:
         """Calculate average confidence from segments"""
-        try:
-            segments = result.get('segments', [])
-            if not segments:
-                return 0.0
-            
-            total_confidence = sum(
-                segment.get('avg_logprob', 0.0) for segment in segments
-            )
-            
-            return max(0.0, min(1.0, (total_confidence / len(segments) + 1.0) / 2.0))
-            
-        except Exception:
+        segments = result.get('segments', [])
+        if not segments:
             return 0.0
+        
+        logprobs = np.fromiter(
+            (segment.get('avg_logprob', 0.0) for segment in segments),
+            dtype=np.float32,
+            count=len(segments)
+        )
+        return float(np.clip((logprobs.mean() + 1.0) * 0.5, 0.0, 1.0))
     
     async def transcribe_file(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Transcribe audio file"""
@@ -223,10 +587,7 @@ class WhisperTranscription:
             
             # Transcribe in thread
             loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: self.model.transcribe(file_path, language=self.language)
-            )
+            result = await loop.run_in_executor(None, self._run_model, file_path)
             
             return {
                 'text': result['text'],
@@ -234,7 +595,7 @@ class WhisperTranscription:
                 'segments': result.get('segments', []),
                 'duration': sum(seg.get('end', 0) - seg.get('start', 0) for seg in result.get('segments', []))
             }
-            
+        
         except Exception as e:
             self.logger.error(f"Error transcribing file: {e}")
             return None
@@ -243,9 +604,21 @@ class WhisperTranscription:
 class TranscriptionManager:
     """Manage transcription for multiple calls"""
     
+    _model_cache: Dict[Tuple[str, str], Tuple[Any, threading.Lock]] = {}
+    """Loaded (model, inference lock) by (model_name, device), shared by all calls"""
+    
+    _model_users: Dict[Tuple[str, str], int] = {}
+    """Calls transcribing with each cached model, across all managers"""
+    
+    _load_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+    """Per-model locks so no two managers load the same model at once"""
+    
     def __init__(self, caller):
         self.caller = caller
         self.transcribers: Dict[int, WhisperTranscription] = {}
+        # One scheduler transcribes every call's window per tick, instead of
+        # a loop per call contending for the shared models
+        self._scheduler_task: Optional[asyncio.Task] = None
         self.logger = logger
     
     async def start_transcription_for_call(
@@ -260,20 +633,47 @@ class TranscriptionManager:
                 self.logger.warning(f"Transcription already active for chat {chat_id}")
                 return True
             
-            # Create transcriber
-            transcriber = WhisperTranscription(model_name, language)
+            # Create transcriber on the shared model, loading it only once
+            device = _default_device()
+            key = (model_name, device)
+            
+            async with self._load_locks.setdefault(key, asyncio.Lock()):
+                model, model_lock = self._model_cache.get(key, (None, None))
+                transcriber = WhisperTranscription(
+                    model_name,
+                    language,
+                    device,
+                    model=model,
+                    model_lock=model_lock
+                )
+                
+                if model is None:
+                    if not await transcriber.load_model():
+                        return False
+                    self._model_cache[key] = (transcriber.model, transcriber.model_lock)
+                
+                # Counted under the lock, so release_model never evicts a
+                # model between its lookup and use
+                self._model_users[key] = self._model_users.get(key, 0) + 1
+            
             transcriber.add_callback(
                 lambda result: self._handle_transcription(chat_id, result)
             )
             
             # Start transcription
-            success = await transcriber.start_transcription()
+            success = await transcriber.start_transcription(run_loop=False)
             if success:
                 self.transcribers[chat_id] = transcriber
+                
+                if self._scheduler_task is None or self._scheduler_task.done():
+                    self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+                
                 self.logger.info(f"Started transcription for chat {chat_id}")
+            else:
+                self._model_users[key] -= 1
             
             return success
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to start transcription for chat {chat_id}: {e}")
             return False
@@ -288,18 +688,66 @@ class TranscriptionManager:
             await transcriber.stop_transcription()
             
             del self.transcribers[chat_id]
+            self._model_users[(transcriber.model_name, transcriber.device)] -= 1
             
             self.logger.info(f"Stopped transcription for chat {chat_id}")
             return True
-            
+        
         except Exception as e:
             self.logger.error(f"Error stopping transcription for chat {chat_id}: {e}")
             return False
     
-    def add_audio_for_transcription(self, chat_id: int, audio_data: np.ndarray):
+    async def _scheduler_loop(self):
+        """Transcribe the due window of every call once per second"""
+        loop = asyncio.get_event_loop()
+        
+        while self.transcribers:
+            try:
+                windows = []
+                for transcriber in tuple(self.transcribers.values()):
+                    window = transcriber._next_window()
+                    if window is not None:
+                        windows.append((transcriber, *window))
+                
+                if windows:
+                    # One executor job runs all windows back to back on the
+                    # shared models rather than one thread hop per call
+                    results = await loop.run_in_executor(
+                        None,
+                        self._transcribe_windows,
+                        windows
+                    )
+                    
+                    for (transcriber, _, position), result in zip(windows, results):
+                        transcriber._finish_window(result, position)
+                
+                await asyncio.sleep(1.0)  # Transcribe every second
+            
+            except Exception as e:
+                self.logger.error(f"Error in transcription scheduler: {e}")
+                await asyncio.sleep(1.0)
+    
+    @staticmethod
+    def _transcribe_windows(windows) -> List[Optional[Dict[str, Any]]]:
+        """Transcribe (transcriber, audio, position) windows, grouped by model"""
+        order = sorted(range(len(windows)), key=lambda i: id(windows[i][0].model))
+        results: List[Optional[Dict[str, Any]]] = [None] * len(windows)
+        
+        for i in order:
+            transcriber, audio_chunk, _ = windows[i]
+            results[i] = transcriber._transcribe_chunk(audio_chunk)
+        
+        return results
+    
+    def add_audio_for_transcription(
+        self,
+        chat_id: int,
+        audio_data: np.ndarray,
+        sample_rate: Optional[int] = None
+    ):
         """Add audio data for transcription"""
         if chat_id in self.transcribers:
-            self.transcribers[chat_id].add_audio_data(audio_data)
+            self.transcribers[chat_id].add_audio_data(audio_data, sample_rate)
     
     def _handle_transcription(self, chat_id: int, result: Dict[str, Any]):
         """Handle transcription result"""
@@ -313,11 +761,40 @@ class TranscriptionManager:
                 # asyncio.create_task(
                 #     self.caller.client.send_message(chat_id, f"🎤 {text}")
                 # )
-                
+        
         except Exception as e:
             self.logger.error(f"Error handling transcription: {e}")
     
+    @classmethod
+    def release_model(cls, model_name: str, device: Optional[str] = None) -> bool:
+        """
+        Evict a cached model from memory
+        
+        Args:
+            model_name: Whisper model name
+            device: Device the model was loaded on (None for the default)
+        
+        Returns:
+            False if the model is not cached or a call of any manager still
+            transcribes with it
+        """
+        key = (model_name, device or _default_device())
+        if cls._model_users.get(key) or key not in cls._model_cache:
+            return False
+        
+        del cls._model_cache[key]
+        cls._model_users.pop(key, None)
+        return True
+    
     async def cleanup(self):
-        """Stop all transcriptions"""
+        """Stop all transcriptions and evict the models left unused"""
+        models = {
+            (transcriber.model_name, transcriber.device)
+            for transcriber in self.transcribers.values()
+        }
+        
         for chat_id in list(self.transcribers.keys()):
-            await self.stop_transcription_for_call(chat_id)
\ No newline at end of file
+            await self.stop_transcription_for_call(chat_id)
+        
+        for model_name, device in models:
+            self.release_model(model_name, device)
\ No newline at end of file
@@ -5,9 +5,13 @@ YouTube Downloader - Download and stream YouTube videos
 import asyncio
 import logging
 import os
+import socket
 import tempfile
-from typing import Optional, Dict, Any, List
-from pathlib import Path
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Hashable, List, Tuple
 
 try:
     import yt_dlp
@@ -16,17 +20,93 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# yt-dlp hops between many rrN---snX.googlevideo.com media hosts and
+# resolves the host again for every request; when enabled through
+# YouTubeDownloader.enable_dns_cache their resolutions are cached
+_DNS_CACHE_SUFFIX = '.googlevideo.com'
+_DNS_CACHE_SIZE = 256
+
+_dns_cache: "OrderedDict[Tuple, Tuple[float, list]]" = OrderedDict()
+_dns_cache_lock = threading.Lock()
+# Seconds resolutions are kept, or None while the cache is disabled
+_dns_cache_ttl: Optional[float] = None
+_getaddrinfo = None
+
+
+def _cached_getaddrinfo(host, port, *args, **kwargs):
+    """socket.getaddrinfo that reuses recent resolutions of media hosts"""
+    ttl = _dns_cache_ttl
+    if ttl is None or not isinstance(host, str) or not host.endswith(_DNS_CACHE_SUFFIX):
+        return _getaddrinfo(host, port, *args, **kwargs)
+    
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    
+    with _dns_cache_lock:
+        entry = _dns_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _dns_cache.move_to_end(key)
+            return list(entry[1])
+    
+    result = _getaddrinfo(host, port, *args, **kwargs)
+    
+    with _dns_cache_lock:
+        _dns_cache[key] = (now + ttl, result)
+        _dns_cache.move_to_end(key)
+        if len(_dns_cache) > _DNS_CACHE_SIZE:
+            _dns_cache.popitem(last=False)
+    
+    return list(result)
+
 
 class YouTubeDownloader:
     """Download and stream YouTube videos"""
     
-    def __init__(self, download_dir: Optional[str] = None):
+    CACHE_SIZE = 512
+    """Entries kept per metadata cache before the least recently used is evicted"""
+    
+    INFO_TTL = 1800.0
+    """Seconds video info is reused"""
+    
+    STREAM_URL_TTL = 1800.0
+    """Seconds a stream URL is reused; well inside its signed expiry"""
+    
+    PLAYLIST_CONCURRENCY = 4
+    """Playlist videos downloaded at once"""
+    
+    POOL_IDLE = 2
+    """Idle YoutubeDL instances kept per option set"""
+    
+    POOL_OPTION_SETS = 8
+    """Option sets with idle instances kept before the least recently used is closed"""
+    
+    # Shared by all downloaders; ordered oldest-to-newest access, values
+    # are (expires_at, value) on the monotonic clock
+    _info_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _stream_url_cache: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+    
+    def __init__(self, download_dir: Optional[str] = None, dns_cache: bool = False):
+        """
+        Args:
+            download_dir: Directory downloads are written to
+            dns_cache: Enable the process-wide media host DNS cache; see
+                enable_dns_cache
+        """
         if yt_dlp is None:
             raise ImportError("yt-dlp is required for YouTube downloading")
         
         self.download_dir = download_dir or tempfile.gettempdir()
         self.logger = logger
         
+        if dns_cache:
+            self.enable_dns_cache()
+        
+        # Idle long-lived YoutubeDL instances per option set, least recently
+        # used first; each keeps its HTTP session, so repeated lookups reuse
+        # TCP and TLS connections
+        self._ydl_pool: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._ydl_pool_lock = threading.Lock()
+        
         # Default yt-dlp options
         self.default_opts = {
             'format': 'best[height<=720]',
@@ -35,29 +115,167 @@ class YouTubeDownloader:
             'extract_flat': False,
         }
     
+    @staticmethod
+    def enable_dns_cache(ttl: float = 60.0):
+        """
+        Cache resolutions of googlevideo.com media hosts for ttl seconds
+        
+        Wraps socket.getaddrinfo for the whole process; other hosts are
+        resolved as before. The system resolver does not report record
+        TTLs, so keep ttl at or below the hosts' DNS TTL.
+        """
+        global _dns_cache_ttl, _getaddrinfo
+        
+        with _dns_cache_lock:
+            _dns_cache_ttl = ttl
+            if socket.getaddrinfo is not _cached_getaddrinfo:
+                _getaddrinfo = socket.getaddrinfo
+                socket.getaddrinfo = _cached_getaddrinfo
+    
+    @staticmethod
+    def disable_dns_cache():
+        """Drop cached resolutions and restore socket.getaddrinfo"""
+        global _dns_cache_ttl
+        
+        with _dns_cache_lock:
+            _dns_cache_ttl = None
+            _dns_cache.clear()
+            # If something wrapped getaddrinfo since, the cache stays in
+            # its chain as a pass-through
+            if socket.getaddrinfo is _cached_getaddrinfo:
+                socket.getaddrinfo = _getaddrinfo
+    
+    @classmethod
+    def _cache_get(cls, cache: OrderedDict, key: Hashable) -> Any:
+        """Cached value for key, or None if missing or expired"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        
+        if entry[0] <= time.monotonic():
+            del cache[key]
+            return None
+        
+        cache.move_to_end(key)
+        return entry[1]
+    
+    @classmethod
+    def _cache_set(cls, cache: OrderedDict, key: Hashable, value: Any, ttl: float):
+        """Cache value for ttl seconds, evicting the least recently used entry"""
+        cache[key] = (time.monotonic() + ttl, value)
+        cache.move_to_end(key)
+        
+        if len(cache) > cls.CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    @classmethod
+    def invalidate(cls, url: str):
+        """Drop cached info and stream URLs for url"""
+        cls._info_cache.pop(url, None)
+        for key in [key for key in cls._stream_url_cache if key[0] == url]:
+            del cls._stream_url_cache[key]
+    
+    @contextmanager
+    def _borrow_ydl(self, opts: Dict[str, Any]):
+        """Borrow an idle YoutubeDL for opts from the pool, creating one if none is idle"""
+        # Option values may be lists or dicts (postprocessors, http_headers),
+        # so the key is their repr; option names are unique, so sorting never
+        # compares values
+        key = repr(sorted(opts.items()))
+        
+        with self._ydl_pool_lock:
+            idle = self._ydl_pool.get(key)
+            ydl = idle.pop() if idle else None
+        
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(opts)
+        
+        try:
+            yield ydl
+        finally:
+            self._return_ydl(key, ydl)
+    
+    def _return_ydl(self, key: str, ydl: Any):
+        """Put ydl back in the pool, closing what exceeds its bounds"""
+        surplus = []
+        
+        with self._ydl_pool_lock:
+            idle = self._ydl_pool.setdefault(key, [])
+            self._ydl_pool.move_to_end(key)
+            if len(idle) < self.POOL_IDLE:
+                idle.append(ydl)
+            else:
+                surplus.append(ydl)
+            
+            while len(self._ydl_pool) > self.POOL_OPTION_SETS:
+                surplus.extend(self._ydl_pool.popitem(last=False)[1])
+        
+        self._close_ydls(surplus)
+    
+    def _close_ydls(self, instances: List[Any]):
+        """Close YoutubeDL instances, logging failures"""
+        for ydl in instances:
+            try:
+                ydl.close()
+            except Exception as e:
+                self.logger.debug("Error closing YoutubeDL: %s", e)
+    
+    def _extract_info(self, opts: Dict[str, Any], url: str) -> Dict[str, Any]:
+        """Extract info for url without downloading; runs on the executor"""
+        with self._borrow_ydl(opts) as ydl:
+            return ydl.extract_info(url, download=False)
+    
+    def _download(self, opts: Dict[str, Any], url: str) -> Dict[str, Any]:
+        """Download url and return its info; runs on the executor"""
+        with self._borrow_ydl(opts) as ydl:
+            return ydl.extract_info(url, download=True)
+    
+    def _download_video(self, opts: Dict[str, Any], url: str) -> str:
+        """Download a single video and return its output filename; runs on the executor"""
+        with self._borrow_ydl(opts) as ydl:
+            info = ydl.extract_info(url, download=True)
+            
+            # yt-dlp records where each download landed; the output template
+            # only needs formatting again if it did not
+            downloads = info.get('requested_downloads')
+            if downloads and downloads[0].get('filepath'):
+                return downloads[0]['filepath']
+            return ydl.prepare_filename(info)
+    
+    def close(self):
+        """Close the pooled YoutubeDL instances"""
+        with self._ydl_pool_lock:
+            pool, self._ydl_pool = self._ydl_pool, OrderedDict()
+        
+        for instances in pool.values():
+            self._close_ydls(instances)
+    
     async def get_video_info(self, url: str) -> Optional[Dict[str, Any]]:
         """Get video information without downloading"""
+        cached = self._cache_get(self._info_cache, url)
+        if cached is not None:
+            return cached
+        
         try:
             opts = self.default_opts.copy()
             opts['quiet'] = True
             
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                # Run in thread to avoid blocking
-                loop = asyncio.get_event_loop()
-                info = await loop.run_in_executor(
-                    None, 
-                    lambda: ydl.extract_info(url, download=False)
-                )
-                
-                return {
-                    'title': info.get('title'),
-                    'duration': info.get('duration'),
-                    'uploader': info.get('uploader'),
-                    'view_count': info.get('view_count'),
-                    'description': info.get('description'),
-                    'thumbnail': info.get('thumbnail'),
-                    'formats': info.get('formats', [])
-                }
+            # Run in thread to avoid blocking
+            loop = asyncio.get_event_loop()
+            info = await loop.run_in_executor(None, self._extract_info, opts, url)
+            
+            video_info = {
+                'title': info.get('title'),
+                'duration': info.get('duration'),
+                'uploader': info.get('uploader'),
+                'view_count': info.get('view_count'),
+                'description': info.get('description'),
+                'thumbnail': info.get('thumbnail'),
+                'formats': info.get('formats', [])
+            }
+            
+            self._cache_set(self._info_cache, url, video_info, self.INFO_TTL)
+            return video_info
                 
         except Exception as e:
             self.logger.error(f"Error getting video info: {e}")
@@ -92,24 +310,14 @@ class YouTubeDownloader:
             else:
                 opts['format'] = quality
             
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                # Run in thread
-                loop = asyncio.get_event_loop()
-                info = await loop.run_in_executor(
-                    None,
-                    lambda: ydl.extract_info(url, download=True)
-                )
-                
-                # Get downloaded file path
-                filename = ydl.prepare_filename(info)
-                
-                if os.path.exists(filename):
-                    self.logger.info(f"Downloaded: {filename}")
-                    return filename
-                else:
-                    self.logger.error(f"Downloaded file not found: {filename}")
-                    return None
-                    
+            # Run in thread
+            loop = asyncio.get_event_loop()
+            filename = await loop.run_in_executor(None, self._download_video, opts, url)
+            
+            # Download failures raise from yt-dlp, so the file exists
+            self.logger.info(f"Downloaded: {filename}")
+            return filename
+            
         except Exception as e:
             self.logger.error(f"Error downloading video: {e}")
             return None
@@ -121,23 +329,47 @@ class YouTubeDownloader:
     ) -> List[str]:
         """Download YouTube playlist"""
         try:
+            # List the entries without resolving each video
             opts = self.default_opts.copy()
             opts['noplaylist'] = False
             opts['playlistend'] = max_downloads
+            opts['extract_flat'] = 'in_playlist'
             
-            downloaded_files = []
+            loop = asyncio.get_event_loop()
+            info = await loop.run_in_executor(None, self._extract_info, opts, url)
             
-            def progress_hook(d):
-                if d['status'] == 'finished':
-                    downloaded_files.append(d['filename'])
+            video_urls = [
+                entry.get('url') or entry.get('id')
+                for entry in info.get('entries') or []
+                if entry
+            ]
             
-            opts['progress_hooks'] = [progress_hook]
+            # Download the videos concurrently, each on its own pooled YoutubeDL
+            semaphore = asyncio.Semaphore(self.PLAYLIST_CONCURRENCY)
             
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None,
-                    lambda: ydl.download([url])
+            async def fetch(video_url: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        None, self._download, self.default_opts.copy(), video_url
+                    )
+            
+            results = await asyncio.gather(
+                *[fetch(video_url) for video_url in video_urls if video_url],
+                return_exceptions=True
+            )
+            
+            # Downloaded paths come from each video's info rather than a
+            # per-call progress hook, which would tie the YoutubeDL to this call
+            downloaded_files = []
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error downloading playlist entry: {result}")
+                    continue
+                
+                downloaded_files.extend(
+                    download['filepath']
+                    for download in result.get('requested_downloads', [])
+                    if download.get('filepath')
                 )
             
             self.logger.info(f"Downloaded {len(downloaded_files)} files from playlist")
@@ -161,25 +393,23 @@ class YouTubeDownloader:
                 'extract_flat': True,
             }
             
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                loop = asyncio.get_event_loop()
-                search_results = await loop.run_in_executor(
-                    None,
-                    lambda: ydl.extract_info(search_url, download=False)
-                )
-                
-                videos = []
-                for entry in search_results.get('entries', []):
-                    videos.append({
-                        'id': entry.get('id'),
-                        'title': entry.get('title'),
-                        'url': entry.get('url'),
-                        'duration': entry.get('duration'),
-                        'uploader': entry.get('uploader'),
-                        'view_count': entry.get('view_count')
-                    })
-                
-                return videos
+            loop = asyncio.get_event_loop()
+            search_results = await loop.run_in_executor(
+                None, self._extract_info, opts, search_url
+            )
+            
+            videos = []
+            for entry in search_results.get('entries', []):
+                videos.append({
+                    'id': entry.get('id'),
+                    'title': entry.get('title'),
+                    'url': entry.get('url'),
+                    'duration': entry.get('duration'),
+                    'uploader': entry.get('uploader'),
+                    'view_count': entry.get('view_count')
+                })
+            
+            return videos
                 
         except Exception as e:
             self.logger.error(f"Error searching videos: {e}")
@@ -191,48 +421,92 @@ class YouTubeDownloader:
         quality: str = 'best[height<=720]'
     ) -> Optional[str]:
         """Get direct stream URL without downloading"""
+        key = (url, quality)
+        cached = self._cache_get(self._stream_url_cache, key)
+        if cached is not None:
+            return cached
+        
         try:
             opts = {
                 'format': quality,
                 'quiet': True,
             }
             
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                loop = asyncio.get_event_loop()
-                info = await loop.run_in_executor(
-                    None,
-                    lambda: ydl.extract_info(url, download=False)
-                )
-                
-                # Get the best format URL
-                if 'url' in info:
-                    return info['url']
-                elif 'formats' in info and info['formats']:
-                    return info['formats'][-1].get('url')
-                
-                return None
+            loop = asyncio.get_event_loop()
+            info = await loop.run_in_executor(None, self._extract_info, opts, url)
+            
+            stream_url = self._best_url(info)
+            if stream_url:
+                self._cache_set(self._stream_url_cache, key, stream_url, self.STREAM_URL_TTL)
+            return stream_url
                 
         except Exception as e:
             self.logger.error(f"Error getting stream URL: {e}")
             return None
     
-    def cleanup_downloads(self, max_age_hours: int = 24):
-        """Clean up old downloaded files"""
+    async def search_stream_url(
+        self,
+        query: str,
+        index: int = 0,
+        quality: str = 'best[height<=720]'
+    ) -> Optional[str]:
+        """Get the direct stream URL of a search result in one extraction"""
         try:
-            import time
+            # Only the selected entry is fully extracted, and its formats come
+            # back with the search rather than from a second lookup
+            opts = {
+                'format': quality,
+                'quiet': True,
+                'playlist_items': str(index + 1),
+            }
             
-            download_path = Path(self.download_dir)
-            current_time = time.time()
-            max_age_seconds = max_age_hours * 3600
+            loop = asyncio.get_event_loop()
+            results = await loop.run_in_executor(
+                None, self._extract_info, opts, f"ytsearch{index + 1}:{query}"
+            )
+            
+            entries = [entry for entry in results.get('entries') or [] if entry]
+            if not entries:
+                return None
+            
+            entry = entries[0]
+            stream_url = self._best_url(entry)
             
+            if stream_url and entry.get('webpage_url'):
+                self._cache_set(
+                    self._stream_url_cache,
+                    (entry['webpage_url'], quality),
+                    stream_url,
+                    self.STREAM_URL_TTL
+                )
+            return stream_url
+        
+        except Exception as e:
+            self.logger.error(f"Error searching stream URL: {e}")
+            return None
+    
+    @staticmethod
+    def _best_url(info: Dict[str, Any]) -> Optional[str]:
+        """URL of the selected format, or of the last listed format"""
+        if 'url' in info:
+            return info['url']
+        elif 'formats' in info and info['formats']:
+            return info['formats'][-1].get('url')
+        
+        return None
+    
+    def cleanup_downloads(self, max_age_hours: int = 24):
+        """Clean up old downloaded files"""
+        try:
+            cutoff = time.time() - max_age_hours * 3600
             deleted_count = 0
             
-            for file_path in download_path.glob('*'):
-                if file_path.is_file():
-                    file_age = current_time - file_path.stat().st_mtime
-                    
-                    if file_age > max_age_seconds:
-                        file_path.unlink()
+            # scandir reports file types from the directory listing itself,
+            # leaving one stat per regular file instead of two or three
+            with os.scandir(self.download_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                        os.unlink(entry.path)
                         deleted_count += 1
             
             self.logger.info(f"Cleaned up {deleted_count} old files")
@@ -314,16 +588,20 @@ class YouTubeStreamer:
     ) -> bool:
         """Search and play first result"""
         try:
-            # Search videos
-            results = await self.downloader.search_videos(query, max_results=5)
+            # Search and resolve the selected result in one extraction
+            stream_url = await self.downloader.search_stream_url(query, index)
             
-            if not results or index >= len(results):
+            if not stream_url:
                 self.logger.error("No search results found")
                 return False
             
             # Play selected result
-            video = results[index]
-            return await self.play_youtube_url(chat_id, video['url'])
+            success = await self.caller.play(chat_id, stream_url)
+            
+            if success:
+                self.logger.info(f"Started playing YouTube video in chat {chat_id}")
+            
+            return success
             
         except Exception as e:
             self.logger.error(f"Error searching and playing: {e}")
@@ -4,14 +4,102 @@ Advanced YouTube Streaming with FastStreamBuffer Integration
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+import warnings
+from collections.abc import Mapping
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
-from ..streaming import FastStreamBuffer, YouTubeStreamer, YouTubeStreamConfig, BufferManager, BufferPriority
+from ..streaming import FastStreamBuffer, YouTubeStreamer, YouTubeStreamConfig, BufferManager, BufferPriority, BufferConfig
 from ..types import AudioConfig, VideoConfig
 
 logger = logging.getLogger(__name__)
 
 
+def _quality_preset(
+    video_quality: str,
+    max_buffer_size: int,
+    target_buffer_size: int,
+    chunk_duration_ms: float,
+    max_latency_ms: float
+) -> YouTubeStreamConfig:
+    """Low-latency stream configuration for one quality"""
+    return YouTubeStreamConfig(
+        video_quality=video_quality,
+        buffer_config=BufferConfig(
+            max_buffer_size=max_buffer_size,
+            target_buffer_size=target_buffer_size,
+            chunk_duration_ms=chunk_duration_ms,
+            max_latency_ms=max_latency_ms,
+            adaptive_quality=True,
+            use_threading=True
+        ),
+        ffmpeg_options={
+            'before_options': '-re -fflags +genpts -probesize 32 -analyzeduration 0',
+            'options': '-f s16le -ar 48000 -ac 2 -bufsize 64k'
+        },
+        chunk_size=4096,  # Smaller chunks for lower latency
+        use_hardware_acceleration=True
+    )
+
+
+# Built once at import; streams get copies, as their buffer configs are
+# tuned in place while they run
+_QUALITY_PRESETS: Dict[str, YouTubeStreamConfig] = {
+    "480p": _quality_preset("best[height<=480]", 40, 15, 25.0, 120.0),
+    "720p": _quality_preset("best[height<=720]", 60, 25, 20.0, 100.0),
+    "1080p": _quality_preset("best[height<=1080]", 80, 35, 15.0, 80.0),
+}
+
+
+class StreamRecord:
+    """Everything tracked for one active stream"""
+    __slots__ = ('streamer', 'monitor_task', 'stats_callback', 'last_stats', 'last_analysis', 'last_ts')
+    
+    def __init__(self, streamer: YouTubeStreamer):
+        self.streamer = streamer
+        self.monitor_task: Optional[asyncio.Task] = None
+        # (buffer, callback) registered while the stream is monitored
+        self.stats_callback: Optional[Tuple[FastStreamBuffer, Callable[[Dict[str, Any]], None]]] = None
+        self.last_stats: Optional[Dict[str, Any]] = None
+        self.last_analysis: Optional[Dict[str, Any]] = None
+        self.last_ts = 0.0
+    
+    def performance_data(self) -> Optional[Dict[str, Any]]:
+        """Latest analysis as {'stats', 'analysis', 'timestamp'}, or None before the first"""
+        if self.last_stats is None:
+            return None
+        
+        return {
+            'stats': self.last_stats,
+            'analysis': self.last_analysis,
+            'timestamp': self.last_ts
+        }
+
+
+class _RecordView(Mapping):
+    """Read-only live view of one value per stream record; None values are hidden"""
+    
+    __slots__ = ('_records', '_value')
+    
+    def __init__(self, records: Dict[int, StreamRecord], value: Callable[[StreamRecord], Any]):
+        self._records = records
+        self._value = value
+    
+    def __getitem__(self, chat_id: int) -> Any:
+        value = self._value(self._records[chat_id])
+        if value is None:
+            raise KeyError(chat_id)
+        return value
+    
+    def __iter__(self) -> Iterator[int]:
+        value = self._value
+        return iter([chat_id for chat_id, record in self._records.items() if value(record) is not None])
+    
+    def __len__(self) -> int:
+        value = self._value
+        return sum(1 for record in self._records.values() if value(record) is not None)
+
+
 class AdvancedYouTubeStreamer:
     """
     Advanced YouTube streamer with ultra-low-latency capabilities
@@ -23,6 +111,9 @@ class AdvancedYouTubeStreamer:
     - Real-time performance monitoring
     """
     
+    STOP_CONCURRENCY = 16
+    """Streams stopped at once during cleanup"""
+    
     def __init__(self, caller, buffer_manager: Optional[BufferManager] = None):
         """
         Initialize advanced YouTube streamer
@@ -35,11 +126,18 @@ class AdvancedYouTubeStreamer:
         self.buffer_manager = buffer_manager or BufferManager(max_buffers=5)
         self.logger = logger
         
-        # Active streams
-        self.active_streams: Dict[int, YouTubeStreamer] = {}
+        # Active streams, shared with the performance monitor
+        self.streams: Dict[int, StreamRecord] = {}
         
         # Performance monitoring
-        self.performance_monitor = PerformanceMonitor()
+        self.performance_monitor = PerformanceMonitor(self.streams)
+        
+        self._active_streams = _RecordView(self.streams, lambda record: record.streamer)
+    
+    @property
+    def active_streams(self) -> Mapping:
+        """Read-only live view of the streamer of every active stream"""
+        return self._active_streams
     
     async def stream_youtube_ultra_low_latency(
         self,
@@ -64,7 +162,7 @@ class AdvancedYouTubeStreamer:
         """
         try:
             # Stop existing stream if any
-            if chat_id in self.active_streams:
+            if chat_id in self.streams:
                 await self.stop_stream(chat_id)
             
             # Create optimized configuration
@@ -79,7 +177,7 @@ class AdvancedYouTubeStreamer:
             )
             
             if success:
-                self.active_streams[chat_id] = streamer
+                self.streams[chat_id] = StreamRecord(streamer)
                 
                 # Start performance monitoring
                 await self.performance_monitor.start_monitoring(chat_id, streamer)
@@ -94,17 +192,16 @@ class AdvancedYouTubeStreamer:
     
     async def stop_stream(self, chat_id: int) -> bool:
         """Stop YouTube stream"""
-        if chat_id not in self.active_streams:
+        record = self.streams.get(chat_id)
+        if record is None:
             return False
         
         try:
-            streamer = self.active_streams[chat_id]
-            await streamer.stop_streaming()
+            await record.streamer.stop_streaming()
             
-            # Stop monitoring
+            # Stop monitoring; this also drops the record
             await self.performance_monitor.stop_monitoring(chat_id)
-            
-            del self.active_streams[chat_id]
+            self.streams.pop(chat_id, None)
             
             self.logger.info(f"Stopped YouTube streaming for chat {chat_id}")
             return True
@@ -115,77 +212,40 @@ class AdvancedYouTubeStreamer:
     
     def _create_optimized_config(self, quality: str) -> YouTubeStreamConfig:
         """Create optimized streaming configuration"""
-        # Quality-specific settings
-        quality_settings = {
-            "480p": {
-                "video_quality": "best[height<=480]",
-                "max_buffer_size": 40,
-                "target_buffer_size": 15,
-                "chunk_duration_ms": 25.0,
-                "max_latency_ms": 120.0
-            },
-            "720p": {
-                "video_quality": "best[height<=720]",
-                "max_buffer_size": 60,
-                "target_buffer_size": 25,
-                "chunk_duration_ms": 20.0,
-                "max_latency_ms": 100.0
-            },
-            "1080p": {
-                "video_quality": "best[height<=1080]",
-                "max_buffer_size": 80,
-                "target_buffer_size": 35,
-                "chunk_duration_ms": 15.0,
-                "max_latency_ms": 80.0
-            }
-        }
+        preset = _QUALITY_PRESETS.get(quality, _QUALITY_PRESETS["720p"])
         
-        settings = quality_settings.get(quality, quality_settings["720p"])
-        
-        # Create buffer configuration
-        from ..streaming.fast_stream_buffer import BufferConfig
-        buffer_config = BufferConfig(
-            max_buffer_size=settings["max_buffer_size"],
-            target_buffer_size=settings["target_buffer_size"],
-            chunk_duration_ms=settings["chunk_duration_ms"],
-            max_latency_ms=settings["max_latency_ms"],
-            adaptive_quality=True,
-            use_threading=True
-        )
-        
-        # Create stream configuration
-        return YouTubeStreamConfig(
-            video_quality=settings["video_quality"],
-            buffer_config=buffer_config,
-            ffmpeg_options={
-                'before_options': '-re -fflags +genpts -probesize 32 -analyzeduration 0',
-                'options': '-f s16le -ar 48000 -ac 2 -bufsize 64k'
-            },
-            chunk_size=4096,  # Smaller chunks for lower latency
-            use_hardware_acceleration=True
-        )
+        # Shallow copies; ffmpeg options are only read and stay shared
+        return replace(preset, buffer_config=replace(preset.buffer_config))
     
     def get_stream_stats(self, chat_id: int) -> Optional[Dict[str, Any]]:
         """Get streaming statistics for chat"""
-        if chat_id not in self.active_streams:
+        record = self.streams.get(chat_id)
+        if record is None:
             return None
         
-        streamer = self.active_streams[chat_id]
-        return streamer.get_streaming_stats()
+        return record.streamer.get_streaming_stats()
     
     def get_all_streams_stats(self) -> Dict[int, Dict[str, Any]]:
         """Get statistics for all active streams"""
         return {
-            chat_id: streamer.get_streaming_stats()
-            for chat_id, streamer in self.active_streams.items()
+            chat_id: record.streamer.get_streaming_stats()
+            for chat_id, record in self.streams.items()
         }
     
     async def cleanup(self):
         """Cleanup all streams and resources"""
         try:
-            # Stop all streams
-            for chat_id in list(self.active_streams.keys()):
-                await self.stop_stream(chat_id)
+            # Stop all streams concurrently, a bounded number at a time
+            semaphore = asyncio.Semaphore(self.STOP_CONCURRENCY)
+            
+            async def stop(chat_id: int):
+                async with semaphore:
+                    return await self.stop_stream(chat_id)
+            
+            await asyncio.gather(
+                *[stop(chat_id) for chat_id in list(self.streams)],
+                return_exceptions=True
+            )
             
             # Cleanup buffer manager
             await self.buffer_manager.cleanup_all()
@@ -200,42 +260,119 @@ class AdvancedYouTubeStreamer:
 
 
 class PerformanceMonitor:
-    """Monitor streaming performance and optimize in real-time"""
+    """
+    Monitor streaming performance and optimize in real-time
+    
+    Streams are analyzed when their buffer statistics cross a threshold,
+    rather than polled; healthy streams cost no wakeups.
+    """
+    
+    MIN_BUFFER_HEALTH = 60
+    """Buffer health percentage below which a stream needs optimization"""
+    
+    MAX_LATENCY_MS = 150
+    """Average latency above which a stream needs optimization"""
+    
+    MAX_UNDERRUNS = 5
+    """Buffer underruns above which a stream needs optimization"""
+    
+    OPTIMIZE_INTERVAL = 5.0
+    """Minimum seconds between analyses of one stream"""
     
-    def __init__(self):
+    def __init__(self, records: Optional[Dict[int, StreamRecord]] = None):
+        """
+        Initialize performance monitor
+        
+        Args:
+            records: Stream records to share with the owning streamer
+        """
         self.logger = logger
-        self.monitoring_tasks: Dict[int, asyncio.Task] = {}
-        self.performance_data: Dict[int, Dict[str, Any]] = {}
+        self.records: Dict[int, StreamRecord] = {} if records is None else records
+        self._monitoring_tasks = _RecordView(self.records, lambda record: record.monitor_task)
+        self._performance_data = _RecordView(self.records, StreamRecord.performance_data)
+    
+    @property
+    def monitoring_tasks(self) -> Mapping:
+        """Deprecated read-only view of monitor tasks; use records"""
+        warnings.warn(
+            "PerformanceMonitor.monitoring_tasks is deprecated; use records",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return self._monitoring_tasks
+    
+    @property
+    def performance_data(self) -> Mapping:
+        """Deprecated read-only view of performance data; use get_performance_data"""
+        warnings.warn(
+            "PerformanceMonitor.performance_data is deprecated; use get_performance_data",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return self._performance_data
     
     async def start_monitoring(self, chat_id: int, streamer: YouTubeStreamer):
         """Start monitoring for specific stream"""
-        if chat_id in self.monitoring_tasks:
+        record = self.records.get(chat_id)
+        if record is None or record.streamer is not streamer:
+            record = self.records[chat_id] = StreamRecord(streamer)
+        elif record.monitor_task:
             return
         
-        self.monitoring_tasks[chat_id] = asyncio.create_task(
-            self._monitor_stream_performance(chat_id, streamer)
+        # The buffer publishes its statistics every monitor interval; flag
+        # the stream only when they cross a threshold
+        needs_check = asyncio.Event()
+        
+        def on_stats(stats: Dict[str, Any]):
+            if (
+                stats['buffer_health'] < self.MIN_BUFFER_HEALTH
+                or stats['avg_latency_ms'] > self.MAX_LATENCY_MS
+                or streamer.stream_stats['buffer_underruns'] > self.MAX_UNDERRUNS
+            ):
+                needs_check.set()
+        
+        if streamer.buffer:
+            streamer.buffer.add_stats_callback(on_stats)
+            record.stats_callback = (streamer.buffer, on_stats)
+        
+        record.monitor_task = asyncio.create_task(
+            self._monitor_stream_performance(chat_id, record, needs_check)
         )
         
         self.logger.info(f"Started performance monitoring for chat {chat_id}")
     
     async def stop_monitoring(self, chat_id: int):
-        """Stop monitoring for specific stream"""
-        if chat_id in self.monitoring_tasks:
-            self.monitoring_tasks[chat_id].cancel()
-            try:
-                await self.monitoring_tasks[chat_id]
-            except asyncio.CancelledError:
-                pass
-            
-            del self.monitoring_tasks[chat_id]
-            self.performance_data.pop(chat_id, None)
-            
-            self.logger.info(f"Stopped performance monitoring for chat {chat_id}")
+        """Stop monitoring for specific stream and drop its record"""
+        record = self.records.pop(chat_id, None)
+        if record is None or record.monitor_task is None:
+            return
+        
+        record.monitor_task.cancel()
+        try:
+            await record.monitor_task
+        except asyncio.CancelledError:
+            pass
+        
+        if record.stats_callback:
+            buffer, callback = record.stats_callback
+            if callback in buffer.stats_callbacks:
+                buffer.stats_callbacks.remove(callback)
+        
+        self.logger.info(f"Stopped performance monitoring for chat {chat_id}")
     
-    async def _monitor_stream_performance(self, chat_id: int, streamer: YouTubeStreamer):
-        """Monitor stream performance"""
+    async def _monitor_stream_performance(
+        self,
+        chat_id: int,
+        record: StreamRecord,
+        needs_check: asyncio.Event
+    ):
+        """Analyze and optimize the stream whenever its statistics cross a threshold"""
+        streamer = record.streamer
         try:
             while True:
+                await needs_check.wait()
+                needs_check.clear()
+                
                 # Collect performance metrics
                 stats = streamer.get_streaming_stats()
                 
@@ -243,17 +380,16 @@ class PerformanceMonitor:
                 analysis = self._analyze_performance(stats)
                 
                 # Store data
-                self.performance_data[chat_id] = {
-                    'stats': stats,
-                    'analysis': analysis,
-                    'timestamp': asyncio.get_event_loop().time()
-                }
+                record.last_stats = stats
+                record.last_analysis = analysis
+                record.last_ts = asyncio.get_event_loop().time()
                 
                 # Apply optimizations if needed
                 if analysis['needs_optimization']:
                     await self._apply_optimizations(chat_id, streamer, analysis)
                 
-                await asyncio.sleep(5.0)  # Monitor every 5 seconds
+                # Coalesce further alerts while optimizations take effect
+                await asyncio.sleep(self.OPTIMIZE_INTERVAL)
                 
         except asyncio.CancelledError:
             pass
@@ -270,21 +406,21 @@ class PerformanceMonitor:
         
         # Check buffer health
         buffer_health = stats.get('health_percent', 0)
-        if buffer_health < 60:
+        if buffer_health < self.MIN_BUFFER_HEALTH:
             analysis['needs_optimization'] = True
             analysis['issues'].append('low_buffer_health')
             analysis['recommendations'].append('increase_buffer_size')
         
         # Check latency
         avg_latency = stats.get('avg_latency_ms', 0)
-        if avg_latency > 150:
+        if avg_latency > self.MAX_LATENCY_MS:
             analysis['needs_optimization'] = True
             analysis['issues'].append('high_latency')
             analysis['recommendations'].append('reduce_quality')
         
         # Check underruns
         underruns = stats.get('buffer_underruns', 0)
-        if underruns > 5:
+        if underruns > self.MAX_UNDERRUNS:
             analysis['needs_optimization'] = True
             analysis['issues'].append('frequent_underruns')
             analysis['recommendations'].append('increase_buffer_target')
@@ -332,9 +468,11 @@ class PerformanceMonitor:
     
     def get_performance_data(self, chat_id: int) -> Optional[Dict[str, Any]]:
         """Get performance data for specific chat"""
-        return self.performance_data.get(chat_id)
+        record = self.records.get(chat_id)
+        return None if record is None else record.performance_data()
     
     async def cleanup(self):
         """Cleanup all monitoring tasks"""
-        for chat_id in list(self.monitoring_tasks.keys()):
-            await self.stop_monitoring(chat_id)
\ No newline at end of file
+        for chat_id, record in list(self.records.items()):
+            if record.monitor_task:
+                await self.stop_monitoring(chat_id)
\ No newline at end of file
@@ -9,6 +9,8 @@ from typing import Optional, Callable, Dict, Any
 from aiohttp import web, ClientSession
 from aiohttp.web_response import Response
 
+from .._json import json_response as _json_response, read_json as _read_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,16 +53,16 @@ class CustomAPIServer:
         try:
             # Check if handler is registered
             if not self.custom_handler:
-                return web.json_response(
+                return _json_response(
                     {"error": "NO_CUSTOM_API_DECORATOR"},
                     status=400
                 )
             
             # Parse JSON
             try:
-                data = await request.json()
+                data = await _read_json(request)
             except (json.JSONDecodeError, ValueError):
-                return web.json_response(
+                return _json_response(
                     {"error": "INVALID_JSON_FORMAT_REQUEST"},
                     status=400
                 )
@@ -75,25 +77,25 @@ class CustomAPIServer:
                 elif not isinstance(result, dict):
                     result = {"result": result}
                 
-                return web.json_response(result)
+                return _json_response(result)
                 
             except Exception as e:
                 self.logger.error(f"Error in custom handler: {e}")
-                return web.json_response(
+                return _json_response(
                     {"error": "HANDLER_ERROR", "message": str(e)},
                     status=500
                 )
                 
         except Exception as e:
             self.logger.error(f"API request error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"error": "INTERNAL_ERROR", "message": str(e)},
                 status=500
             )
     
     async def _health_check(self, request) -> Response:
         """Health check endpoint"""
-        return web.json_response({
+        return _json_response({
             "status": "healthy",
             "service": "TgCaller Custom API",
             "caller_running": self.caller.is_running if self.caller else False
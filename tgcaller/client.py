@@ -4,7 +4,7 @@ TgCaller Main Client
 
 import asyncio
 import logging
-from typing import Optional, Union, Callable, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Union, Callable, Dict, Any, List
 from pathlib import Path
 from pyrogram import Client
 
@@ -13,10 +13,14 @@ from .exceptions import TgCallerError, ConnectionError, MediaError, StreamError
 from .handlers import EventHandler
 from .handlers.event_system import EventHandlerSystem, Filters, BaseFilter
 from .methods import CallMethods, StreamMethods
-from .api import CustomAPIServer, on_custom_update
-from .devices import MediaDevices
 from .internal import ConnectionManager, CacheManager, StreamHandler, CallHandler, RetryManager
 
+# The API server (aiohttp) and device probing (pyaudio, cv2, mss) are
+# imported where they are first used
+if TYPE_CHECKING:
+    from .api import CustomAPIServer
+    from .devices import MediaDevices
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,7 +84,7 @@ class TgCaller:
         
         # Initialize new systems
         self._event_system = EventHandlerSystem()
-        self._custom_api_server: Optional[CustomAPIServer] = None
+        self._custom_api_server: Optional['CustomAPIServer'] = None
         
         # Initialize internal managers
         self._connection_manager = ConnectionManager(self)
@@ -289,7 +293,7 @@ class TgCaller:
         self, 
         host: str = "localhost", 
         port: int = 8080
-    ) -> CustomAPIServer:
+    ) -> 'CustomAPIServer':
         """
         Enable custom HTTP API server
         
@@ -303,6 +307,8 @@ class TgCaller:
         if self._custom_api_server:
             raise ValueError("Custom API server already enabled")
         
+        from .api import CustomAPIServer
+        
         self._custom_api_server = CustomAPIServer(self, host, port)
         
         # Set handler if already registered
@@ -405,8 +411,10 @@ class TgCaller:
         return self._is_connected
     
     @property
-    def media_devices(self) -> MediaDevices:
+    def media_devices(self) -> 'MediaDevices':
         """Get media devices interface"""
+        from .devices import MediaDevices
+        
         return MediaDevices
     
     @property
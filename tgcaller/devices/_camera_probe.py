@@ -0,0 +1,103 @@
+"""
+Camera Enumeration Without Opening Capture Sessions
+"""
+
+import glob
+import logging
+import os
+import re
+import struct
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# struct v4l2_capability: driver[16], card[32], bus_info[32], version,
+# capabilities, device_caps, reserved[3]
+_V4L2_CAPABILITY = struct.Struct('16s32s32sIII12x')
+
+# _IOR('V', 0, struct v4l2_capability)
+VIDIOC_QUERYCAP = (2 << 30) | (_V4L2_CAPABILITY.size << 16) | (ord('V') << 8)
+
+V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+_VIDEO_NODE_RE = re.compile(r'/dev/video(\d+)$')
+
+
+def probe_v4l2() -> Optional[List[Tuple[int, str, Dict[str, Any]]]]:
+    """
+    Enumerate V4L2 capture nodes with a single VIDIOC_QUERYCAP each
+    
+    Returns:
+        List of (index, name, metadata) sorted by index, or None when
+        V4L2 is unavailable and the caller should fall back to opening
+        captures
+    """
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return None
+    
+    nodes = []
+    for path in glob.glob('/dev/video*'):
+        match = _VIDEO_NODE_RE.match(path)
+        if match:
+            nodes.append((int(match.group(1)), path))
+    
+    if not nodes:
+        return None
+    
+    devices = []
+    for index, path in sorted(nodes):
+        try:
+            caps = _query_capability(path)
+        except OSError as e:
+            logger.debug(f"VIDIOC_QUERYCAP failed for {path}: {e}")
+            continue
+        
+        if caps is not None:
+            devices.append((index, caps['card'] or f"Camera {index}", caps))
+    
+    return devices
+
+
+def _query_capability(path: str) -> Optional[Dict[str, Any]]:
+    """Query node capabilities, or None if it is not a video capture node"""
+    fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    
+    try:
+        buf = bytearray(_V4L2_CAPABILITY.size)
+        fcntl.ioctl(fd, VIDIOC_QUERYCAP, buf)
+    finally:
+        os.close(fd)
+    
+    driver, card, bus_info, version, capabilities, device_caps = (
+        _V4L2_CAPABILITY.unpack(buf)
+    )
+    
+    # device_caps describes this node; capabilities covers the whole
+    # physical device, including its metadata nodes
+    if capabilities & V4L2_CAP_DEVICE_CAPS:
+        capabilities = device_caps
+    
+    if not capabilities & V4L2_CAP_VIDEO_CAPTURE:
+        return None
+    
+    return {
+        'backend': 'V4L2',
+        'path': path,
+        'driver': _decode(driver),
+        'card': _decode(card),
+        'bus_info': _decode(bus_info),
+        'version': version,
+        'capabilities': capabilities
+    }
+
+
+def _decode(raw: bytes) -> str:
+    """Decode a NUL-padded C string"""
+    return raw.split(b'\0', 1)[0].decode('utf-8', errors='replace')
@@ -2,11 +2,18 @@
 Device Information Classes
 """
 
+import sys
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+# Enumerated devices are immutable snapshots; slots (Python 3.10+) drop the
+# per-instance __dict__
+_DEVICE_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DEVICE_OPTIONS["slots"] = True
 
-@dataclass
+
+@dataclass(**_DEVICE_OPTIONS)
 class DeviceInfo:
     """Base device information"""
     
@@ -16,7 +23,7 @@ class DeviceInfo:
     name: str
     """Device name"""
     
-    metadata: Dict[str, Any]
+    metadata: Dict[str, Any] = field(hash=False)
     """Additional device metadata"""
     
     is_video: bool = False
@@ -26,40 +33,41 @@ class DeviceInfo:
     """Whether this is the default device"""
 
 
-@dataclass
+@dataclass(**_DEVICE_OPTIONS)
 class InputDevice(DeviceInfo):
     """Audio input device (microphone)"""
     
+    is_video: bool = field(default=False, init=False)
+    """Whether device supports video"""
+    
     channels: int = 1
     """Number of input channels"""
     
     sample_rate: float = 48000.0
     """Default sample rate"""
-    
-    def __post_init__(self):
-        """Set device type"""
-        self.is_video = False
 
 
-@dataclass
+@dataclass(**_DEVICE_OPTIONS)
 class SpeakerDevice(DeviceInfo):
     """Audio output device (speaker)"""
     
+    is_video: bool = field(default=False, init=False)
+    """Whether device supports video"""
+    
     channels: int = 2
     """Number of output channels"""
     
     sample_rate: float = 48000.0
     """Default sample rate"""
-    
-    def __post_init__(self):
-        """Set device type"""
-        self.is_video = False
 
 
-@dataclass
+@dataclass(**_DEVICE_OPTIONS)
 class CameraDevice(DeviceInfo):
     """Video input device (camera)"""
     
+    is_video: bool = field(default=True, init=False)
+    """Whether device supports video"""
+    
     width: int = 640
     """Default video width"""
     
@@ -68,16 +76,15 @@ class CameraDevice(DeviceInfo):
     
     fps: float = 30.0
     """Default frame rate"""
-    
-    def __post_init__(self):
-        """Set device type"""
-        self.is_video = True
 
 
-@dataclass
+@dataclass(**_DEVICE_OPTIONS)
 class ScreenDevice(DeviceInfo):
     """Screen/monitor device"""
     
+    is_video: bool = field(default=True, init=False)
+    """Whether device supports video"""
+    
     width: int = 1920
     """Screen width"""
     
@@ -92,7 +99,3 @@ class ScreenDevice(DeviceInfo):
     
     is_primary: bool = False
     """Whether this is the primary screen"""
-    
-    def __post_init__(self):
-        """Set device type"""
-        self.is_video = True
\ No newline at end of file
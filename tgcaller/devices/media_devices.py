@@ -2,10 +2,15 @@
 Media Devices Detection and Management
 """
 
+import atexit
 import logging
-from typing import List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .device_info import InputDevice, SpeakerDevice, CameraDevice, ScreenDevice
+from ._camera_probe import probe_v4l2
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +34,75 @@ except ImportError:
 class MediaDevices:
     """Media device detection and management"""
     
+    CACHE_TTL: float = 30.0
+    """Seconds an enumeration result is reused before probing again"""
+    
+    MAX_CAMERA_INDEX: int = 10
+    """Number of camera indices probed during enumeration"""
+    
+    _cache: Dict[str, Tuple[float, list]] = {}
+    _pa_instance = None
+    # Held while the shared PyAudio is in use, so a release from another
+    # thread never terminates it mid-probe
+    _pa_lock = threading.RLock()
+    
+    @staticmethod
+    def invalidate_cache(kind: Optional[str] = None) -> None:
+        """
+        Drop cached enumeration results
+        
+        Args:
+            kind: One of "microphone", "speaker", "camera", "screen";
+                clears every kind when omitted
+        """
+        if kind is None:
+            MediaDevices._cache.clear()
+        else:
+            MediaDevices._cache.pop(kind, None)
+        
+        # PortAudio snapshots the device list when initialized, so a fresh
+        # audio enumeration needs a fresh instance
+        if kind in (None, 'microphone', 'speaker'):
+            MediaDevices._release_pa()
+    
+    @staticmethod
+    def _get_pa():
+        """
+        Get the shared PyAudio instance
+        
+        It is kept until invalidate_cache() or interpreter exit; callers
+        hold _pa_lock while using it.
+        """
+        with MediaDevices._pa_lock:
+            if MediaDevices._pa_instance is None:
+                MediaDevices._pa_instance = pyaudio.PyAudio()
+            return MediaDevices._pa_instance
+    
+    @staticmethod
+    def _release_pa() -> None:
+        """Terminate the shared PyAudio instance if one exists"""
+        with MediaDevices._pa_lock:
+            pa = MediaDevices._pa_instance
+            MediaDevices._pa_instance = None
+            
+            if pa is not None:
+                try:
+                    pa.terminate()
+                except Exception as e:
+                    logger.debug(f"Error terminating PyAudio: {e}")
+    
+    @staticmethod
+    def _cached(kind: str, probe: Callable[[], list]) -> list:
+        """Return cached devices for kind, probing when missing or stale"""
+        now = time.monotonic()
+        entry = MediaDevices._cache.get(kind)
+        
+        if entry is None or now - entry[0] >= MediaDevices.CACHE_TTL:
+            entry = (now, probe())
+            MediaDevices._cache[kind] = entry
+        
+        return list(entry[1])
+    
     @staticmethod
     def microphone_devices() -> List[InputDevice]:
         """
@@ -37,6 +111,41 @@ class MediaDevices:
         Returns:
             List of InputDevice objects
         """
+        return MediaDevices._cached('microphone', MediaDevices._probe_microphones)
+    
+    @staticmethod
+    def speaker_devices() -> List[SpeakerDevice]:
+        """
+        Get list of available speaker devices
+        
+        Returns:
+            List of SpeakerDevice objects
+        """
+        return MediaDevices._cached('speaker', MediaDevices._probe_speakers)
+    
+    @staticmethod
+    def camera_devices() -> List[CameraDevice]:
+        """
+        Get list of available camera devices
+        
+        Returns:
+            List of CameraDevice objects
+        """
+        return MediaDevices._cached('camera', MediaDevices._probe_cameras)
+    
+    @staticmethod
+    def screen_devices() -> List[ScreenDevice]:
+        """
+        Get list of available screen devices
+        
+        Returns:
+            List of ScreenDevice objects
+        """
+        return MediaDevices._cached('screen', MediaDevices._probe_screens)
+    
+    @staticmethod
+    def _probe_microphones() -> List[InputDevice]:
+        """Enumerate microphone devices"""
         devices = []
         
         if pyaudio is None:
@@ -44,29 +153,29 @@ class MediaDevices:
             return devices
         
         try:
-            pa = pyaudio.PyAudio()
-            
-            for i in range(pa.get_device_count()):
-                device_info = pa.get_device_info_by_index(i)
+            with MediaDevices._pa_lock:
+                pa = MediaDevices._get_pa()
+                default_index = pa.get_default_input_device_info()['index']
                 
-                # Only input devices
-                if device_info['maxInputChannels'] > 0:
-                    device = InputDevice(
-                        index=i,
-                        name=device_info['name'],
-                        channels=device_info['maxInputChannels'],
-                        sample_rate=device_info['defaultSampleRate'],
-                        is_default=(i == pa.get_default_input_device_info()['index']),
-                        metadata={
-                            'host_api': device_info['hostApi'],
-                            'max_input_channels': device_info['maxInputChannels'],
-                            'default_low_input_latency': device_info['defaultLowInputLatency'],
-                            'default_high_input_latency': device_info['defaultHighInputLatency']
-                        }
-                    )
-                    devices.append(device)
-            
-            pa.terminate()
+                for i in range(pa.get_device_count()):
+                    device_info = pa.get_device_info_by_index(i)
+                    
+                    # Only input devices
+                    if device_info['maxInputChannels'] > 0:
+                        device = InputDevice(
+                            index=i,
+                            name=device_info['name'],
+                            channels=device_info['maxInputChannels'],
+                            sample_rate=device_info['defaultSampleRate'],
+                            is_default=(i == default_index),
+                            metadata={
+                                'host_api': device_info['hostApi'],
+                                'max_input_channels': device_info['maxInputChannels'],
+                                'default_low_input_latency': device_info['defaultLowInputLatency'],
+                                'default_high_input_latency': device_info['defaultHighInputLatency']
+                            }
+                        )
+                        devices.append(device)
             
         except Exception as e:
             logger.error(f"Error detecting microphone devices: {e}")
@@ -74,13 +183,8 @@ class MediaDevices:
         return devices
     
     @staticmethod
-    def speaker_devices() -> List[SpeakerDevice]:
-        """
-        Get list of available speaker devices
-        
-        Returns:
-            List of SpeakerDevice objects
-        """
+    def _probe_speakers() -> List[SpeakerDevice]:
+        """Enumerate speaker devices"""
         devices = []
         
         if pyaudio is None:
@@ -88,29 +192,29 @@ class MediaDevices:
             return devices
         
         try:
-            pa = pyaudio.PyAudio()
-            
-            for i in range(pa.get_device_count()):
-                device_info = pa.get_device_info_by_index(i)
+            with MediaDevices._pa_lock:
+                pa = MediaDevices._get_pa()
+                default_index = pa.get_default_output_device_info()['index']
                 
-                # Only output devices
-                if device_info['maxOutputChannels'] > 0:
-                    device = SpeakerDevice(
-                        index=i,
-                        name=device_info['name'],
-                        channels=device_info['maxOutputChannels'],
-                        sample_rate=device_info['defaultSampleRate'],
-                        is_default=(i == pa.get_default_output_device_info()['index']),
-                        metadata={
-                            'host_api': device_info['hostApi'],
-                            'max_output_channels': device_info['maxOutputChannels'],
-                            'default_low_output_latency': device_info['defaultLowOutputLatency'],
-                            'default_high_output_latency': device_info['defaultHighOutputLatency']
-                        }
-                    )
-                    devices.append(device)
-            
-            pa.terminate()
+                for i in range(pa.get_device_count()):
+                    device_info = pa.get_device_info_by_index(i)
+                    
+                    # Only output devices
+                    if device_info['maxOutputChannels'] > 0:
+                        device = SpeakerDevice(
+                            index=i,
+                            name=device_info['name'],
+                            channels=device_info['maxOutputChannels'],
+                            sample_rate=device_info['defaultSampleRate'],
+                            is_default=(i == default_index),
+                            metadata={
+                                'host_api': device_info['hostApi'],
+                                'max_output_channels': device_info['maxOutputChannels'],
+                                'default_low_output_latency': device_info['defaultLowOutputLatency'],
+                                'default_high_output_latency': device_info['defaultHighOutputLatency']
+                            }
+                        )
+                        devices.append(device)
             
         except Exception as e:
             logger.error(f"Error detecting speaker devices: {e}")
@@ -118,13 +222,8 @@ class MediaDevices:
         return devices
     
     @staticmethod
-    def camera_devices() -> List[CameraDevice]:
-        """
-        Get list of available camera devices
-        
-        Returns:
-            List of CameraDevice objects
-        """
+    def _probe_cameras() -> List[CameraDevice]:
+        """Enumerate camera devices"""
         devices = []
         
         if cv2 is None:
@@ -132,33 +231,40 @@ class MediaDevices:
             return devices
         
         try:
-            # Try to detect cameras (usually 0-9 are checked)
-            for i in range(10):
-                cap = cv2.VideoCapture(i)
-                
-                if cap.isOpened():
-                    # Get camera properties
-                    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                    fps = cap.get(cv2.CAP_PROP_FPS)
-                    
-                    device = CameraDevice(
-                        index=i,
-                        name=f"Camera {i}",
-                        width=width if width > 0 else 640,
-                        height=height if height > 0 else 480,
-                        fps=fps if fps > 0 else 30.0,
-                        is_default=(i == 0),
-                        metadata={
-                            'backend': cap.getBackendName(),
-                            'fourcc': int(cap.get(cv2.CAP_PROP_FOURCC)),
-                            'brightness': cap.get(cv2.CAP_PROP_BRIGHTNESS),
-                            'contrast': cap.get(cv2.CAP_PROP_CONTRAST)
-                        }
+            # Query V4L2 nodes directly where available; this reads driver
+            # metadata without negotiating a capture stream per device
+            nodes = probe_v4l2()
+            if nodes is not None:
+                return [
+                    CameraDevice(
+                        index=index,
+                        name=name,
+                        is_default=(position == 0),
+                        metadata=metadata
                     )
-                    devices.append(device)
+                    for position, (index, name, metadata) in enumerate(nodes)
+                ]
+            
+            # Try to detect cameras (usually 0-9 are checked). Opening a
+            # capture blocks in the driver without holding the GIL, so all
+            # candidate indices are probed concurrently.
+            indices = range(MediaDevices.MAX_CAMERA_INDEX)
+            with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+                futures = [
+                    (index, executor.submit(MediaDevices._probe_camera, index))
+                    for index in indices
+                ]
                 
-                cap.release()
+                # A failing index is skipped without losing the others
+                for index, future in futures:
+                    try:
+                        device = future.result()
+                    except Exception as e:
+                        logger.debug(f"Error probing camera {index}: {e}")
+                        continue
+                    
+                    if device is not None:
+                        devices.append(device)
                 
         except Exception as e:
             logger.error(f"Error detecting camera devices: {e}")
@@ -166,13 +272,39 @@ class MediaDevices:
         return devices
     
     @staticmethod
-    def screen_devices() -> List[ScreenDevice]:
-        """
-        Get list of available screen devices
+    def _probe_camera(index: int) -> Optional[CameraDevice]:
+        """Open camera index and describe it, or None if unavailable"""
+        cap = cv2.VideoCapture(index)
         
-        Returns:
-            List of ScreenDevice objects
-        """
+        try:
+            if not cap.isOpened():
+                return None
+            
+            # Get camera properties
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            
+            return CameraDevice(
+                index=index,
+                name=f"Camera {index}",
+                width=width if width > 0 else 640,
+                height=height if height > 0 else 480,
+                fps=fps if fps > 0 else 30.0,
+                is_default=(index == 0),
+                metadata={
+                    'backend': cap.getBackendName(),
+                    'fourcc': int(cap.get(cv2.CAP_PROP_FOURCC)),
+                    'brightness': cap.get(cv2.CAP_PROP_BRIGHTNESS),
+                    'contrast': cap.get(cv2.CAP_PROP_CONTRAST)
+                }
+            )
+        finally:
+            cap.release()
+    
+    @staticmethod
+    def _probe_screens() -> List[ScreenDevice]:
+        """Enumerate screen devices"""
         devices = []
         
         if mss is None:
@@ -180,26 +312,30 @@ class MediaDevices:
             return devices
         
         try:
+            # mss caches the monitor layout per instance, and screen probes
+            # are already rate-limited by the enumeration cache
             with mss.mss() as sct:
-                for i, monitor in enumerate(sct.monitors):
-                    if i == 0:  # Skip "All in One" monitor
-                        continue
-                    
-                    device = ScreenDevice(
-                        index=i,
-                        name=f"Screen {i}",
-                        width=monitor['width'],
-                        height=monitor['height'],
-                        x=monitor['left'],
-                        y=monitor['top'],
-                        is_primary=(i == 1),  # Usually first real monitor is primary
-                        metadata={
-                            'monitor_info': monitor,
-                            'pixel_ratio': 1.0  # Could be detected from system
-                        }
-                    )
-                    devices.append(device)
-                    
+                monitors = sct.monitors
+            
+            for i, monitor in enumerate(monitors):
+                if i == 0:  # Skip "All in One" monitor
+                    continue
+                
+                device = ScreenDevice(
+                    index=i,
+                    name=f"Screen {i}",
+                    width=monitor['width'],
+                    height=monitor['height'],
+                    x=monitor['left'],
+                    y=monitor['top'],
+                    is_primary=(i == 1),  # Usually first real monitor is primary
+                    metadata={
+                        'monitor_info': monitor,
+                        'pixel_ratio': 1.0  # Could be detected from system
+                    }
+                )
+                devices.append(device)
+                
         except Exception as e:
             logger.error(f"Error detecting screen devices: {e}")
         
@@ -239,4 +375,7 @@ class MediaDevices:
         for device in devices:
             if device.is_primary:
                 return device
-        return devices[0] if devices else None
\ No newline at end of file
+        return devices[0] if devices else None
+
+
+atexit.register(MediaDevices._release_pa)
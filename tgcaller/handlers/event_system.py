@@ -4,18 +4,45 @@ Internal Event Handler System with Filter Support
 
 import asyncio
 import logging
-from typing import List, Callable, Optional, Any, Dict
+from itertools import chain
+from typing import List, Callable, Optional, Any, Dict, Union
 from dataclasses import dataclass
 
+from ..types import CallStatus
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(init=False)
 class HandlerInfo:
-    """Information about registered handler"""
+    """
+    Information about registered handler
+    
+    compiled_filter defaults to filters.compile(). __init__ is written out
+    because __slots__ cannot coexist with a class-level default before
+    dataclass(slots=True) (Python 3.10).
+    """
+    __slots__ = ('func', 'filters', 'priority', 'compiled_filter')
+    
     func: Callable
     filters: Optional['BaseFilter']
     priority: int
+    compiled_filter: Optional[Callable[[Any], bool]]
+    
+    def __init__(
+        self,
+        func: Callable,
+        filters: Optional['BaseFilter'],
+        priority: int,
+        compiled_filter: Optional[Callable[[Any], bool]] = None
+    ):
+        self.func = func
+        self.filters = filters
+        self.priority = priority
+        
+        if compiled_filter is None and filters is not None:
+            compiled_filter = filters.compile()
+        self.compiled_filter = compiled_filter
 
 
 class BaseFilter:
@@ -24,6 +51,16 @@ class BaseFilter:
     async def check(self, update: Any, client: Any) -> bool:
         """Check if filter matches"""
         raise NotImplementedError
+    
+    def compile(self) -> Optional[Callable[[Any], bool]]:
+        """
+        Build a synchronous predicate equivalent to check()
+        
+        Returns:
+            Predicate taking the update, or None if the filter
+            needs the async check() path
+        """
+        return None
 
 
 class ChatFilter(BaseFilter):
@@ -34,6 +71,11 @@ class ChatFilter(BaseFilter):
     
     async def check(self, update: Any, client: Any) -> bool:
         return hasattr(update, 'chat_id') and update.chat_id == self.chat_id
+    
+    def compile(self) -> Callable[[Any], bool]:
+        return lambda update, _chat_id=self.chat_id: (
+            getattr(update, 'chat_id', None) == _chat_id
+        )
 
 
 class UserFilter(BaseFilter):
@@ -44,16 +86,49 @@ class UserFilter(BaseFilter):
     
     async def check(self, update: Any, client: Any) -> bool:
         return hasattr(update, 'user_id') and update.user_id == self.user_id
+    
+    def compile(self) -> Callable[[Any], bool]:
+        return lambda update, _user_id=self.user_id: (
+            getattr(update, 'user_id', None) == _user_id
+        )
 
 
 class StatusFilter(BaseFilter):
     """Filter by status"""
     
-    def __init__(self, status: str):
-        self.status = status
+    def __init__(self, status: Union[str, CallStatus]):
+        self.status = self._resolve(status)
+    
+    @staticmethod
+    def _resolve(status: Union[str, CallStatus]) -> Union[str, CallStatus]:
+        """Resolve a status value or name ("playing"/"PLAYING") to CallStatus"""
+        if isinstance(status, CallStatus):
+            return status
+        try:
+            return CallStatus(status)
+        except ValueError:
+            pass
+        try:
+            return CallStatus[str(status).upper()]
+        except KeyError:
+            return status
     
     async def check(self, update: Any, client: Any) -> bool:
-        return hasattr(update, 'status') and str(update.status) == self.status
+        if not hasattr(update, 'status'):
+            return False
+        if isinstance(self.status, CallStatus):
+            return update.status is self.status
+        return getattr(update.status, 'value', update.status) == self.status
+    
+    def compile(self) -> Callable[[Any], bool]:
+        if isinstance(self.status, CallStatus):
+            return lambda update, _status=self.status: (
+                getattr(update, 'status', None) is _status
+            )
+        return lambda update, _status=self.status: (
+            hasattr(update, 'status') and
+            getattr(update.status, 'value', update.status) == _status
+        )
 
 
 class AndFilter(BaseFilter):
@@ -67,6 +142,14 @@ class AndFilter(BaseFilter):
             if not await filter_obj.check(update, client):
                 return False
         return True
+    
+    def compile(self) -> Optional[Callable[[Any], bool]]:
+        # Cheap chat ID comparisons go first so they short-circuit the rest
+        ordered = sorted(self.filters, key=lambda f: not isinstance(f, ChatFilter))
+        predicates = tuple(f.compile() for f in ordered)
+        if any(p is None for p in predicates):
+            return None
+        return lambda update: all(p(update) for p in predicates)
 
 
 class OrFilter(BaseFilter):
@@ -80,6 +163,16 @@ class OrFilter(BaseFilter):
             if await filter_obj.check(update, client):
                 return True
         return False
+    
+    def compile(self) -> Optional[Callable[[Any], bool]]:
+        if self.filters and all(type(f) is ChatFilter for f in self.filters):
+            chat_ids = frozenset(f.chat_id for f in self.filters)
+            return lambda update: getattr(update, 'chat_id', None) in chat_ids
+        
+        predicates = tuple(f.compile() for f in self.filters)
+        if any(p is None for p in predicates):
+            return None
+        return lambda update: any(p(update) for p in predicates)
 
 
 class Filters:
@@ -96,7 +189,7 @@ class Filters:
         return UserFilter(user_id)
     
     @staticmethod
-    def status(status: str) -> StatusFilter:
+    def status(status: Union[str, CallStatus]) -> StatusFilter:
         """Filter by status"""
         return StatusFilter(status)
 
@@ -116,9 +209,20 @@ class EventHandlerSystem:
     
     def __init__(self):
         """Initialize event handler system"""
-        self.handlers: List[HandlerInfo] = []
+        self._buckets: Dict[int, List[HandlerInfo]] = {}
+        self._sorted_view: Optional[List[HandlerInfo]] = None
         self.logger = logger
     
+    @property
+    def handlers(self) -> List[HandlerInfo]:
+        """Registered handlers, highest priority first"""
+        if self._sorted_view is None:
+            self._sorted_view = list(chain.from_iterable(
+                self._buckets[priority]
+                for priority in sorted(self._buckets, reverse=True)
+            ))
+        return self._sorted_view
+    
     def add_handler(
         self,
         func: Callable,
@@ -142,16 +246,9 @@ class EventHandlerSystem:
             priority=priority
         )
         
-        # Insert in priority order (highest first)
-        inserted = False
-        for i, existing in enumerate(self.handlers):
-            if priority > existing.priority:
-                self.handlers.insert(i, handler_info)
-                inserted = True
-                break
-        
-        if not inserted:
-            self.handlers.append(handler_info)
+        # Bucket by priority; order is rebuilt lazily on next dispatch
+        self._buckets.setdefault(priority, []).append(handler_info)
+        self._sorted_view = None
         
         self.logger.debug(f"Added handler {func.__name__} with priority {priority}")
     
@@ -165,9 +262,13 @@ class EventHandlerSystem:
         Returns:
             True if handler was removed
         """
-        for i, handler_info in enumerate(self.handlers):
+        for handler_info in self.handlers:
             if handler_info.func == func:
-                del self.handlers[i]
+                bucket = self._buckets[handler_info.priority]
+                bucket.remove(handler_info)
+                if not bucket:
+                    del self._buckets[handler_info.priority]
+                self._sorted_view = None
                 self.logger.debug(f"Removed handler {func.__name__}")
                 return True
         
@@ -181,23 +282,44 @@ class EventHandlerSystem:
             update: Event update object
             client: Client instance
         """
+        iscoroutine = asyncio.iscoroutine
+        pending = []
+        
         for handler_info in self.handlers:
             try:
                 # Check filter if present
-                if handler_info.filters:
+                if handler_info.compiled_filter:
+                    if not handler_info.compiled_filter(update):
+                        continue
+                elif handler_info.filters:
                     if not await handler_info.filters.check(update, client):
                         continue
                 
-                # Call handler
-                if asyncio.iscoroutinefunction(handler_info.func):
-                    await handler_info.func(client, update)
-                else:
-                    handler_info.func(client, update)
+                # Call handler; sync handlers complete inline, coroutines
+                # are awaited together below
+                result = handler_info.func(client, update)
+                if iscoroutine(result):
+                    pending.append((handler_info, result))
                     
             except Exception as e:
-                self.logger.error(
-                    f"Error in handler {handler_info.func.__name__}: {e}"
-                )
+                self._log_handler_error(handler_info, e)
+        
+        if not pending:
+            return
+        
+        results = await asyncio.gather(
+            *(coro for _, coro in pending),
+            return_exceptions=True
+        )
+        for (handler_info, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                self._log_handler_error(handler_info, result)
+    
+    def _log_handler_error(self, handler_info: HandlerInfo, error: Exception):
+        """Log an exception raised by a handler"""
+        self.logger.error(
+            f"Error in handler {handler_info.func.__name__}: {error}"
+        )
     
     def get_handlers_count(self) -> int:
         """Get number of registered handlers"""
@@ -205,5 +327,6 @@ class EventHandlerSystem:
     
     def clear_handlers(self):
         """Clear all handlers"""
-        self.handlers.clear()
+        self._buckets.clear()
+        self._sorted_view = None
         self.logger.debug("Cleared all handlers")
\ No newline at end of file
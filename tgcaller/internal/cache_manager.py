@@ -5,6 +5,7 @@ Cache Management - Handle caching for performance optimization
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Set
 from dataclasses import dataclass
 
@@ -22,7 +23,7 @@ class CacheEntry:
     @property
     def is_expired(self) -> bool:
         """Check if cache entry is expired"""
-        return time.time() - self.timestamp > self.ttl
+        return time.monotonic() - self.timestamp > self.ttl
     
     def access(self):
         """Mark cache entry as accessed"""
@@ -33,7 +34,8 @@ class CacheManager:
     """Manage caching for TgCaller operations"""
     
     def __init__(self, max_size: int = 1000, default_ttl: float = 300.0):
-        self.cache: Dict[str, CacheEntry] = {}
+        # Ordered oldest-to-newest access so LRU eviction is popitem(last=False)
+        self.cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.logger = logger
@@ -52,22 +54,28 @@ class CacheManager:
         self.call_configs: Dict[int, Any] = {}
         self.stream_sources: Dict[int, Dict[str, Any]] = {}
         
-        # Start cleanup task
-        self.cleanup_task = asyncio.create_task(self._cleanup_loop())
+        # Start cleanup task; expiry is also checked on access, so the
+        # periodic sweep is skipped when constructed outside an event loop
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        self.cleanup_task = loop.create_task(self._cleanup_loop()) if loop else None
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get value from cache"""
-        if key not in self.cache:
+        try:
+            entry = self.cache[key]
+        except KeyError:
             self.misses += 1
             return default
         
-        entry = self.cache[key]
-        
         if entry.is_expired:
             del self.cache[key]
             self.misses += 1
             return default
         
+        self.cache.move_to_end(key)
         entry.access()
         self.hits += 1
         return entry.data
@@ -77,13 +85,15 @@ class CacheManager:
         if ttl is None:
             ttl = self.default_ttl
         
-        # Check if we need to evict entries
-        if len(self.cache) >= self.max_size:
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            # Check if we need to evict entries
             self._evict_lru()
         
         self.cache[key] = CacheEntry(
             data=value,
-            timestamp=time.time(),
+            timestamp=time.monotonic(),
             ttl=ttl
         )
     
@@ -108,13 +118,7 @@ class CacheManager:
         if not self.cache:
             return
         
-        # Find entry with lowest access count and oldest timestamp
-        lru_key = min(
-            self.cache.keys(),
-            key=lambda k: (self.cache[k].access_count, self.cache[k].timestamp)
-        )
-        
-        del self.cache[lru_key]
+        self.cache.popitem(last=False)
         self.evictions += 1
     
     async def _cleanup_loop(self):
@@ -4,8 +4,9 @@ Retry Manager - Handle operation retries with exponential backoff
 
 import asyncio
 import logging
-from typing import Dict, Callable, Any, Optional
-from dataclasses import dataclass
+import random
+from typing import Dict, Callable, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,28 @@ class RetryConfig:
     strategy: RetryStrategy = RetryStrategy.EXPONENTIAL
     backoff_factor: float = 2.0
     jitter: bool = True
+    _delays: Tuple[float, ...] = field(default=(), init=False, repr=False, compare=False)
+    _delays_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def delays(self) -> Tuple[float, ...]:
+        """Capped per-attempt delays before jitter, rebuilt when the fields above change"""
+        key = (self.max_attempts, self.base_delay, self.max_delay, self.strategy, self.backoff_factor)
+        if key != self._delays_key:
+            self._delays = tuple(
+                min(self._base_delay_for(attempt), self.max_delay)
+                for attempt in range(max(self.max_attempts, 0))
+            )
+            self._delays_key = key
+        return self._delays
+    
+    def _base_delay_for(self, attempt: int) -> float:
+        """Uncapped delay for attempt according to strategy"""
+        if self.strategy == RetryStrategy.LINEAR:
+            return self.base_delay * (attempt + 1)
+        if self.strategy == RetryStrategy.EXPONENTIAL:
+            return self.base_delay * (self.backoff_factor ** attempt)
+        return self.base_delay
 
 
 class RetryManager:
@@ -107,23 +130,12 @@ class RetryManager:
     
     def _calculate_delay(self, attempt: int, config: RetryConfig) -> float:
         """Calculate delay for retry attempt"""
-        if config.strategy == RetryStrategy.FIXED:
-            delay = config.base_delay
-        elif config.strategy == RetryStrategy.LINEAR:
-            delay = config.base_delay * (attempt + 1)
-        elif config.strategy == RetryStrategy.EXPONENTIAL:
-            delay = config.base_delay * (config.backoff_factor ** attempt)
-        else:
-            delay = config.base_delay
-        
-        # Apply maximum delay limit
-        delay = min(delay, config.max_delay)
+        delay = config.delays[attempt]
         
-        # Add jitter to prevent thundering herd
+        # Add jitter to prevent thundering herd; sampled per retry so that
+        # operations sharing a config do not back off in lockstep
         if config.jitter:
-            import random
-            jitter_factor = random.uniform(0.8, 1.2)
-            delay *= jitter_factor
+            delay *= random.uniform(0.8, 1.2)
         
         return delay
     
@@ -2,9 +2,10 @@
 Stream Type Enumeration
 """
 
-from enum import Enum
+from enum import Enum, unique
 
 
+@unique
 class StreamType(Enum):
     """Stream type enumeration for different media types"""
     
@@ -36,35 +37,45 @@ class StreamType(Enum):
         """String representation"""
         return self.value
     
-    @property
-    def has_audio(self) -> bool:
-        """Check if stream type includes audio"""
-        return self in [
-            StreamType.AUDIO,
-            StreamType.VIDEO,
-            StreamType.MICROPHONE,
-            StreamType.MIXED,
-            StreamType.RAW,
-            StreamType.PIPED
-        ]
+    # Capability flags are plain member attributes, assigned below once
+    # the capability sets exist, so reads skip the descriptor protocol
+    has_audio: bool
+    """Whether stream type includes audio"""
     
-    @property
-    def has_video(self) -> bool:
-        """Check if stream type includes video"""
-        return self in [
-            StreamType.VIDEO,
-            StreamType.SCREEN,
-            StreamType.CAMERA,
-            StreamType.MIXED,
-            StreamType.RAW,
-            StreamType.PIPED
-        ]
+    has_video: bool
+    """Whether stream type includes video"""
     
-    @property
-    def is_live(self) -> bool:
-        """Check if stream type is live input"""
-        return self in [
-            StreamType.MICROPHONE,
-            StreamType.CAMERA,
-            StreamType.SCREEN
-        ]
\ No newline at end of file
+    is_live: bool
+    """Whether stream type is live input"""
+
+
+_AUDIO_TYPES = frozenset({
+    StreamType.AUDIO,
+    StreamType.VIDEO,
+    StreamType.MICROPHONE,
+    StreamType.MIXED,
+    StreamType.RAW,
+    StreamType.PIPED
+})
+
+_VIDEO_TYPES = frozenset({
+    StreamType.VIDEO,
+    StreamType.SCREEN,
+    StreamType.CAMERA,
+    StreamType.MIXED,
+    StreamType.RAW,
+    StreamType.PIPED
+})
+
+_LIVE_TYPES = frozenset({
+    StreamType.MICROPHONE,
+    StreamType.CAMERA,
+    StreamType.SCREEN
+})
+
+for _member in StreamType:
+    _member.has_audio = _member in _AUDIO_TYPES
+    _member.has_video = _member in _VIDEO_TYPES
+    _member.is_live = _member in _LIVE_TYPES
+
+del _member
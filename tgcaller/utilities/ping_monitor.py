@@ -4,6 +4,7 @@ Network Ping Monitoring
 
 import asyncio
 import logging
+import re
 import time
 import subprocess
 import platform
@@ -12,6 +13,11 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Windows: "time=1ms" or "time<1ms"
+_WINDOWS_LATENCY_RE = re.compile(r'time[<=](\d+)ms')
+# Unix: "time=1.234 ms"
+_UNIX_LATENCY_RE = re.compile(r'time=([0-9.]+)\s*ms')
+
 
 @dataclass
 class PingResult:
@@ -198,17 +204,12 @@ class PingMonitor:
             system = platform.system().lower()
             
             if system == "windows":
-                # Windows: "time=1ms" or "time<1ms"
-                import re
-                match = re.search(r'time[<=](\d+)ms', output)
-                if match:
-                    return float(match.group(1))
+                match = _WINDOWS_LATENCY_RE.search(output)
             else:
-                # Unix: "time=1.234 ms"
-                import re
-                match = re.search(r'time=([0-9.]+)\s*ms', output)
-                if match:
-                    return float(match.group(1))
+                match = _UNIX_LATENCY_RE.search(output)
+            
+            if match:
+                return float(match.group(1))
             
             return None
             